@@ -0,0 +1,76 @@
+"""Vazão do NotionClient contra o MockNotion: consulta paginada, 429 e escrita em lote.
+
+Uso: pytest benchmarks/bench_client.py --benchmark-only
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from notion_alchemy.client import NotionClient
+from notion_alchemy.schema import SchemaRegistry
+from notion_alchemy.testing import MockNotion
+
+ROWS = 2000
+
+
+def montar(mock: MockNotion) -> NotionClient:
+    # rate limit alto: mede o cliente, não o limite de 3 req/s do Notion
+    client = NotionClient("secret", rate_limit=100_000, burst=100_000, registry=SchemaRegistry())
+    mock.mount(client)
+    return client
+
+
+@pytest.fixture
+def mock():
+    mock = MockNotion()
+    mock.add_database("database", rows=ROWS)
+    return mock
+
+
+def test_query_database(benchmark, mock):
+    client = montar(mock)
+    model_class = client.database_model("database")
+
+    def consultar():
+        model = model_class()
+        client.query_database(model)
+        return model
+
+    model = benchmark(consultar)
+    assert len(model._properties_data["page_id"]) == ROWS
+
+
+def test_query_database_com_429(benchmark, mock):
+    mock.rate_limit_every = 5
+    client = montar(mock)
+    model_class = client.database_model("database")
+
+    benchmark(lambda: client.query_database(model_class()))
+    assert mock.rate_limited > 0
+
+
+def test_iter_query_pages_filtrado(benchmark, mock):
+    client = montar(mock)
+    model = client.database_model("database")()
+
+    def consultar():
+        return sum(len(data["results"]) for data in client.iter_query_pages("database", model.done.equals(True)))
+
+    assert benchmark(consultar) == ROWS // 2
+
+
+@pytest.mark.parametrize("latency", [0.0, 0.005])
+def test_update_pages(benchmark, mock, latency):
+    mock.latency = latency
+    client = montar(mock)
+    model = client.database_model("database")()
+    client.query_database(model, keep_pages=True)
+    linhas = model._properties_pages[:200]
+
+    def sujar():
+        for linha in linhas:
+            linha.score = (linha.score or 0) + 1
+        return (linhas,), {"max_workers": 8}
+
+    result = benchmark.pedantic(client.update_pages, setup=sujar, rounds=5)
+    assert len(result.succeeded) == len(linhas)
@@ -0,0 +1,88 @@
+"""Decodificação sem rede: JSON, parse por tipo de propriedade, populate e to_pandas.
+
+Uso: pytest benchmarks/bench_decode.py --benchmark-only
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from notion_alchemy.decoder import ColumnDecoder
+from notion_alchemy.jsonlib import dumps, loads
+from notion_alchemy.schema import compile_model
+from notion_alchemy.testing import DEFAULT_COLUMNS, synthetic_database, synthetic_page
+
+ROWS = 5000
+
+
+@pytest.fixture(scope="module")
+def pages():
+    return [synthetic_page(i) for i in range(ROWS)]
+
+
+@pytest.fixture(scope="module")
+def model_class():
+    return compile_model(synthetic_database())
+
+
+def test_loads_resposta_da_query(benchmark, pages):
+    content = dumps({"object": "list", "results": pages[:100], "has_more": True, "next_cursor": "0:100"}).encode()
+    assert len(benchmark(loads, content)["results"]) == 100
+
+
+@pytest.mark.parametrize("name", list(DEFAULT_COLUMNS))
+def test_decode_por_tipo(benchmark, pages, name):
+    decoder = ColumnDecoder({name: DEFAULT_COLUMNS[name]})
+
+    def decodificar():
+        columns = decoder.new_columns()
+        decoder.decode(pages, columns)
+        return columns
+
+    assert len(benchmark(decodificar)[name]) == ROWS
+
+
+def test_populate(benchmark, pages, model_class):
+    def popular():
+        model = model_class()
+        model.populate({"results": pages})
+        return model
+
+    assert len(benchmark(popular)._properties_data["page_id"]) == ROWS
+
+
+def test_populate_com_rows(benchmark, pages, model_class):
+    def popular():
+        model = model_class()
+        model.populate({"results": pages}, keep_pages=True)
+        return model
+
+    assert len(benchmark(popular)._properties_pages) == ROWS
+
+
+@pytest.mark.parametrize("typed", [False, True])
+def test_to_pandas(benchmark, pages, model_class, typed):
+    pytest.importorskip("pandas")
+    model = model_class()
+    model.populate({"results": pages})
+
+    assert len(benchmark(model.to_pandas, typed=typed)) == ROWS
+
+
+
+@pytest.mark.parametrize("workers", [None, 2, 4])
+def test_populate_paralelo(benchmark, model_class, workers):
+    """Corpos crus (como iter_query_content): com workers o loads e o decode vão para os processos.
+
+    Compare a média de workers=None com 2 e 4 numa máquina com pelo menos 4 núcleos.
+    """
+    pages = [synthetic_page(i) for i in range(50_000)]
+    bodies = [dumps({"object": "list", "results": pages[i:i + 100]}).encode() for i in range(0, len(pages), 100)]
+    del pages
+
+    def popular():
+        model = model_class()
+        model.populate(bodies, workers=workers)
+        return model
+
+    result = benchmark.pedantic(popular, rounds=3, iterations=1)
+    assert len(result._properties_data["page_id"]) == 50_000
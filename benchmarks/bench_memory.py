@@ -0,0 +1,52 @@
+"""Memória residente por linha: NotionDatabaseModel por página vs. Row compacta.
+
+Uso: python benchmarks/bench_memory.py [linhas]
+"""
+import gc
+import sys
+import tracemalloc
+
+from notion_alchemy.models import NotionDatabaseModel
+from notion_alchemy.testing import synthetic_database, synthetic_page
+
+COLUMNS = {
+    "Name": "title",
+    "Notes": "rich_text",
+    "Score": "number",
+    "Done": "checkbox",
+    "Stage": "select",
+    "Tags": "multi_select",
+    "When": "date",
+    "Status": "status",
+}
+
+
+def measure(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current
+
+
+def main(rows: int) -> None:
+    pages = [synthetic_page(i, columns=COLUMNS) for i in range(rows)]
+
+    def per_page_models():
+        return [NotionDatabaseModel.from_notion(page) for page in pages]
+
+    def compact_rows():
+        model = NotionDatabaseModel.from_notion(synthetic_database(columns=COLUMNS))
+        model.populate({"results": pages}, keep_pages=True)
+        return model
+
+    for label, build in (("NotionDatabaseModel por página", per_page_models), ("Row compacta + colunas", compact_rows)):
+        size = measure(build)
+        print(f"{label:32s} {size / rows:10.0f} bytes/linha")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
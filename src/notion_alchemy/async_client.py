@@ -0,0 +1,239 @@
+import asyncio
+import functools
+import time
+import requests
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterable, List, Type, Union
+from notion_alchemy.client import NotionClient
+from notion_alchemy.models import NotionModel, NotionDatabaseModel
+from notion_alchemy.notion import NotionProperty
+from notion_alchemy.transport import NOTION_RATE_LIMIT, TokenBucket
+from notion_alchemy.cache import TTLCache
+from notion_alchemy.schema import SchemaRegistry
+from notion_alchemy.instrumentation import Instrumentation, RequestEvent, response_event
+
+
+class AsyncNotionClient:
+    """asyncio counterpart of NotionClient.
+
+    As chamadas HTTP rodam num ThreadPoolExecutor próprio, sobre a sessão com
+    pool de conexões do NotionClient; a concorrência é limitada por um semáforo e o ritmo pelo
+    TokenBucket, que pode ser compartilhado com outros clientes do mesmo token.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        concurrency: int = 8,
+        timeout: float = 30.0,
+        max_retries: int = 5,
+        rate_limit: float = NOTION_RATE_LIMIT,
+        burst: float = None,
+        rate_limiter: TokenBucket = None,
+        cache: TTLCache = None,
+        registry: SchemaRegistry = None,
+        instrumentation: Instrumentation = None,
+    ):
+        self._client = NotionClient(
+            api_key,
+            timeout=timeout,
+            max_retries=max_retries,
+            rate_limit=rate_limit,
+            burst=burst,
+            pool_size=concurrency,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            registry=registry,
+            instrumentation=instrumentation,
+        )
+        self.instrumentation = instrumentation
+        self.rate_limiter = self._client.rate_limiter
+        self.retry_policy = self._client.retry_policy
+        self._semaphore = asyncio.Semaphore(concurrency)
+        # pool próprio: o executor padrão do asyncio pode ter menos threads que `concurrency`
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="notion")
+
+    async def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        self._client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _request(self, method: str, path: str, idempotent: bool = True, **kwargs) -> requests.Response:
+        """Same retry/rate-limit rules as NotionClient._request, waiting with asyncio.sleep"""
+        url = f"{self._client.base_url}/{path}"
+        kwargs.setdefault("timeout", self._client.timeout)
+        attempt = 0
+        hooks = self.instrumentation
+
+        while True:
+            async with self._semaphore:
+                wait = self.rate_limiter.reserve()
+                if wait > 0:
+                    if hooks is not None:
+                        hooks.on_throttle(wait, "rate_limit")
+                    await asyncio.sleep(wait)
+                start, started = time.time(), time.perf_counter()
+                try:
+                    send = functools.partial(self._client.session.request, method, url, **kwargs)
+                    response = await asyncio.get_running_loop().run_in_executor(self._executor, send)
+                except (requests.ConnectionError, requests.Timeout) as error:
+                    if hooks is not None:
+                        hooks.on_request(RequestEvent(method, path, None, time.perf_counter() - started, attempt=attempt, error=type(error).__name__, start=start))
+                    if not idempotent or attempt >= self.retry_policy.max_retries:
+                        raise
+                    response = None
+
+            if response is None:
+                await self._backoff(self.retry_policy.backoff(attempt))
+                attempt += 1
+                continue
+
+            if hooks is not None:
+                hooks.on_request(response_event(method, path, response, attempt, start, time.perf_counter() - started))
+
+            if self.retry_policy.should_retry(response, attempt, idempotent):
+                delay = self.retry_policy.delay(response, attempt)
+                if response.status_code == 429:
+                    self.rate_limiter.penalize(delay)
+                else:
+                    await self._backoff(delay)
+                attempt += 1
+                continue
+
+            response.raise_for_status()
+            self._client._invalidate(method, path)
+            return response
+
+    async def _backoff(self, delay: float) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.on_throttle(delay, "backoff")
+        await asyncio.sleep(delay)
+
+    async def _cached_get(self, kind: str, resource_id: str, path: str) -> Dict:
+        cache = self._client.cache
+        if cache is not None:
+            content = cache.get(kind, resource_id)
+            if content is not None:
+                return self._client._loads(content)
+
+        response = await self._request("GET", path)
+        if cache is not None:
+            cache.set(kind, resource_id, response.content)
+        return self._client._loads(response.content)
+
+    async def get_page(self, page_id: str) -> Dict:
+        """Get raw page data from Notion"""
+        return await self._cached_get("page", page_id, f"pages/{page_id}")
+
+    async def get_database(self, database_id: str) -> Dict:
+        """Get raw database data from Notion"""
+        return await self._cached_get("database", database_id, f"databases/{database_id}")
+
+    async def database_model(self, database_id: str) -> Type[NotionDatabaseModel]:
+        """Model class compiled from the database schema (see NotionClient.database_model)"""
+        return self._client.registry.model_for(await self.get_database(database_id))
+
+    async def get_pages(self, page_ids: Iterable[str], return_exceptions: bool = False) -> List[Any]:
+        """Fetch many pages concurrently, results in the same order as page_ids"""
+        return await asyncio.gather(
+            *(self.get_page(page_id) for page_id in page_ids),
+            return_exceptions=return_exceptions,
+        )
+
+    async def iter_query_pages(
+        self,
+        database_id: str,
+        filters: Union[dict, List[dict]] = None,
+        page_size: int = 100,
+        sorts: List[dict] = None,
+        filter_properties: List[Union[str, NotionProperty]] = None,
+    ) -> AsyncIterator[Dict]:
+        """Yield raw query result pages, following next_cursor until has_more is False"""
+        if not 1 <= page_size <= 100:
+            raise ValueError("page_size must be between 1 and 100")
+
+        path = f"databases/{database_id}/query"
+        query = self._client._build_query_payload(filters, sorts)
+        query["page_size"] = page_size
+        params = self._client._query_params(filter_properties)
+
+        while True:
+            response = await self._request("POST", path, params=params, json=query)
+            data = self._client._loads(response.content)
+            yield data
+
+            if not data.get("has_more") or not data.get("next_cursor"):
+                break
+            query["start_cursor"] = data["next_cursor"]
+
+    async def query_database(
+        self,
+        model_class: Type[NotionDatabaseModel],
+        filters: Union[dict, List[dict]] = None,
+        page_size: int = 100,
+        keep_pages: bool = False,
+        sorts: List[dict] = None,
+        filter_properties: List[Union[str, NotionProperty]] = None,
+        expand_relations: Union[bool, List[str]] = False,
+    ) -> str:
+        """Query database with optional filters/sorts, populating the model page by page"""
+        if not model_class._database_id:
+            raise ValueError("Model class must define _database_id")
+
+        page_init_value = len(model_class._properties_data['page_id'])
+        async for data in self.iter_query_pages(model_class._database_id, filters, page_size, sorts, filter_properties):
+            model_class.populate(response=data, keep_pages=keep_pages, instrumentation=self.instrumentation)
+        if expand_relations:
+            await self.expand_relations(model_class, None if expand_relations is True else expand_relations)
+
+        return f'o database foi populado com sucesso, contém {len(model_class._properties_data["page_id"]) - page_init_value} páginas.'
+
+    async def expand_relations(self, model: NotionDatabaseModel, names: List[str] = None) -> Dict[str, BaseException]:
+        """Resolve relation columns with one concurrent get_page per distinct page; returns the failures"""
+        page_ids = model.relation_ids(names)
+        results = await self.get_pages(page_ids, return_exceptions=True)
+        pages = {page_id: page for page_id, page in zip(page_ids, results) if not isinstance(page, BaseException)}
+        model.attach_relations(pages, names)
+        return {page_id: error for page_id, error in zip(page_ids, results) if isinstance(error, BaseException)}
+
+    async def create_page(self, model: NotionModel) -> NotionModel:
+        """Create new page from model"""
+        if not model._database_id:
+            raise ValueError("Model must have _database_id set")
+
+        payload = {
+            "parent": {"database_id": model._database_id},
+            "properties": model.to_notion_properties()
+        }
+
+        response = await self._request("POST", "pages", idempotent=False, json=payload)
+        return model.__class__.from_notion(self._client._loads(response.content))
+
+    async def update_page(self, model: NotionModel) -> NotionModel:
+        """Update existing page"""
+        if not model.id:
+            raise ValueError("Model must have an id to update")
+
+        properties = model.to_notion_properties(only_dirty=True)
+        if not properties:
+            return model
+
+        payload = {
+            "properties": properties
+        }
+
+        response = await self._request("PATCH", f"pages/{model.id}", json=payload)
+        return model.__class__.from_notion(self._client._loads(response.content))
+
+    async def update_pages(self, models: Iterable[NotionModel], return_exceptions: bool = False) -> List[Any]:
+        """Update many pages concurrently, results in the same order as models"""
+        return await asyncio.gather(
+            *(self.update_page(model) for model in models),
+            return_exceptions=return_exceptions,
+        )
@@ -0,0 +1,97 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set, Tuple
+
+
+@dataclass
+class BlockCheckpoint:
+    """Estado de um walk_blocks: blocos que ainda faltam buscar (id -> profundidade) e os já buscados.
+
+    É atualizado enquanto os blocos são entregues; to_dict() pode ser salvo (ex: em JSON)
+    e from_dict() retoma o percurso de onde parou.
+    """
+    pending: Dict[str, int] = field(default_factory=dict)
+    done: Set[str] = field(default_factory=set)
+
+    @property
+    def finished(self) -> bool:
+        return not self.pending
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"pending": dict(self.pending), "done": sorted(self.done)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BlockCheckpoint":
+        return cls(pending=dict(data.get("pending", {})), done=set(data.get("done", ())))
+
+
+def _should_expand(block: Dict, follow_child_pages: bool) -> bool:
+    if not block.get("has_children"):
+        return False
+    # child_page é outra página: só entra nela se pedido
+    return follow_child_pages or block.get("type") != "child_page"
+
+
+def walk_blocks(
+    fetch_children: Callable[[str], List[Dict]],
+    root_ids: Iterable[str],
+    max_workers: int = 4,
+    max_depth: int = None,
+    checkpoint: BlockCheckpoint = None,
+    follow_child_pages: bool = False,
+) -> Iterator[Dict]:
+    """Yield every block under `root_ids`, breadth-first, fetching children on a worker pool.
+
+    `fetch_children(block_id)` devolve todos os filhos diretos de um bloco (já paginados).
+    Até `max_workers` blocos são buscados ao mesmo tempo e os filhos de cada um são
+    entregues assim que chegam, então a ordem é por nível mas não é fixa dentro dele.
+    `max_depth=1` traz só os filhos das raízes.
+
+    Um bloco só sai de `checkpoint.pending` depois que todos os seus filhos foram
+    entregues: ao retomar com o mesmo checkpoint, nada se perde, mas os filhos do
+    bloco que estava sendo entregue podem vir de novo.
+    """
+    checkpoint = checkpoint if checkpoint is not None else BlockCheckpoint()
+    for root_id in root_ids:
+        if root_id not in checkpoint.done:
+            checkpoint.pending.setdefault(root_id, 0)
+
+    queue = deque(checkpoint.pending.items())
+    running: Dict[Future, Tuple[str, int]] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="notion-blocks") as executor:
+
+        def fill() -> None:
+            while queue and len(running) < max_workers:
+                block_id, depth = queue.popleft()
+                running[executor.submit(fetch_children, block_id)] = (block_id, depth)
+
+        try:
+            fill()
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    block_id, depth = running.pop(future)
+                    children = future.result()
+
+                    if max_depth is None or depth + 1 < max_depth:
+                        for block in children:
+                            child_id = block.get("id")
+                            if (
+                                child_id
+                                and _should_expand(block, follow_child_pages)
+                                and child_id not in checkpoint.done
+                                and child_id not in checkpoint.pending
+                            ):
+                                checkpoint.pending[child_id] = depth + 1
+                                queue.append((child_id, depth + 1))
+                    # os workers seguem buscando o próximo nível enquanto quem consome processa este
+                    fill()
+
+                    yield from children
+                    del checkpoint.pending[block_id]
+                    checkpoint.done.add(block_id)
+        finally:
+            for future in running:
+                future.cancel()
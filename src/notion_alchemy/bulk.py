@@ -0,0 +1,69 @@
+import threading
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Callable, Iterable, List, Optional
+
+
+@dataclass
+class BulkFailure:
+    item: Any
+    error: Exception
+
+
+@dataclass
+class BulkResult:
+    """Resultado de uma operação em lote: ids que deram certo, falhas e retries"""
+    succeeded: List[str] = field(default_factory=list)
+    failed: List[BulkFailure] = field(default_factory=list)
+    skipped: List[Any] = field(default_factory=list)
+    retries: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def add_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+
+def run_bulk(
+    func: Callable[[Any, BulkResult], Optional[str]],
+    items: Iterable[Any],
+    max_workers: int = 4,
+    batch_size: int = 100,
+) -> BulkResult:
+    """Run `func(item, result)` for every item on a worker pool.
+
+    Os itens são consumidos em lotes de `batch_size`, então um iterável
+    grande (ou um gerador) não vira dezenas de milhares de futures em
+    memória. `func` devolve o id da página escrita, ou None quando não havia
+    nada a fazer; exceções viram BulkFailure e não interrompem o lote.
+    """
+    result = BulkResult()
+    items = iter(items)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="notion-bulk") as executor:
+        while True:
+            batch = list(islice(items, batch_size))
+            if not batch:
+                break
+
+            futures = {executor.submit(func, item, result): item for item in batch}
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    page_id = future.result()
+                except Exception as error:
+                    result.failed.append(BulkFailure(item=item, error=error))
+                    continue
+
+                if page_id is None:
+                    result.skipped.append(item)
+                else:
+                    result.succeeded.append(page_id)
+
+    return result
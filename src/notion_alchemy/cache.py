@@ -0,0 +1,94 @@
+import threading
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from notion_alchemy.notion import normalize_id
+
+# TTL padrão em segundos por tipo de recurso: schema muda pouco, páginas mudam mais
+DEFAULT_TTLS = {"page": 60.0, "database": 300.0}
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TTLCache:
+    """In-process LRU cache with per-resource TTLs and a memory budget.
+
+    Guarda o corpo bruto (bytes) das respostas: o tamanho de cada entrada é
+    exato e quem lê recebe um dict novo, então ninguém altera o cache sem querer.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttls: Dict[str, float] = None):
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    @staticmethod
+    def _key(kind: str, resource_id: str) -> Tuple[str, str]:
+        return kind, normalize_id(resource_id)
+
+    def get(self, kind: str, resource_id: str) -> Optional[bytes]:
+        key = self._key(kind, resource_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def set(self, kind: str, resource_id: str, content: bytes) -> None:
+        ttl = self.ttls.get(kind)
+        if not ttl or len(content) > self.max_bytes:
+            return
+        key = self._key(kind, resource_id)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, content)
+            self._bytes += len(content)
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+            self._update_stats()
+
+    def invalidate(self, kind: str, resource_id: str) -> None:
+        key = self._key(kind, resource_id)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._update_stats()
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        _, content = self._entries.pop(key)
+        self._bytes -= len(content)
+        self._update_stats()
+
+    def _update_stats(self) -> None:
+        self.stats.entries = len(self._entries)
+        self.stats.bytes = self._bytes
@@ -1,71 +1,444 @@
 import requests
 import datetime
 import json
+import time
 
-from typing import Dict,Type, List, Any
+from requests.adapters import HTTPAdapter
+
+from typing import Dict,Type, List, Any, Iterator, Iterable, Callable, Optional, Tuple, Union
+from notion_alchemy.blocks import BlockCheckpoint, walk_blocks
+from notion_alchemy.bulk import BulkResult, run_bulk
+from notion_alchemy.storage import PageStore
+from notion_alchemy.cache import TTLCache
+from notion_alchemy.export import export_pages, open_writer
+from notion_alchemy.instrumentation import DecodeEvent, Instrumentation, RequestEvent, response_event
+from notion_alchemy.jsonlib import loads, next_cursor
 from notion_alchemy.models import NotionModel, NotionDatabaseModel
-from notion_alchemy.notion import NotionProperty
+from notion_alchemy.relations import RelationResolver
+from notion_alchemy.schema import SchemaRegistry, default_registry
+from notion_alchemy.rows import Row
+from notion_alchemy.notion import NotionProperty, filter_depth, sort_by_timestamp, timestamp_filter
+from notion_alchemy.transport import NOTION_RATE_LIMIT, RetryPolicy, TokenBucket
+from notion_alchemy.upsert import SyncResult, plan_sync, records_from_frame
+from notion_alchemy.writebehind import WriteBuffer
 
 
 class NotionClient:
     """Hybrid Notion API client with model support"""
     
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        timeout: float = 30.0,
+        max_retries: int = 5,
+        rate_limit: float = NOTION_RATE_LIMIT,
+        burst: float = None,
+        pool_size: int = 10,
+        rate_limiter: TokenBucket = None,
+        cache: TTLCache = None,
+        registry: SchemaRegistry = None,
+        instrumentation: Instrumentation = None,
+    ):
         self.api_key = api_key
         self.base_url = "https://api.notion.com/v1"
         self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "Notion-Version": "2022-06-28"
         }
+        if api_key:
+            # sem api_key (ShardedNotionClient) o Authorization vem do _acquire de cada tentativa
+            self.headers["Authorization"] = f"Bearer {self.api_key}"
+        self.timeout = timeout
+        self.retry_policy = RetryPolicy(max_retries=max_retries)
+        # pode ser compartilhado entre clientes que usam o mesmo token
+        self.rate_limiter = rate_limiter or TokenBucket(rate_limit, burst)
+        # opcional: get_page/get_database passam a responder do cache enquanto o TTL vale
+        self.cache = cache
+        # modelos compilados por database: o schema é lido uma vez e reaproveitado
+        self.registry = registry if registry is not None else default_registry
+        # opcional: recebe um evento por tentativa HTTP, espera no rate limiter e decode
+        self.instrumentation = instrumentation
+
+        # sessão com pool de conexões keep-alive, reaproveita TCP+TLS entre chamadas
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(self.headers)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _request(self, method: str, path: str, idempotent: bool = True, on_retry: Callable[[], None] = None, **kwargs) -> requests.Response:
+        """Send a request through the pooled session, rate limited and retried on 429/5xx"""
+        url = f"{self.base_url}/{path}"
+        kwargs.setdefault("timeout", self.timeout)
+        headers = kwargs.pop("headers", None) or {}
+        attempt = 0
+        hooks = self.instrumentation
+
+        while True:
+            slot, slot_headers = self._acquire()
+            if hooks is not None:
+                start, started = time.time(), time.perf_counter()
+            try:
+                response = self.session.request(method, url, headers={**headers, **slot_headers}, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                self._release(slot, None)
+                if hooks is not None:
+                    hooks.on_request(RequestEvent(method, path, None, time.perf_counter() - started, attempt=attempt, error=type(error).__name__, start=start))
+                if not idempotent or attempt >= self.retry_policy.max_retries:
+                    raise
+                self._backoff(self.retry_policy.backoff(attempt))
+                attempt += 1
+                if on_retry:
+                    on_retry()
+                continue
+
+            if hooks is not None:
+                hooks.on_request(response_event(method, path, response, attempt, start, time.perf_counter() - started))
+
+            if self._release(slot, response):
+                continue
+
+            if self.retry_policy.should_retry(response, attempt, idempotent):
+                delay = self.retry_policy.delay(response, attempt)
+                if response.status_code == 429:
+                    self._throttle(slot, delay)
+                else:
+                    self._backoff(delay)
+                attempt += 1
+                if on_retry:
+                    on_retry()
+                continue
+
+            response.raise_for_status()
+            self._invalidate(method, path)
+            return response
+
+    def _acquire(self) -> Tuple[Any, Dict[str, str]]:
+        """Espera a vez no rate limiter antes de cada tentativa.
+
+        Devolve (slot, headers): o slot volta no _release/_throttle da tentativa e
+        os headers vão só nela. Aqui não há slot; o ShardedNotionClient escolhe um token.
+        """
+        wait = self.rate_limiter.acquire()
+        if wait > 0 and self.instrumentation is not None:
+            self.instrumentation.on_throttle(wait, "rate_limit")
+        return None, {}
+
+    def _release(self, slot: Any, response: Optional[requests.Response]) -> bool:
+        """Fim de uma tentativa (response None em erro de conexão); True refaz a requisição na hora"""
+        return False
+
+    def _throttle(self, slot: Any, delay: float) -> None:
+        # 429: segura o balde inteiro, não só esta thread
+        self.rate_limiter.penalize(delay)
+
+    def _backoff(self, delay: float) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.on_throttle(delay, "backoff")
+        time.sleep(delay)
+
+    def _loads(self, content: bytes) -> Any:
+        """jsonlib.loads, reportando tempo, bytes e quantidade de results para a instrumentação"""
+        if self.instrumentation is None:
+            return loads(content)
+        start, started = time.time(), time.perf_counter()
+        data = loads(content)
+        rows = len(data.get("results") or ()) if isinstance(data, dict) else 0
+        self.instrumentation.on_decode(DecodeEvent("json", time.perf_counter() - started, rows=rows, bytes=len(content), start=start))
+        return data
+
+    # caminhos que têm entrada no cache: pages/{id} e databases/{id}
+    _CACHE_KINDS = {"pages": "page", "databases": "database"}
+
+    def _invalidate(self, method: str, path: str) -> None:
+        """Drop the cached entry of a page/database that was just written"""
+        if self.cache is None or method == "GET":
+            return
+        parts = path.split("/")
+        if len(parts) == 2 and parts[0] in self._CACHE_KINDS:
+            self.cache.invalidate(self._CACHE_KINDS[parts[0]], parts[1])
+
+    def _cached_get(self, kind: str, resource_id: str, path: str) -> Dict:
+        if self.cache is not None:
+            content = self.cache.get(kind, resource_id)
+            if content is not None:
+                return self._loads(content)
+
+        response = self._request("GET", path)
+        if self.cache is not None:
+            self.cache.set(kind, resource_id, response.content)
+        return self._loads(response.content)
     
     def get_page(self, page_id: str) -> Dict:
         """Get raw page data from Notion"""
-        url = f"{self.base_url}/pages/{page_id}"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get("page", page_id, f"pages/{page_id}")
     
     def get_database(self, database_id: str) -> Dict:
         """Get raw database data from Notion"""
-        url = f"{self.base_url}/databases/{database_id}"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get("database", database_id, f"databases/{database_id}")
 
+    def database_model(self, database_id: str) -> Type[NotionDatabaseModel]:
+        """Model class compiled from the database schema, reused while the schema does not change.
 
-    def query_database(self, model_class: Type[NotionDatabaseModel], filters: List[dict] = None) -> List[NotionDatabaseModel]:
+        Cada consulta usa uma instância nova (database_model(id)()), com colunas próprias.
+        """
+        return self.registry.model_for(self.get_database(database_id))
+
+    def iter_query_pages(
+        self,
+        database_id: str,
+        filters: Union[dict, List[dict]] = None,
+        page_size: int = 100,
+        sorts: List[dict] = None,
+        filter_properties: List[Union[str, NotionProperty]] = None,
+    ) -> Iterator[Dict]:
+        """Yield raw query result pages, following next_cursor until has_more is False"""
+        if not 1 <= page_size <= 100:
+            raise ValueError("page_size must be between 1 and 100")
+
+        path = f"databases/{database_id}/query"
+        query = self._build_query_payload(filters, sorts)
+        query["page_size"] = page_size
+        params = self._query_params(filter_properties)
+
+        while True:
+            data = self._loads(self._request("POST", path, params=params, json=query).content)
+            yield data
+
+            if not data.get("has_more") or not data.get("next_cursor"):
+                break
+            query["start_cursor"] = data["next_cursor"]
+
+    def iter_query_content(
+        self,
+        database_id: str,
+        filters: Union[dict, List[dict]] = None,
+        page_size: int = 100,
+        sorts: List[dict] = None,
+        filter_properties: List[Union[str, NotionProperty]] = None,
+    ) -> Iterator[bytes]:
+        """Like iter_query_pages, but yield the raw response bodies without decoding them.
+
+        Só o next_cursor é lido dos bytes; o loads fica para quem consome (ex: os
+        processos do populate(workers=N)).
+        """
+        if not 1 <= page_size <= 100:
+            raise ValueError("page_size must be between 1 and 100")
+
+        path = f"databases/{database_id}/query"
+        query = self._build_query_payload(filters, sorts)
+        query["page_size"] = page_size
+        params = self._query_params(filter_properties)
+
+        while True:
+            content = self._request("POST", path, params=params, json=query).content
+            yield content
+
+            cursor = next_cursor(content)
+            if not cursor:
+                break
+            query["start_cursor"] = cursor
+
+    def iter_rows(self, database_id: str, filters: Union[dict, List[dict]] = None, page_size: int = 100, sorts: List[dict] = None) -> Iterator[Dict]:
+        """Yield raw page objects of a database query one by one"""
+        for data in self.iter_query_pages(database_id, filters, page_size, sorts=sorts):
+            yield from data.get("results", [])
+
+    def query_database(
+        self,
+        model_class: Type[NotionDatabaseModel],
+        filters: Union[dict, List[dict]] = None,
+        page_size: int = 100,
+        keep_pages: bool = False,
+        sorts: List[dict] = None,
+        filter_properties: List[Union[str, NotionProperty]] = None,
+        expand_relations: Union[bool, List[str]] = False,
+        decode_workers: int = None,
+    ) -> List[NotionDatabaseModel]:
        
-        """Query database with optional filters"""
+        """Query database with optional filters/sorts, following pagination cursors
+
+        expand_relations=True (ou a lista de relations) busca as páginas relacionadas
+        no final, uma vez por id distinto (ver expand_relations). decode_workers=N
+        decodifica as páginas em N processos (ver NotionDatabaseModel.populate).
+        """
         if not model_class._database_id:
             raise ValueError("Model class must define _database_id")
         
-        url = f"{self.base_url}/databases/{model_class._database_id}/query"
-        query = self._build_query_payload(filters)
-        
-        response = requests.post(url, headers=self.headers, json=query)
-        response.raise_for_status()
+        if decode_workers:
+            # os corpos crus vão direto para os processos, que fazem loads e decode
+            pages = self.iter_query_content(model_class._database_id, filters, page_size, sorts, filter_properties)
+        else:
+            pages = self.iter_query_pages(model_class._database_id, filters, page_size, sorts, filter_properties)
 # melhorar a interação com o retorno
 #    quero poder acessar as paginas e fazer operações com elas 
             #exemplo quero acessar todas as paginas da tags casa e excluir as que tem name repetidas, mandando patch com os ids para atualizar a pagina para arquivada    
 #    Definir como objetos? 
 #    Definir com dataframe?       
-        return model_class.populate(response=response.json())
+        result = model_class.populate(
+            response=pages, keep_pages=keep_pages, instrumentation=self.instrumentation, workers=decode_workers, page_size=page_size
+        )
+        if expand_relations:
+            names = None if expand_relations is True else expand_relations
+            self.expand_relations(model_class, names)
+        return result
 
-# refazendo
-# precisa implementar o or 
-    def _build_query_payload(self, filters: List[dict]) -> Dict:
+    def export_database(
+        self,
+        database_id: str,
+        path: str,
+        format: str = None,
+        filters: Union[dict, List[dict]] = None,
+        sorts: List[dict] = None,
+        columns: List[str] = None,
+        page_size: int = 100,
+        chunk_rows: int = 5000,
+        **writer_options,
+    ) -> int:
+        """Stream a database query straight into a CSV, NDJSON or Parquet file; returns the row count.
+
+        O formato vem de format ou da extensão de path. As linhas são escritas a cada
+        chunk_rows, sem passar pelo _properties_data, então a memória não cresce com
+        o tamanho do database. columns limita as propriedades exportadas (e também as
+        que a API devolve, via filter_properties).
         """
-        Recebe uma lista de filtros (cada um já no formato Notion, ex: prop.contains("Python"))
-        e monta o payload para a API.
+        model = self.database_model(database_id)
+        schema = model._schema_decoder.schema
+        filter_properties = None
+        if columns:
+            filter_properties = [model._column_schema[name].property_id or name for name in columns if name in model._column_schema]
+
+        pages = self.iter_query_pages(database_id, filters, page_size, sorts, filter_properties)
+        with open_writer(path, schema, format, columns, **writer_options) as writer:
+            return export_pages(pages, writer, chunk_rows=chunk_rows)
+
+    def expand_relations(
+        self,
+        model: NotionDatabaseModel,
+        names: List[str] = None,
+        max_workers: int = 8,
+        resolver: RelationResolver = None,
+    ) -> RelationResolver:
+        """Resolve the relation columns of a populated model with one get_page per distinct page.
+
+        Os ids de todas as linhas são juntados e deduplicados antes de buscar, e as
+        buscas passam pelo cache do cliente (se houver). Passe o mesmo resolver em
+        várias chamadas para não buscar de novo o que já veio. Ids que falharem
+        ficam em resolver.errors.
         """
-        if not filters:
-            return {}
+        resolver = resolver or RelationResolver(self.get_page, max_workers=max_workers)
+        pages = resolver.resolve(model.relation_ids(names))
+        model.attach_relations(pages, names)
+        return resolver
 
+    def iter_block_children(self, block_id: str, page_size: int = 100) -> Iterator[Dict]:
+        """Yield the direct children of a block (or page), following next_cursor"""
+        if not 1 <= page_size <= 100:
+            raise ValueError("page_size must be between 1 and 100")
+
+        params = {"page_size": page_size}
+        while True:
+            data = self._loads(self._request("GET", f"blocks/{block_id}/children", params=params).content)
+            yield from data.get("results", [])
+
+            if not data.get("has_more") or not data.get("next_cursor"):
+                break
+            params["start_cursor"] = data["next_cursor"]
+
+    def get_block_children(self, block_id: str, page_size: int = 100) -> List[Dict]:
+        return list(self.iter_block_children(block_id, page_size))
+
+    def walk_blocks(
+        self,
+        block_ids: Union[str, Iterable[str]],
+        max_workers: int = 4,
+        max_depth: int = None,
+        checkpoint: BlockCheckpoint = None,
+        follow_child_pages: bool = False,
+    ) -> Iterator[Dict]:
+        """Yield the whole block tree of one or more pages, breadth-first.
+
+        Os filhos são buscados por até max_workers threads ao mesmo tempo, todas
+        passando pelo mesmo rate limiter, e cada bloco é entregue assim que chega.
+        Passe um BlockCheckpoint para poder retomar um percurso interrompido
+        (ver blocks.walk_blocks).
+        """
+        if isinstance(block_ids, str):
+            block_ids = [block_ids]
+        return walk_blocks(
+            self.get_block_children,
+            block_ids,
+            max_workers=max_workers,
+            max_depth=max_depth,
+            checkpoint=checkpoint,
+            follow_child_pages=follow_child_pages,
+        )
+
+    def sync_database(self, database_id: str, store: PageStore, page_size: int = 100, full: bool = False) -> int:
+        """Copy a database into a PageStore, fetching only pages edited since the last checkpoint.
+
+        As páginas vêm ordenadas por last_edited_time, então o checkpoint avança a cada
+        lote e uma sincronização interrompida continua de onde parou. O filtro usa
+        on_or_after porque o last_edited_time do Notion tem precisão de minuto.
+        full=True busca tudo e remove do cache as páginas que não existem mais.
+        Retorna quantas páginas foram gravadas.
+        """
+        checkpoint = None if full else store.get_checkpoint(database_id)
+        filters = None
+        if checkpoint:
+            filters = timestamp_filter("last_edited_time", "on_or_after", checkpoint)
+        sorts = [sort_by_timestamp("last_edited_time", "ascending")]
+
+        written = 0
+        seen = set()
+        for data in self.iter_query_pages(database_id, filters, page_size, sorts=sorts):
+            results = data.get("results", [])
+            if not results:
+                continue
+            written += store.upsert_pages(results, database_id)
+            store.set_checkpoint(database_id, results[-1]["last_edited_time"])
+            if full:
+                seen.update(page["id"] for page in results)
+
+        if full:
+            store.delete_pages(page_id for page_id in store.page_ids(database_id) if page_id not in seen)
+        return written
+
+    def _build_query_payload(self, filters: Union[dict, List[dict]], sorts: List[dict] = None) -> Dict:
+        """
+        Recebe um filtro (ex: prop.contains("Python"), ou combinado com & e |) ou uma
+        lista de filtros, que vira um "and", e monta o payload para a API.
+        """
+        payload = {}
+        if isinstance(filters, list) and filters:
+            filters = filters[0] if len(filters) == 1 else {"and": list(filters)}
+        if filters:
+            if filter_depth(filters) > 2:
+                raise ValueError("Notion only supports two levels of nested and/or filters")
+            payload["filter"] = filters
+        if sorts:
+            payload["sorts"] = list(sorts)
+        return payload
+
+    @staticmethod
+    def _query_params(filter_properties: List[Union[str, NotionProperty]] = None) -> Dict:
+        """filter_properties vai na query string: só essas propriedades voltam em cada página"""
+        if not filter_properties:
+            return {}
         return {
-            "filter": {
-                "and": [filters]
-            }
+            "filter_properties": [
+                prop.property_id or prop.name if isinstance(prop, NotionProperty) else prop
+                for prop in filter_properties
+            ]
         }
 
 
@@ -76,28 +449,164 @@ class NotionClient:
         if not model._database_id:
             raise ValueError("Model must have _database_id set")
         
-        url = f"{self.base_url}/pages"
         payload = {
             "parent": {"database_id": model._database_id},
             "properties": model.to_notion_properties()
         }
         
-        response = requests.post(url, headers=self.headers, json=payload)
-        response.raise_for_status()
+        # POST /pages não é idempotente: só repete em 429, nunca em 5xx ou erro de rede
+        response = self._request("POST", "pages", idempotent=False, json=payload)
         
-        return model.__class__.from_notion(response.json())
+        return model.__class__.from_notion(self._loads(response.content))
     
     def update_page(self, model: NotionModel) -> NotionModel:
         """Update existing page"""
         if not model.id:
             raise ValueError("Model must have an id to update")
         
-        url = f"{self.base_url}/pages/{model.id}"
+        # só as propriedades alteradas; sem alteração nenhuma não há requisição
+        properties = model.to_notion_properties(only_dirty=True)
+        if not properties:
+            return model
+
         payload = {
-            "properties": model.to_notion_properties()
+            "properties": properties
         }
         
-        response = requests.patch(url, headers=self.headers, json=payload)
-        response.raise_for_status()
+        response = self._request("PATCH", f"pages/{model.id}", json=payload)
         
-        return model.__class__.from_notion(response.json())
\ No newline at end of file
+        return model.__class__.from_notion(self._loads(response.content))
+
+    def archive_page(self, page_id: str) -> Dict:
+        """Archive (move to trash) a page"""
+        return self._loads(self._request("PATCH", f"pages/{page_id}", json={"archived": True}).content)
+
+    def write_session(self, max_pages: int = 100, max_age: float = None, max_workers: int = 4) -> WriteBuffer:
+        """Write-behind session: changes to the same page are merged into one PATCH on flush.
+
+        Use com `with`: o que estiver pendente é enviado na saída (ver WriteBuffer).
+        """
+        return WriteBuffer(self, max_pages=max_pages, max_age=max_age, max_workers=max_workers)
+
+    @staticmethod
+    def _model_id(model: Union[NotionModel, NotionDatabaseModel, Row]) -> str:
+        # linhas vindas do populate guardam o id da página em _database_id
+        if isinstance(model, NotionDatabaseModel):
+            return model._database_id
+        return model.id
+
+    @staticmethod
+    def _model_properties(model: Union[NotionModel, NotionDatabaseModel, Row], only_dirty: bool = False) -> Dict:
+        if isinstance(model, (NotionDatabaseModel, Row)):
+            return model.to_notion(only_dirty=only_dirty)
+        return model.to_notion_properties(only_dirty=only_dirty)
+
+    def create_pages(
+        self,
+        models: Iterable[Union[NotionModel, NotionDatabaseModel, Row]],
+        database_id: str = None,
+        max_workers: int = 4,
+        batch_size: int = 100,
+    ) -> BulkResult:
+        """Create many pages concurrently; database_id is required for rows without _database_id"""
+        def create(model, result: BulkResult) -> str:
+            parent_id = database_id
+            if parent_id is None and isinstance(model, NotionModel):
+                parent_id = model._database_id
+            if not parent_id:
+                raise ValueError("Model must have _database_id set or database_id must be given")
+            payload = {
+                "parent": {"database_id": parent_id},
+                "properties": self._model_properties(model)
+            }
+            response = self._request("POST", "pages", idempotent=False, on_retry=result.add_retry, json=payload)
+            return self._loads(response.content)["id"]
+
+        return run_bulk(create, models, max_workers=max_workers, batch_size=batch_size)
+
+    def update_pages(
+        self,
+        models: Iterable[Union[NotionModel, NotionDatabaseModel, Row]],
+        max_workers: int = 4,
+        batch_size: int = 100,
+    ) -> BulkResult:
+        """Update many pages concurrently, sending only changed properties and skipping clean models"""
+        def update(model, result: BulkResult) -> str:
+            page_id = self._model_id(model)
+            if not page_id:
+                raise ValueError("Model must have an id to update")
+            properties = self._model_properties(model, only_dirty=True)
+            if not properties:
+                return None
+            self._request("PATCH", f"pages/{page_id}", on_retry=result.add_retry, json={"properties": properties})
+            model.mark_clean()
+            return page_id
+
+        return run_bulk(update, models, max_workers=max_workers, batch_size=batch_size)
+
+    def archive_pages(self, page_ids: Iterable[str], max_workers: int = 4, batch_size: int = 100) -> BulkResult:
+        """Archive many pages concurrently; repeated ids are sent only once"""
+        seen = set()
+        unique_ids = (page_id for page_id in page_ids if not (page_id in seen or seen.add(page_id)))
+
+        def archive(page_id: str, result: BulkResult) -> str:
+            self._request("PATCH", f"pages/{page_id}", on_retry=result.add_retry, json={"archived": True})
+            return page_id
+
+        return run_bulk(archive, unique_ids, max_workers=max_workers, batch_size=batch_size)
+
+    def sync_records(
+        self,
+        target: Union[str, NotionDatabaseModel],
+        records: Any,
+        key: str,
+        archive_missing: bool = False,
+        dry_run: bool = False,
+        max_workers: int = 4,
+        batch_size: int = 100,
+    ) -> SyncResult:
+        """Upsert a DataFrame (or iterable of dicts) into a database, keyed by one property.
+
+        target é o id do database (as linhas são buscadas agora) ou um modelo já
+        populado com query_database. As linhas existentes são comparadas com os
+        registros pelo to_notion de cada propriedade (ver upsert.plan_sync) e só
+        inserts, updates das propriedades alteradas e, com archive_missing=True,
+        archives das linhas que sumiram são enviados, em paralelo. dry_run=True só
+        monta o plano (SyncResult.plan).
+        """
+        if isinstance(target, str):
+            database_id = target
+            model = self.database_model(database_id)()
+            self.query_database(model)
+        else:
+            model = target
+            database_id = model._database_id
+
+        if hasattr(records, "to_dict") and hasattr(records, "columns"):
+            records = records_from_frame(records, key)
+        plan = plan_sync(model, records, key, archive_missing=archive_missing)
+        result = SyncResult(plan)
+        if dry_run:
+            return result
+
+        if plan.inserts:
+            if not database_id:
+                raise ValueError("Model class must define _database_id to insert pages")
+
+            def create(properties: Dict, bulk: BulkResult) -> str:
+                payload = {"parent": {"database_id": database_id}, "properties": properties}
+                response = self._request("POST", "pages", idempotent=False, on_retry=bulk.add_retry, json=payload)
+                return self._loads(response.content)["id"]
+
+            result.created = run_bulk(create, plan.inserts, max_workers=max_workers, batch_size=batch_size)
+
+        def update(item: tuple, bulk: BulkResult) -> str:
+            page_id, properties = item
+            self._request("PATCH", f"pages/{page_id}", on_retry=bulk.add_retry, json={"properties": properties})
+            return page_id
+
+        if plan.updates:
+            result.updated = run_bulk(update, plan.updates, max_workers=max_workers, batch_size=batch_size)
+        if plan.archives:
+            result.archived = self.archive_pages(plan.archives, max_workers=max_workers, batch_size=batch_size)
+        return result
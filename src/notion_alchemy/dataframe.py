@@ -0,0 +1,75 @@
+try:
+    import pandas as pd
+except ImportError:  # pandas é opcional: o cliente funciona sem ele, só o DataFrame precisa
+    raise ImportError("pandas is required for DataFrame support: pip install notion-alchemy[dataframe]") from None
+
+from typing import Any, Dict, List
+from notion_alchemy.notion import clean_column
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow é opcional: sem ele listas ficam como object e não há parquet
+    pa = None
+
+# dtype pandas de cada tipo de PROPERTY_TYPE_MAP
+DTYPE_MAP = {
+    "title": "string",
+    "rich_text": "string",
+    "number": "Float64",
+    "checkbox": "boolean",
+    "select": "category",
+    "status": "category",
+    "multi_select": "list",
+    "date": "datetime64[ns, UTC]",
+    "people": "list",
+    "files": "list",
+    "relation": "list",
+    "formula": "object",
+}
+
+
+def to_series(values: List[Any], property_type: str, name: str = None) -> pd.Series:
+    """Convert one decoded column into a Series with the dtype of its Notion type"""
+    dtype = DTYPE_MAP.get(property_type, "object")
+
+    if dtype == "list":
+        values = clean_column(values, property_type)
+        if pa is None:
+            return pd.Series(values, name=name, dtype="object")
+        # lista de strings com dicionário: cada opção é guardada uma vez só
+        value_type = pa.dictionary(pa.int32(), pa.string()) if property_type == "multi_select" else pa.string()
+        array = pa.array(values, type=pa.list_(value_type))
+        return pd.Series(pd.arrays.ArrowExtensionArray(array), name=name)
+
+    if property_type == "formula":
+        return pd.Series(clean_column(values, property_type), name=name, dtype="object")
+
+    values = clean_column(values, property_type)
+    if property_type == "date":
+        # datas sem fuso (só dia) são tratadas como UTC para caber numa coluna só
+        return pd.Series(pd.to_datetime(values, utc=True, format="ISO8601"), name=name)
+    if dtype == "category":
+        return pd.Series(pd.Categorical(values), name=name)
+    return pd.Series(pd.array(values, dtype=dtype), name=name)
+
+
+def columns_to_frame(columns: Dict[str, List[Any]], schema: Dict[str, str]) -> pd.DataFrame:
+    """Build a typed DataFrame from decoded columns (ColumnDecoder) indexed by page_id"""
+    data = {
+        name: to_series(values, schema.get(name), name=name)
+        for name, values in columns.items()
+        if name != "page_id"
+    }
+    data["page_id"] = pd.Series(columns.get("page_id", []), dtype="string")
+    return pd.DataFrame(data).set_index("page_id")
+
+
+def write_parquet(df: pd.DataFrame, path: str, **kwargs) -> None:
+    """Write a typed DataFrame to parquet with page_id as a regular column"""
+    if pa is None:
+        raise ImportError("pyarrow is required to write parquet files: pip install notion-alchemy[parquet]")
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(df.reset_index(), preserve_index=False)
+    # sem o metadata do pandas: ele não sabe reler dtypes de lista do pyarrow
+    pq.write_table(table.replace_schema_metadata(None), path, **kwargs)
@@ -0,0 +1,54 @@
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from notion_alchemy.notion import PROPERTY_TYPE_MAP
+
+# célula ausente numa página: os parsers devolvem o mesmo valor "vazio" de sempre
+_EMPTY: Dict = {}
+
+
+class ColumnDecoder:
+    """Decoder colunar compilado uma vez a partir do schema do database.
+
+    Cada coluna vira um par (nome, parser) com o _parse_value estático da
+    classe de propriedade correspondente; decode() percorre as páginas e faz
+    append direto nas listas de cada coluna, sem criar um NotionProperty por
+    célula nem um modelo por página.
+    """
+
+    def __init__(self, schema: Dict[str, str], columns: Iterable[str] = None):
+        # schema: nome da propriedade no Notion -> tipo (ex: {"Tags": "multi_select"})
+        # tipos sem classe em PROPERTY_TYPE_MAP (rollup, url, ...) ficam de fora
+        self.schema = {name: dtype for name, dtype in schema.items() if dtype in PROPERTY_TYPE_MAP}
+        # columns: só essas são parseadas, as demais recebem None para manter o alinhamento
+        selected = set(self.schema) if columns is None else set(columns)
+        self.columns: List[Tuple[str, Callable[[Dict], object]]] = [
+            (name, PROPERTY_TYPE_MAP[dtype]._parse_value) for name, dtype in self.schema.items() if name in selected
+        ]
+        self.skipped: List[str] = [name for name in self.schema if name not in selected]
+
+    @classmethod
+    def from_database(cls, database: Dict) -> "ColumnDecoder":
+        """Compile from a raw database object (NotionClient.get_database)"""
+        return cls({name: prop.get("type") for name, prop in database.get("properties", {}).items()})
+
+    def new_columns(self) -> Dict[str, list]:
+        columns = {name: [] for name in self.schema}
+        columns["page_id"] = []
+        return columns
+
+    def decode(self, results: Iterable[Dict], columns: Dict[str, list]) -> int:
+        """Append every page in results to columns; returns how many pages were decoded"""
+        page_ids = columns.setdefault("page_id", [])
+        extractors = [(columns.setdefault(name, []).append, name, parse) for name, parse in self.columns]
+        skipped = [columns.setdefault(name, []).append for name in self.skipped]
+
+        count = 0
+        for page in results:
+            page_ids.append(page.get("id"))
+            properties = page.get("properties", _EMPTY)
+            for append, name, parse in extractors:
+                append(parse(properties.get(name, _EMPTY)))
+            for append in skipped:
+                append(None)
+            count += 1
+        return count
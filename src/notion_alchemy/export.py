@@ -0,0 +1,194 @@
+"""Exportação em streaming de resultados de query para CSV, NDJSON ou Parquet.
+
+Cada response da API (NotionClient.iter_query_pages) é decodificado pelo
+ColumnDecoder em colunas novas, acumulado até chegar a chunk_rows linhas e escrito no
+arquivo; depois as colunas são descartadas. A memória fica limitada ao chunk,
+qualquer que seja o tamanho do database.
+
+    with open_writer("dump.parquet", schema) as writer:
+        export_pages(client.iter_query_pages(database_id), writer)
+"""
+import csv
+import json
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Optional
+from notion_alchemy.decoder import ColumnDecoder
+from notion_alchemy.notion import LIST_TYPES, PROPERTY_TYPE_MAP, clean_column
+
+# pyarrow é opcional e pesado: só é importado quando um ParquetWriter é criado
+pa = pq = None
+
+
+def _load_pyarrow() -> None:
+    global pa, pq
+    if pa is not None:
+        return
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("pyarrow is required to write parquet files: pip install notion-alchemy[parquet]") from None
+    pa, pq = pyarrow, pyarrow.parquet
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class RowWriter(ABC):
+    """Destino de um export: recebe chunks de colunas decodificadas e escreve no arquivo"""
+
+    def __init__(self, path: str, schema: Dict[str, str], columns: Iterable[str] = None):
+        self.path = path
+        # schema: nome da propriedade -> tipo do Notion; columns limita e ordena as colunas
+        # tipos que o decoder não conhece (rollup, url, ...) ficam de fora, como no ColumnDecoder
+        self.schema = {name: dtype for name, dtype in schema.items() if dtype in PROPERTY_TYPE_MAP}
+        self.columns = ["page_id"] + [name for name in (columns or schema) if name in self.schema]
+        self.rows = 0
+
+    def write(self, columns: Dict[str, list]) -> None:
+        count = len(columns.get("page_id", []))
+        if not count:
+            return
+        cleaned = {"page_id": columns["page_id"]}
+        for name in self.columns[1:]:
+            cleaned[name] = clean_column(columns[name], self.schema[name])
+        self._write(cleaned, count)
+        self.rows += count
+
+    @abstractmethod
+    def _write(self, columns: Dict[str, list], count: int) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CsvWriter(RowWriter):
+    """CSV com cabeçalho; listas viram JSON e datas ISO 8601"""
+
+    def __init__(self, path: str, schema: Dict[str, str], columns: Iterable[str] = None, **csv_options):
+        super().__init__(path, schema, columns)
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._csv = csv.writer(self._file, **csv_options)
+        self._csv.writerow(self.columns)
+
+    @staticmethod
+    def _cell(value: Any) -> Any:
+        if value is None:
+            return ""
+        if isinstance(value, (list, dict)):
+            return json.dumps(value, ensure_ascii=False, default=_json_default)
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        return value
+
+    def _write(self, columns: Dict[str, list], count: int) -> None:
+        cell = self._cell
+        self._csv.writerows(
+            [cell(value) for value in row] for row in zip(*(columns[name] for name in self.columns))
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class NdjsonWriter(RowWriter):
+    """Um objeto JSON por linha, com page_id e as propriedades pelo nome do Notion"""
+
+    def __init__(self, path: str, schema: Dict[str, str], columns: Iterable[str] = None):
+        super().__init__(path, schema, columns)
+        self._file = open(path, "w", encoding="utf-8")
+
+    def _write(self, columns: Dict[str, list], count: int) -> None:
+        names = self.columns
+        self._file.writelines(
+            json.dumps(dict(zip(names, row)), ensure_ascii=False, default=_json_default) + "\n"
+            for row in zip(*(columns[name] for name in names))
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def arrow_type(property_type: str) -> "pa.DataType":
+    """Tipo pyarrow fixo de cada tipo do Notion, igual em todos os chunks"""
+    _load_pyarrow()
+    if property_type in ("select", "status"):
+        return pa.dictionary(pa.int32(), pa.string())
+    if property_type == "multi_select":
+        return pa.list_(pa.dictionary(pa.int32(), pa.string()))
+    if property_type in LIST_TYPES:
+        return pa.list_(pa.string())
+    if property_type == "number":
+        return pa.float64()
+    if property_type == "checkbox":
+        return pa.bool_()
+    if property_type == "date":
+        # datas sem fuso (só dia) são tratadas como UTC, como no to_pandas(typed=True)
+        return pa.timestamp("us", tz="UTC")
+    return pa.string()
+
+
+class ParquetWriter(RowWriter):
+    """Parquet com um row group por chunk (precisa do pyarrow)"""
+
+    def __init__(self, path: str, schema: Dict[str, str], columns: Iterable[str] = None, **parquet_options):
+        _load_pyarrow()
+        super().__init__(path, schema, columns)
+        self.arrow_schema = pa.schema(
+            [pa.field("page_id", pa.string())] + [pa.field(name, arrow_type(self.schema[name])) for name in self.columns[1:]]
+        )
+        self._writer = pq.ParquetWriter(path, self.arrow_schema, **parquet_options)
+
+    def _write(self, columns: Dict[str, list], count: int) -> None:
+        arrays = []
+        for field in self.arrow_schema:
+            values = columns[field.name]
+            if self.schema.get(field.name) == "formula":
+                values = [None if value is None else str(value) for value in values]
+            arrays.append(pa.array(values, type=field.type))
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self.arrow_schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+WRITERS = {"csv": CsvWriter, "ndjson": NdjsonWriter, "jsonl": NdjsonWriter, "parquet": ParquetWriter}
+
+
+def open_writer(path: str, schema: Dict[str, str], format: str = None, columns: Iterable[str] = None, **options) -> RowWriter:
+    """Writer pelo formato, ou pela extensão do arquivo quando format não é dado"""
+    format = (format or path.rsplit(".", 1)[-1]).lower()
+    if format not in WRITERS:
+        raise ValueError(f"Unknown export format {format!r}; use one of {sorted(WRITERS)}")
+    return WRITERS[format](path, schema, columns, **options)
+
+
+def export_pages(responses: Iterable[Dict], writer: RowWriter, chunk_rows: int = 5000, decoder: Optional[ColumnDecoder] = None) -> int:
+    """Decode query responses chunk by chunk into writer; returns how many rows were written"""
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be at least 1")
+    decoder = decoder or ColumnDecoder(writer.schema, writer.columns[1:])
+    columns = decoder.new_columns()
+    pending = 0
+
+    for data in responses:
+        pending += decoder.decode(data.get("results", []), columns)
+        if pending >= chunk_rows:
+            writer.write(columns)
+            columns = decoder.new_columns()
+            pending = 0
+    if pending:
+        writer.write(columns)
+    return writer.rows
@@ -0,0 +1,324 @@
+"""Ganchos de instrumentação do NotionClient.
+
+O cliente chama os métodos de um Instrumentation em cada tentativa HTTP, em
+cada espera do rate limiter, em cada decode de JSON e em cada lote do
+populate. A classe base não faz nada; MetricsCollector acumula histogramas e
+contadores exportáveis no formato de texto do Prometheus e OpenTelemetryHooks
+transforma os eventos em spans (precisa do opentelemetry-api).
+
+    metrics = MetricsCollector()
+    client = NotionClient(api_key, instrumentation=metrics)
+    client.query_database(model)
+    print(metrics.to_prometheus())
+"""
+import bisect
+import threading
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from opentelemetry import trace
+except ImportError:  # opentelemetry é opcional: só OpenTelemetryHooks precisa dele
+    trace = None
+
+# limites (segundos) dos buckets de latência, do mesmo jeito que os clientes do Prometheus
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def endpoint(path: str) -> str:
+    """Rótulo sem ids para o caminho (ex: databases/abc/query -> databases/{id}/query)"""
+    return "/".join("{id}" if i % 2 else part for i, part in enumerate(path.split("/")))
+
+
+@dataclass
+class RequestEvent:
+    """Uma tentativa HTTP; attempt > 0 quer dizer que é um retry"""
+    method: str
+    path: str
+    status: Optional[int]
+    duration: float
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    attempt: int = 0
+    error: Optional[str] = None
+    start: float = 0.0
+
+    @property
+    def endpoint(self) -> str:
+        return endpoint(self.path)
+
+
+@dataclass
+class DecodeEvent:
+    """Um trecho de decode: "json" (bytes -> dict) ou "populate" (páginas -> colunas)"""
+    stage: str
+    duration: float
+    rows: int = 0
+    bytes: int = 0
+    start: float = 0.0
+
+
+def response_event(method: str, path: str, response, attempt: int, start: float, duration: float) -> RequestEvent:
+    """RequestEvent de uma resposta do requests (start é time.time(), duration vem do perf_counter)"""
+    body = response.request.body if response.request is not None else None
+    return RequestEvent(
+        method=method,
+        path=path,
+        status=response.status_code,
+        duration=duration,
+        bytes_sent=len(body) if body else 0,
+        bytes_received=len(response.content),
+        attempt=attempt,
+        start=start,
+    )
+
+
+class Instrumentation:
+    """Ganchos chamados pelo NotionClient; a implementação padrão ignora tudo.
+
+    Os métodos podem ser chamados de várias threads ao mesmo tempo (bulk,
+    walk_blocks, AsyncNotionClient), então subclasses precisam ser thread-safe.
+    """
+
+    def on_request(self, event: RequestEvent) -> None:
+        pass
+
+    def on_throttle(self, seconds: float, reason: str) -> None:
+        """Tempo parado esperando o rate limiter ("rate_limit") ou o backoff de um retry ("backoff")"""
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        pass
+
+
+class MultiInstrumentation(Instrumentation):
+    """Repassa cada evento para vários Instrumentation (ex: métricas e spans juntos)"""
+
+    def __init__(self, targets: Iterable[Instrumentation]):
+        self.targets = list(targets)
+
+    def on_request(self, event: RequestEvent) -> None:
+        for target in self.targets:
+            target.on_request(event)
+
+    def on_throttle(self, seconds: float, reason: str) -> None:
+        for target in self.targets:
+            target.on_throttle(seconds, reason)
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        for target in self.targets:
+            target.on_decode(event)
+
+
+class Histogram:
+    """Histograma cumulativo com buckets fixos (sem lock: quem usa segura o lock)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Pares (le, contagem acumulada), terminando em +Inf"""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return pairs
+
+    def quantile(self, q: float) -> float:
+        """Estimativa pelo limite superior do bucket onde cai o quantil q"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            if total >= target:
+                return bound
+        return float("inf")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{value}"' for name, value in labels.items())
+
+
+class MetricsCollector(Instrumentation):
+    """Acumula latência, bytes, retries, espera no rate limiter e linhas decodificadas.
+
+    Latências ficam em histogramas por (método, endpoint) e por estágio de
+    decode; snapshot() devolve um resumo em dict e to_prometheus() o formato
+    de texto de exposição do Prometheus.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, prefix: str = "notion"):
+        self.buckets = buckets
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.request_latency: Dict[Tuple[str, str], Histogram] = {}
+            self.responses: Dict[Tuple[str, str, str], int] = {}
+            self.bytes_sent = 0
+            self.bytes_received = 0
+            self.retries = 0
+            self.throttle_seconds: Dict[str, float] = {}
+            self.decode_latency: Dict[str, Histogram] = {}
+            self.decode_rows: Dict[str, int] = {}
+            self.decode_bytes: Dict[str, int] = {}
+
+    def on_request(self, event: RequestEvent) -> None:
+        key = (event.method, event.endpoint)
+        status = str(event.status) if event.status is not None else (event.error or "error")
+        with self._lock:
+            histogram = self.request_latency.get(key)
+            if histogram is None:
+                histogram = self.request_latency[key] = Histogram(self.buckets)
+            histogram.observe(event.duration)
+            self.responses[key + (status,)] = self.responses.get(key + (status,), 0) + 1
+            self.bytes_sent += event.bytes_sent
+            self.bytes_received += event.bytes_received
+            if event.attempt:
+                self.retries += 1
+
+    def on_throttle(self, seconds: float, reason: str) -> None:
+        with self._lock:
+            self.throttle_seconds[reason] = self.throttle_seconds.get(reason, 0.0) + seconds
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        with self._lock:
+            histogram = self.decode_latency.get(event.stage)
+            if histogram is None:
+                histogram = self.decode_latency[event.stage] = Histogram(self.buckets)
+            histogram.observe(event.duration)
+            self.decode_rows[event.stage] = self.decode_rows.get(event.stage, 0) + event.rows
+            self.decode_bytes[event.stage] = self.decode_bytes.get(event.stage, 0) + event.bytes
+
+    def rows_per_second(self, stage: str = "populate") -> float:
+        with self._lock:
+            histogram = self.decode_latency.get(stage)
+            if histogram is None or not histogram.sum:
+                return 0.0
+            return self.decode_rows.get(stage, 0) / histogram.sum
+
+    def snapshot(self) -> Dict:
+        """Resumo das métricas: contagens, p50/p95 de latência e totais"""
+        with self._lock:
+            requests = {
+                f"{method} {path}": {
+                    "count": histogram.count,
+                    "seconds": histogram.sum,
+                    "p50": histogram.quantile(0.5),
+                    "p95": histogram.quantile(0.95),
+                }
+                for (method, path), histogram in self.request_latency.items()
+            }
+            decode = {
+                stage: {"count": histogram.count, "seconds": histogram.sum, "rows": self.decode_rows.get(stage, 0)}
+                for stage, histogram in self.decode_latency.items()
+            }
+            return {
+                "requests": requests,
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "retries": self.retries,
+                "throttle_seconds": dict(self.throttle_seconds),
+                "decode": decode,
+            }
+
+    def to_prometheus(self) -> str:
+        """Métricas no formato de texto de exposição do Prometheus"""
+        p = self.prefix
+        lines = []
+        with self._lock:
+            lines.append(f"# HELP {p}_request_duration_seconds Duração de cada tentativa HTTP")
+            lines.append(f"# TYPE {p}_request_duration_seconds histogram")
+            for (method, path), histogram in sorted(self.request_latency.items()):
+                lines.extend(self._histogram_lines(f"{p}_request_duration_seconds", histogram, method=method, endpoint=path))
+
+            lines.append(f"# TYPE {p}_responses_total counter")
+            for (method, path, status), count in sorted(self.responses.items()):
+                lines.append(f"{p}_responses_total{{{_labels(method=method, endpoint=path, status=status)}}} {count}")
+
+            lines.append(f"# TYPE {p}_request_bytes_total counter")
+            lines.append(f"{p}_request_bytes_total {self.bytes_sent}")
+            lines.append(f"# TYPE {p}_response_bytes_total counter")
+            lines.append(f"{p}_response_bytes_total {self.bytes_received}")
+            lines.append(f"# TYPE {p}_retries_total counter")
+            lines.append(f"{p}_retries_total {self.retries}")
+
+            lines.append(f"# HELP {p}_throttle_seconds_total Tempo parado no rate limiter e no backoff")
+            lines.append(f"# TYPE {p}_throttle_seconds_total counter")
+            for reason, seconds in sorted(self.throttle_seconds.items()):
+                lines.append(f"{p}_throttle_seconds_total{{{_labels(reason=reason)}}} {seconds!r}")
+
+            lines.append(f"# TYPE {p}_decode_duration_seconds histogram")
+            for stage, histogram in sorted(self.decode_latency.items()):
+                lines.extend(self._histogram_lines(f"{p}_decode_duration_seconds", histogram, stage=stage))
+            lines.append(f"# TYPE {p}_decoded_rows_total counter")
+            for stage, rows in sorted(self.decode_rows.items()):
+                lines.append(f"{p}_decoded_rows_total{{{_labels(stage=stage)}}} {rows}")
+            lines.append(f"# TYPE {p}_decoded_bytes_total counter")
+            for stage, size in sorted(self.decode_bytes.items()):
+                lines.append(f"{p}_decoded_bytes_total{{{_labels(stage=stage)}}} {size}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _histogram_lines(name: str, histogram: Histogram, **labels: str) -> List[str]:
+        base = _labels(**labels)
+        lines = [f'{name}_bucket{{{base},le="{bound}"}} {count}' for bound, count in histogram.cumulative()]
+        lines.append(f"{name}_sum{{{base}}} {histogram.sum!r}")
+        lines.append(f"{name}_count{{{base}}} {histogram.count}")
+        return lines
+
+
+class OpenTelemetryHooks(Instrumentation):
+    """Um span por tentativa HTTP e por trecho de decode (precisa do opentelemetry-api).
+
+    Os spans são criados depois do fato, com os horários de início e fim
+    medidos pelo cliente; a espera no rate limiter vira um evento no span atual.
+    """
+
+    def __init__(self, tracer=None, tracer_name: str = "notion_alchemy"):
+        if trace is None:
+            raise ImportError("OpenTelemetryHooks requires opentelemetry-api (pip install opentelemetry-api)")
+        self.tracer = tracer or trace.get_tracer(tracer_name)
+
+    @staticmethod
+    def _ns(start: float, duration: float) -> Tuple[int, int]:
+        start_ns = int(start * 1e9)
+        return start_ns, start_ns + int(duration * 1e9)
+
+    def on_request(self, event: RequestEvent) -> None:
+        start, end = self._ns(event.start, event.duration)
+        span = self.tracer.start_span(f"{event.method} {event.endpoint}", start_time=start)
+        span.set_attribute("http.request.method", event.method)
+        span.set_attribute("url.path", event.path)
+        span.set_attribute("http.request.resend_count", event.attempt)
+        span.set_attribute("http.request.body.size", event.bytes_sent)
+        span.set_attribute("http.response.body.size", event.bytes_received)
+        if event.status is not None:
+            span.set_attribute("http.response.status_code", event.status)
+        if event.error:
+            span.set_attribute("error.type", event.error)
+        span.end(end_time=end)
+
+    def on_throttle(self, seconds: float, reason: str) -> None:
+        trace.get_current_span().add_event("notion.throttle", {"seconds": seconds, "reason": reason})
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        start, end = self._ns(event.start, event.duration)
+        span = self.tracer.start_span(f"notion.decode.{event.stage}", start_time=start)
+        span.set_attribute("notion.decode.rows", event.rows)
+        span.set_attribute("notion.decode.bytes", event.bytes)
+        span.end(end_time=end)
+
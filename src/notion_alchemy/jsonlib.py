@@ -0,0 +1,39 @@
+import json
+import re
+
+from typing import Any, Optional, Union
+
+# orjson é opcional: quando instalado decodifica as respostas bem mais rápido que o json da stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(content: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+# "next_cursor" só existe no objeto "list" do topo da resposta, e aspas dentro de
+# strings JSON são sempre escapadas, então a chave não aparece em outro lugar
+_NEXT_CURSOR = re.compile(rb'"next_cursor"\s*:\s*(?:null|"([^"]*)")')
+
+
+def next_cursor(content: bytes) -> Optional[str]:
+    """next_cursor of a raw list response, without decoding the results"""
+    match = None
+    for match in _NEXT_CURSOR.finditer(content):
+        pass
+    if match is None or match.group(1) is None:
+        return None
+    return match.group(1).decode()
@@ -0,0 +1,292 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Set, Union
+
+from notion_alchemy.notion import is_empty
+
+HASH_TYPES = {"select", "status", "checkbox"}
+SORTED_TYPES = {"number", "date"}
+INVERTED_TYPES = {"multi_select", "relation", "people", "files"}
+TEXT_TYPES = {"title", "rich_text"}
+# chave do filtro de fórmula -> tipo do resultado que o Notion devolve
+FORMULA_RESULT_TYPES = {"checkbox": "boolean"}
+
+
+def _to_utc(value: Union[datetime, str]) -> datetime:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    # datas só com dia chegam sem fuso: tratadas como UTC
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _is_date_only(value: Any) -> bool:
+    return isinstance(value, str) and len(value) == 10
+
+
+class HashIndex:
+    """valor -> posições; para select, status e checkbox"""
+
+    def __init__(self, values: List[Any]):
+        self.all = set(range(len(values)))
+        self.buckets: Dict[Any, Set[int]] = {}
+        for position, value in enumerate(values):
+            key = None if is_empty(value) else value
+            self.buckets.setdefault(key, set()).add(position)
+
+    def evaluate(self, operator: str, argument: Any) -> Set[int]:
+        if operator == "equals":
+            return set(self.buckets.get(argument, ()))
+        if operator == "does_not_equal":
+            return self.all - self.buckets.get(argument, set())
+        if operator == "is_empty":
+            return set(self.buckets.get(None, ()))
+        if operator == "is_not_empty":
+            return self.all - self.buckets.get(None, set())
+        raise ValueError(f"Operador não suportado para filtro local: {operator}")
+
+
+class SortedIndex:
+    """valores ordenados + bisect; para number e date"""
+
+    def __init__(self, values: List[Any], is_date: bool = False):
+        self.is_date = is_date
+        self.all = set(range(len(values)))
+        self.empty = set()
+        pairs = []
+        for position, value in enumerate(values):
+            if is_empty(value):
+                self.empty.add(position)
+            else:
+                pairs.append((_to_utc(value) if is_date else value, position))
+        pairs.sort(key=lambda pair: pair[0])
+        self.keys = [key for key, _ in pairs]
+        self.positions = [position for _, position in pairs]
+
+    def _range(self, start: int, end: int) -> Set[int]:
+        return set(self.positions[start:end])
+
+    def _between(self, low: Any, high: Any) -> Set[int]:
+        """low <= valor < high"""
+        return self._range(bisect_left(self.keys, low), bisect_left(self.keys, high))
+
+    def evaluate(self, operator: str, argument: Any) -> Set[int]:
+        if operator == "is_empty":
+            return set(self.empty)
+        if operator == "is_not_empty":
+            return self.all - self.empty
+        if self.is_date:
+            return self._evaluate_date(operator, argument)
+
+        if operator == "equals":
+            return self._range(bisect_left(self.keys, argument), bisect_right(self.keys, argument))
+        if operator == "does_not_equal":
+            return self.all - self.evaluate("equals", argument)
+        if operator == "greater_than":
+            return self._range(bisect_right(self.keys, argument), len(self.keys))
+        if operator == "greater_than_or_equal_to":
+            return self._range(bisect_left(self.keys, argument), len(self.keys))
+        if operator == "less_than":
+            return self._range(0, bisect_left(self.keys, argument))
+        if operator == "less_than_or_equal_to":
+            return self._range(0, bisect_right(self.keys, argument))
+        raise ValueError(f"Operador não suportado para filtro local: {operator}")
+
+    def _evaluate_date(self, operator: str, argument: Any) -> Set[int]:
+        relative = _relative_range(operator)
+        if relative:
+            return self._between(*relative)
+
+        start = _to_utc(argument)
+        # filtro só com dia compara o dia inteiro, como o Notion faz
+        end = start + timedelta(days=1) if _is_date_only(argument) else start + timedelta(microseconds=1)
+
+        if operator == "equals":
+            return self._between(start, end)
+        if operator == "before":
+            return self._range(0, bisect_left(self.keys, start))
+        if operator == "on_or_before":
+            return self._range(0, bisect_left(self.keys, end))
+        if operator == "after":
+            return self._range(bisect_left(self.keys, end), len(self.keys))
+        if operator == "on_or_after":
+            return self._range(bisect_left(self.keys, start), len(self.keys))
+        raise ValueError(f"Operador não suportado para filtro local: {operator}")
+
+
+def _relative_range(operator: str, now: datetime = None):
+    """Intervalo [início, fim) dos filtros relativos (past_week, this_month, ...)"""
+    now = now or datetime.now(timezone.utc)
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    week_start = today - timedelta(days=today.weekday())
+    month_start = today.replace(day=1)
+    next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+    year_start = today.replace(month=1, day=1)
+
+    ranges = {
+        "past_week": (now - timedelta(days=7), now),
+        "past_month": (now - timedelta(days=30), now),
+        "past_year": (now - timedelta(days=365), now),
+        "next_week": (now, now + timedelta(days=7)),
+        "next_month": (now, now + timedelta(days=30)),
+        "next_year": (now, now + timedelta(days=365)),
+        "this_week": (week_start, week_start + timedelta(days=7)),
+        "this_month": (month_start, next_month_start),
+        "this_year": (year_start, year_start.replace(year=year_start.year + 1)),
+    }
+    return ranges.get(operator)
+
+
+class InvertedIndex:
+    """opção/id -> posições; para multi_select, relation, people e files"""
+
+    def __init__(self, values: List[Any]):
+        self.all = set(range(len(values)))
+        self.empty = set()
+        self.postings: Dict[Any, Set[int]] = {}
+        for position, value in enumerate(values):
+            if is_empty(value):
+                self.empty.add(position)
+                continue
+            for item in value:
+                self.postings.setdefault(item, set()).add(position)
+
+    def evaluate(self, operator: str, argument: Any) -> Set[int]:
+        if operator == "contains":
+            return set(self.postings.get(argument, ()))
+        if operator == "does_not_contain":
+            return self.all - self.postings.get(argument, set())
+        if operator == "is_empty":
+            return set(self.empty)
+        if operator == "is_not_empty":
+            return self.all - self.empty
+        raise ValueError(f"Operador não suportado para filtro local: {operator}")
+
+
+class TextScan:
+    """Sem índice: varredura case-insensitive para title e rich_text"""
+
+    OPERATORS: Dict[str, Callable[[str, str], bool]] = {
+        "equals": lambda value, argument: value == argument,
+        "does_not_equal": lambda value, argument: value != argument,
+        "contains": lambda value, argument: argument in value,
+        "does_not_contain": lambda value, argument: argument not in value,
+        "starts_with": lambda value, argument: value.startswith(argument),
+        "ends_with": lambda value, argument: value.endswith(argument),
+    }
+
+    def __init__(self, values: List[Any]):
+        self.values = [None if is_empty(value) else str(value).lower() for value in values]
+
+    def evaluate(self, operator: str, argument: Any) -> Set[int]:
+        if operator == "is_empty":
+            return {position for position, value in enumerate(self.values) if value is None}
+        if operator == "is_not_empty":
+            return {position for position, value in enumerate(self.values) if value is not None}
+        if operator not in self.OPERATORS:
+            raise ValueError(f"Operador não suportado para filtro local: {operator}")
+
+        test = self.OPERATORS[operator]
+        argument = str(argument).lower()
+        return {position for position, value in enumerate(self.values) if test(value or "", argument)}
+
+
+def _formula_column(values: List[Any], result_type: str) -> List[Any]:
+    # {"type": "number", "number": 3}; datas vêm como {"start": "..."}
+    column = []
+    for value in values:
+        result = value.get(result_type) if isinstance(value, dict) and value.get("type") == result_type else None
+        if result_type == "date" and result:
+            result = result.get("start")
+        column.append(result)
+    return column
+
+
+def build_index(values: List[Any], property_type: str):
+    if property_type in HASH_TYPES:
+        return HashIndex(values)
+    if property_type in SORTED_TYPES:
+        return SortedIndex(values, is_date=property_type == "date")
+    if property_type in INVERTED_TYPES:
+        return InvertedIndex(values)
+    if property_type in TEXT_TYPES or property_type == "string":
+        return TextScan(values)
+    raise ValueError(f"Tipo de propriedade não suportado para filtro local: {property_type}")
+
+
+class LocalQuery:
+    """Avalia os filtros do notion.py (ex: prop.contains("Casa")) sobre colunas já carregadas.
+
+    Recebe as colunas do ColumnDecoder (NotionDatabaseModel._properties_data) e o
+    schema nome -> tipo. Os índices são criados na primeira vez que uma coluna é
+    filtrada e refeitos se a coluna crescer (ex: outro populate) ou se a versão
+    dela em `versions` mudar (Row.__setitem__ incrementa a da coluna editada).
+    """
+
+    def __init__(self, columns: Dict[str, List[Any]], schema: Dict[str, str], versions: Dict[str, int] = None):
+        self.columns = columns
+        self.schema = schema
+        self.versions = versions if versions is not None else {}
+        self._indexes: Dict[tuple, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self.columns.get("page_id", []))
+
+    def _index(self, name: str, property_type: str, formula_type: str = None):
+        values = self.columns[name]
+        key = (name, formula_type)
+        stamp = (len(values), self.versions.get(name, 0))
+        cached = self._indexes.get(key)
+        if cached is None or cached[0] != stamp:
+            if formula_type:
+                values = _formula_column(values, FORMULA_RESULT_TYPES.get(formula_type, formula_type))
+                property_type = formula_type
+            cached = (stamp, build_index(values, property_type))
+            self._indexes[key] = cached
+        return cached[1]
+
+    def positions(self, filters: Union[dict, list]) -> List[int]:
+        """Row positions matching filter, in the original order"""
+        return sorted(self._evaluate(filters))
+
+    def page_ids(self, filters: Union[dict, list]) -> List[str]:
+        page_ids = self.columns["page_id"]
+        return [page_ids[position] for position in self.positions(filters)]
+
+    def select(self, filters: Union[dict, list]) -> Dict[str, List[Any]]:
+        """Columns restricted to the matching rows"""
+        positions = self.positions(filters)
+        return {name: [values[position] for position in positions] for name, values in self.columns.items()}
+
+    def _evaluate(self, filters: Union[dict, list]) -> Set[int]:
+        if isinstance(filters, list):
+            filters = {"and": filters}
+        if "and" in filters:
+            results = sorted((self._evaluate(item) for item in filters["and"]), key=len)
+            if not results:
+                return set(range(len(self)))
+            # começa pelo menor conjunto: a interseção custa proporcional a ele
+            result = results[0]
+            for other in results[1:]:
+                result = result & other
+            return result
+        if "or" in filters:
+            result = set()
+            for item in filters["or"]:
+                result |= self._evaluate(item)
+            return result
+        if "property" not in filters:
+            raise ValueError(f"Filtro não suportado localmente: {filters}")
+
+        name = filters["property"]
+        property_type = self.schema.get(name)
+        if property_type is None:
+            raise ValueError(f"Propriedade desconhecida: {name}")
+        condition = filters.get(property_type)
+        if condition is None:
+            raise ValueError(f"Filtro de {name} não é do tipo {property_type}")
+
+        formula_type = None
+        if property_type == "formula":
+            formula_type, condition = next(iter(condition.items()))
+        operator, argument = next(iter(condition.items()))
+        return self._index(name, property_type, formula_type).evaluate(operator, argument)
@@ -1,17 +1,33 @@
-import pandas as pd
-from typing import Dict
+import copy
+import time
+from typing import Dict, Iterable, Union
 from notion_alchemy.notion import *
+from notion_alchemy.decoder import ColumnDecoder
+from notion_alchemy.instrumentation import DecodeEvent, Instrumentation
+from notion_alchemy.jsonlib import loads
+from notion_alchemy.local_query import LocalQuery
+from notion_alchemy.parallel import ParallelDecoder, merge_columns
+from notion_alchemy.relations import attach_related, collect_relation_ids, relation_names
+from notion_alchemy.rows import ColumnSchema, Table, normalize_name
 
 class NotionDatabaseModel():
     """Classe Notion para represtação de databases"""
  
     _database_id: str = None
     _properties: Dict[str, NotionProperty] = {}
-    _properties_pages: list = []
-    _properties_data: Dict[str, Any] = {}
+    # preenchidos nas classes geradas por schema.compile_model
+    _schema_hash: str = None
+    _schema_decoder: ColumnDecoder = None
+    _column_schema: Dict[str, ColumnSchema] = None
 
-    def __init__(self, page: Dict):
-        self._database_id = page.get('id')         
+    def __init__(self, page: Dict = None):
+        if page is not None:
+            self._database_id = page.get('id')
+        # linhas e colunas são sempre da instância: nada vaza entre databases ou consultas
+        self._properties = dict(self.__class__._properties)
+        self._properties_pages: list = []
+        self._init_properties()
+        self._init_properties_data()
     
     def _init_properties(self):
         """Inicializa as propriedades com base nas anotações da classe"""
@@ -25,43 +41,158 @@ class NotionDatabaseModel():
     
     def _init_properties_data(self):
         self._properties_data = {prop_name:[] for prop_name in self.get_property_names()}
+        # edições feitas pelas Row (compartilhado com a Table e o LocalQuery)
+        self._column_versions = {}
+
+    def to_pandas(self, response: Union[dict, Iterable[dict]] = None, typed: bool = False) -> Dict[str, Any]:
+        """Monta o DataFrame; se receber um response (ou um stream deles) popula antes
+        
+        typed=True usa o dtype de cada tipo do Notion (datetime64, Float64, boolean,
+        category, listas do pyarrow) em vez de colunas object.
+        """
+        # pandas é opcional (extra "dataframe"): só é importado aqui
+        import pandas as pd
+        from notion_alchemy.dataframe import columns_to_frame
 
-    def to_pandas(self) -> Dict[str, Any]:
+        if response is not None:
+            self.populate(response)
+        if typed:
+            return columns_to_frame(self._properties_data, self._get_decoder().schema)
         df = pd.DataFrame(self._properties_data)
         df.set_index('page_id', inplace=True)
         return df
 
-    #ajustar o retorno de valores
-    def populate(self, response: dict):
-        """ cria um dicionario de proprieddades e popula o modelo com os dados das páginas"""
-        page_init_value =len(self._properties_pages)
+    def local_query(self) -> LocalQuery:
+        """Filtros avaliados localmente sobre as linhas já carregadas, sem chamar a API"""
+        query = self.__dict__.get('_local_query')
+        if query is None or query.columns is not self._properties_data:
+            query = LocalQuery(self._properties_data, self._get_decoder().schema, self._column_versions)
+            self._local_query = query
+        return query
+
+    def filter(self, filters: Union[dict, list]) -> Dict[str, list]:
+        """Colunas só com as linhas que passam no filtro (ex: self.tags.contains('Casa'))"""
+        return self.local_query().select(filters)
+
+    def to_parquet(self, path: str, response: Union[dict, Iterable[dict]] = None, **kwargs) -> None:
+        """Escreve o DataFrame tipado em parquet (precisa do pyarrow)"""
+        from notion_alchemy.dataframe import write_parquet
 
-        response = response.get('results', [])
+        write_parquet(self.to_pandas(response, typed=True), path, **kwargs)
 
-        for page in response:
-            page_model = NotionDatabaseModel.from_notion(page)
-            self._properties_pages.append(page_model)
-            self._properties_data['page_id'].append(page_model._database_id)
+    def _get_decoder(self) -> ColumnDecoder:
+        """Compila o schema uma vez por modelo (nome da propriedade -> tipo)"""
+        decoder = self.__dict__.get('_decoder') or self._schema_decoder
+        if decoder is None:
+            decoder = ColumnDecoder({prop.name: prop.dtype for prop in self._properties.values()})
+            self._decoder = decoder
+        return decoder
 
-            for prop_name, prop_obj in page_model._properties.items():
-                if prop_obj.name not in self._properties_data.keys():
-                    self._properties_data[prop_obj.name] = []
-                self._properties_data[prop_obj.name].append(prop_obj.value)
+    def _get_table(self, keep_raw: bool = False) -> Table:
+        """Table compartilhada pelas linhas (Row) deste modelo"""
+        table = self.__dict__.get('_table')
+        if table is None or table.columns is not self._properties_data:
+            schema = self._column_schema or {
+                prop.name: ColumnSchema(prop.name, prop.dtype, prop.property_id)
+                for prop in self._properties.values()
+                if prop.name in self._get_decoder().schema
+            }
+            table = Table(
+                self._properties_data,
+                schema,
+                related=self.__dict__.get('_related'),
+                versions=self._column_versions,
+            )
+            self._table = table
+        if keep_raw and table.raw is None:
+            # páginas carregadas antes ficam sem o JSON, mas as posições continuam alinhadas
+            table.raw = [None] * len(self._properties_data['page_id'])
+        return table
+
+    #ajustar o retorno de valores
+    def populate(
+        self,
+        response: Union[dict, Iterable[dict]],
+        keep_pages: bool = False,
+        keep_raw: bool = False,
+        columns: Iterable[str] = None,
+        instrumentation: Instrumentation = None,
+        workers: int = None,
+        page_size: int = 100,
+    ):
+        """ cria um dicionario de proprieddades e popula o modelo com os dados das páginas
         
-        return f'o database foi populado com sucesso, contém {len(self._properties_pages)- page_init_value} páginas.'
+        Aceita um único response da API ou um iterável de responses (ex: NotionClient.iter_query_pages),
+        consumido página a página para não manter todo o resultado em memória.
+        As colunas são preenchidas pelo ColumnDecoder; keep_pages=True também guarda uma Row
+        por página em _properties_pages (necessário para editar as linhas), e keep_raw=True
+        guarda junto o JSON original de cada página. columns limita o parse a essas
+        propriedades; as outras ficam com None. instrumentation recebe um DecodeEvent
+        ("populate") por response, com o tempo de parse e a quantidade de linhas.
+        Cada response também pode ser o corpo cru (bytes) da resposta, como em
+        NotionClient.iter_query_content. workers=N decodifica em N processos
+        (parallel.ParallelDecoder), em lotes juntados na mesma ordem; só compensa
+        para resultados grandes, e com corpos crus o JSON original não volta, então
+        não combina com keep_raw. page_size é o da query que gerou os corpos crus,
+        usado para montar os lotes sem abri-los.
+        """
+        decoder = self._get_decoder()
+        if columns is not None:
+            decoder = ColumnDecoder(decoder.schema, columns)
+        table = self._get_table(keep_raw) if keep_pages or keep_raw else self.__dict__.get('_table')
+        total = 0
+
+        if isinstance(response, (dict, bytes, str)):
+            response = [response]
+
+        parallel = ParallelDecoder(decoder, workers, page_size=page_size) if workers else None
+        # (results, colunas já decodificadas pelo pool ou None para decodificar aqui)
+        batches = parallel.map(response) if parallel else (
+            ((loads(data) if isinstance(data, (bytes, str)) else data).get('results', []), None) for data in response
+        )
+
+        try:
+            for results, chunk in batches:
+                if results is None and table is not None and table.raw is not None:
+                    raise ValueError("keep_raw needs parsed responses; raw bodies decoded by workers are not kept")
+                if instrumentation is not None:
+                    started_at, started = time.time(), time.perf_counter()
+                start = len(self._properties_data['page_id'])
+                if chunk is None:
+                    decoded = decoder.decode(results, self._properties_data)
+                else:
+                    decoded = merge_columns(self._properties_data, chunk)
+                total += decoded
+                if keep_pages:
+                    self._properties_pages.extend(table.rows(start))
+                if table is not None and table.raw is not None:
+                    table.raw.extend(results)
+                if instrumentation is not None:
+                    instrumentation.on_decode(DecodeEvent('populate', time.perf_counter() - started, rows=decoded, start=started_at))
+        finally:
+            if parallel is not None:
+                parallel.close()
+
+        return f'o database foi populado com sucesso, contém {total} páginas.'
 
     @classmethod
     def from_notion(cls, page: Dict) -> None:
-        """Converte do formato Notion para o modelo"""
+        """Converte do formato Notion para o modelo
+
+        Descobre o schema de novo a cada chamada; para reaproveitar o schema entre
+        consultas use schema.SchemaRegistry (NotionClient.database_model).
+        """
         instance = cls(page)
         instance._database_id = page.get('id')
+        # cada página/database tem o próprio dicionário, senão todas as linhas compartilham os mesmos valores
+        instance._properties = {}
 
         for prop_name,prop_values in page.get('properties',{}).items():
             
-            prop_name_tratada = prop_name.strip().lower().replace(' ', '_')
+            prop_name_tratada = normalize_name(prop_name)
             prop_type = prop_values.get('type')
 
-            if prop_name not in instance._properties:
+            if prop_name_tratada not in instance._properties:
                 instance._properties[prop_name_tratada] = create_property(name=prop_name, property_type=prop_type, raw_data=prop_values)
         
         instance._init_properties()
@@ -71,15 +202,55 @@ class NotionDatabaseModel():
     
     #validar se funciona
     #feito por ia 
-    def to_notion(self) -> Dict:
+    def to_notion(self, only_dirty: bool = False) -> Dict:
         """
         Converte o modelo para o formato de propriedades esperado pela API do Notion.
+        Com only_dirty=True manda só o que mudou desde o from_notion, e uma propriedade
+        esvaziada vai como null para ser limpa no Notion. Sem only_dirty, células vazias
+        (os "None"/["None"] dos parsers) não são enviadas.
         """
         return {
-            prop_name: prop_obj.to_notion()
-            for prop_name, prop_obj in self._properties.items()
-            if prop_obj.value is not None
+            prop_obj.name: prop_obj.to_notion()
+            for prop_obj in self._properties.values()
+            if (prop_obj.is_dirty if only_dirty else not is_empty(prop_obj.value))
+            and is_writable(prop_obj.dtype, prop_obj.value)
         }
+
+    def mark_clean(self, names: Iterable[str] = None) -> None:
+        """Marca as propriedades como enviadas (só as de names, pelo nome do Notion, se passado)"""
+        for prop_obj in self._properties.values():
+            if names is None or prop_obj.name in names:
+                prop_obj.mark_clean()
+
+    def relation_ids(self, names: Iterable[str] = None) -> list:
+        """Ids distintos das páginas relacionadas nas linhas carregadas (todas as relations ou só names)"""
+        return collect_relation_ids(self._properties_data, relation_names(self._get_decoder().schema, names))
+
+    def attach_relations(self, pages: Dict[str, Dict], names: Iterable[str] = None) -> Dict[str, list]:
+        """Guarda, para cada linha, as páginas relacionadas já buscadas (page_id -> página)
+
+        Fica em self._related[nome] alinhado com _properties_data e em row.related(nome).
+        """
+        related = attach_related(self._properties_data, relation_names(self._get_decoder().schema, names), pages)
+        if '_related' not in self.__dict__:
+            self._related = {}
+        self._related.update(related)
+        table = self.__dict__.get('_table')
+        if table is not None:
+            table.related = self._related
+        return related
+
+    def duplicated_page_ids(self, prop_name: str) -> list:
+        """Ids das páginas cujo valor em prop_name já apareceu antes (mantém a primeira)"""
+        seen = set()
+        duplicated = []
+        for page_id, value in zip(self._properties_data['page_id'], self._properties_data[prop_name]):
+            key = tuple(value) if isinstance(value, list) else value
+            if key in seen:
+                duplicated.append(page_id)
+            else:
+                seen.add(key)
+        return duplicated
        
 #feito por ia 
 class NotionModel:
@@ -87,9 +258,13 @@ class NotionModel:
     
     _database_id: str = None
     _properties: Dict[str, NotionProperty] = {}
+    # False descarta o JSON original de cada propriedade depois do parse
+    _keep_raw: bool = True
     
     def __init__(self, **kwargs):
         self.id = kwargs.get('id')
+        # cópia por instância: as propriedades declaradas na classe guardam o estado de "dirty"
+        self._properties = {}
         self._init_properties()
         
         for name, value in kwargs.items():
@@ -102,7 +277,7 @@ class NotionModel:
             if name.startswith('_'):
                 continue
             if hasattr(self.__class__, name) and isinstance(getattr(self.__class__, name), NotionProperty):
-                self._properties[name] = getattr(self.__class__, name)
+                self._properties[name] = copy.deepcopy(getattr(self.__class__, name))
             else:
                 # Default to text property if not specified
                 self._properties[name] = RichTextProperty(name)
@@ -115,17 +290,34 @@ class NotionModel:
         
         for prop_name, prop in instance._properties.items():
             if prop_name in page_data['properties']:
-                prop.from_notion(page_data['properties'][prop_name])
+                prop.from_notion(page_data['properties'][prop_name], keep_raw=cls._keep_raw)
         
         return instance
     
-    def to_notion_properties(self) -> Dict:
-        """Convert model to Notion API properties format"""
+    def to_notion_properties(self, only_dirty: bool = False) -> Dict:
+        """Convert model to Notion API properties format, optionally only the changed ones
+
+        Changed properties that were cleared are sent as null (ex: {"select": None}).
+        """
         return {
             name: prop.to_notion()
             for name, prop in self._properties.items()
-            if prop.value is not None
+            if (prop.is_dirty if only_dirty else not is_empty(prop.value))
         }
+
+    def dirty_properties(self) -> Dict[str, NotionProperty]:
+        """Properties changed since the model was loaded with from_notion"""
+        return {name: prop for name, prop in self._properties.items() if prop.is_dirty}
+
+    @property
+    def is_dirty(self) -> bool:
+        return any(prop.is_dirty for prop in self._properties.values())
+
+    def mark_clean(self, names: Iterable[str] = None) -> None:
+        """Mark properties as saved; only the ones in names (as in to_notion_properties) if given"""
+        for name, prop in self._properties.items():
+            if names is None or name in names:
+                prop.mark_clean()
     
     def __getattr__(self, name):
         if name in self._properties:
@@ -1,9 +1,95 @@
+import copy
+
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict, Optional, Any, List
+from datetime import date, datetime
+from typing import Dict, Optional, Any, List, Union
 
 from abc import ABC, abstractmethod
 
+class Filter(dict):
+    """Filtro do Notion que continua sendo um dict, mas pode ser combinado com & e |.
+
+    (a & b) | c vira {"or": [{"and": [a, b]}, c]}; operações iguais em sequência
+    são achatadas, então a & b & c vira um único "and" com três filtros.
+    """
+
+    def __and__(self, other: Dict) -> "Filter":
+        return Filter._combine("and", self, other)
+
+    def __rand__(self, other: Dict) -> "Filter":
+        return Filter._combine("and", other, self)
+
+    def __or__(self, other: Dict) -> "Filter":
+        return Filter._combine("or", self, other)
+
+    def __ror__(self, other: Dict) -> "Filter":
+        return Filter._combine("or", other, self)
+
+    def __ior__(self, other: Dict) -> "Filter":
+        # sem isso f |= g cairia no dict.__ior__ e juntaria as chaves dos dois filtros
+        return self | other
+
+    @staticmethod
+    def _combine(operator: str, left: Dict, right: Dict) -> "Filter":
+        items = []
+        for item in (left, right):
+            if list(item.keys()) == [operator]:
+                items.extend(item[operator])
+            else:
+                items.append(item)
+        return Filter({operator: items})
+
+    def depth(self) -> int:
+        """Níveis de and/or aninhados (a API aceita no máximo 2)"""
+        return filter_depth(self)
+
+
+def filter_depth(filters: Dict) -> int:
+    for operator in ("and", "or"):
+        if operator in filters:
+            return 1 + max((filter_depth(item) for item in filters[operator]), default=0)
+    return 0
+
+
+def sort_by_timestamp(timestamp: str = "last_edited_time", direction: str = "ascending") -> Dict:
+    """Sort por created_time/last_edited_time da página"""
+    return {"timestamp": timestamp, "direction": direction}
+
+
+def timestamp_filter(timestamp: str, operator: str, value: Any) -> Filter:
+    """Filtro por created_time/last_edited_time, ex: timestamp_filter("last_edited_time", "on_or_after", iso)"""
+    return Filter({"timestamp": timestamp, timestamp: {operator: value}})
+
+
+# marca de "_original ainda é o parse do raw_data", sem precisar parsear para guardar
+_UNPARSED = object()
+
+
+class LazyValue:
+    """Descriptor do NotionProperty.value: o raw_data só é parseado no primeiro acesso.
+
+    O resultado fica guardado no __dict__ da instância, então colunas que o código
+    nunca lê não pagam o custo de _parse_value (datas, listas de rich text...).
+    """
+
+    def __init__(self, default: Any = "None"):
+        self.default = default
+
+    def __get__(self, instance, owner=None) -> Any:
+        if instance is None:
+            # o dataclass usa isso como default do campo
+            return self.default
+        values = instance.__dict__
+        try:
+            return values["_value"]
+        except KeyError:
+            value = values["_value"] = instance._parse_value(values.get("raw_data") or {})
+            return value
+
+    def __set__(self, instance, value: Any) -> None:
+        instance.__dict__["_value"] = value
+
+
 # essa classe de options ta meio perdida aqui coitada kkkkkkk
 @dataclass
 class OptionProperty:
@@ -17,26 +103,60 @@ class NotionProperty(ABC):
     property_id: str = ""
     name: str = ""
     dtype: str = ""
-    value: Any = "None"
+    value: Any = LazyValue("None")
     raw_data: Dict = field(default_factory=dict)
+    # valor carregado do Notion, usado para saber se a propriedade foi alterada
+    _original: Any = field(default=_UNPARSED, init=False, repr=False, compare=False)
 
 
     def __post_init__(self):
-        self.value = self._parse_value(self.raw_data)
+        self._reset()
     
-    def from_notion(self, data: Dict) -> None:
+    def from_notion(self, data: Dict, keep_raw: bool = True) -> None:
         self.raw_data = data
-        self.value = self._parse_value(data)
+        self._reset()
+        if not keep_raw:
+            # keep_raw=False parseia já e descarta o JSON original para economizar memória
+            self.mark_clean()
+            self.raw_data = {}
+
+    def _reset(self) -> None:
+        """Volta para o estado "carregado": value será parseado do raw_data quando lido"""
+        self.__dict__.pop("_value", None)
+        self._original = _UNPARSED
+
+    def mark_clean(self) -> None:
+        # deepcopy para pegar alterações feitas direto na lista (ex: multi_select.append)
+        self._original = copy.deepcopy(self.value)
+
+    @property
+    def is_dirty(self) -> bool:
+        if "_value" not in self.__dict__:
+            # nunca lido nem alterado
+            return False
+        original = self._original
+        if original is _UNPARSED:
+            original = self._parse_value(self.raw_data)
+        return self.value != original
 
     def to_notion(self) -> Dict:
         return self._format_value(self.value)
 
+    def ascending(self) -> Dict:
+        return {"property": self.name, "direction": "ascending"}
+
+    def descending(self) -> Dict:
+        return {"property": self.name, "direction": "descending"}
+
+    # estático para o decoder colunar (decoder.py) usar sem instanciar uma propriedade por célula
+    @staticmethod
     @abstractmethod
-    def _parse_value(self, data: Dict) -> Any:
+    def _parse_value(data: Dict) -> Any:
         pass
     
+    @staticmethod
     @abstractmethod
-    def _format_value(self, value: Any) -> Dict:
+    def _format_value(value: Any) -> Dict:
         pass
     
 
@@ -44,278 +164,329 @@ class NotionProperty(ABC):
 class TitleProperty(NotionProperty):
     dtype: str = "title"
 
-    def _parse_value(self, data: Dict) -> str:
-        return "".join([t["plain_text"] for t in data.get("title", ["None"])])
+    @staticmethod
+    def _parse_value(data: Dict) -> str:
+        return "".join([t["plain_text"] for t in data.get("title", [{"plain_text": "None"}])])
 
-    def _format_value(self, value: str) -> Dict:
+    @staticmethod
+    def _format_value(value: str) -> Dict:
+        if is_empty(value):
+            return {"title": []}
         return {"title": [{"text": {"content": value}}]}
 
-    def contains(self, value): return {
-        "property": self.name, self.dtype: {"contains": value}}
+    def contains(self, value): return Filter({
+        "property": self.name, self.dtype: {"contains": value}})
 
-    def does_not_contain(self, value): return {
-        "property": self.name, self.dtype: {"does_not_contain": value}}
+    def does_not_contain(self, value): return Filter({
+        "property": self.name, self.dtype: {"does_not_contain": value}})
 
-    def starts_with(self, value): return {
-        "property": self.name, self.dtype: {"starts_with": value}}
-    def ends_with(self, value): return {
-        "property": self.name, self.dtype: {"ends_with": value}}
+    def starts_with(self, value): return Filter({
+        "property": self.name, self.dtype: {"starts_with": value}})
+    def ends_with(self, value): return Filter({
+        "property": self.name, self.dtype: {"ends_with": value}})
 
 @dataclass
 class RichTextProperty(NotionProperty):
     dtype: str = "rich_text"
 
 
-    def _parse_value(self, data: Dict) -> str:
-        return "".join([t["plain_text"] for t in data.get("rich_text", ["None"])])
+    @staticmethod
+    def _parse_value(data: Dict) -> str:
+        return "".join([t["plain_text"] for t in data.get("rich_text", [{"plain_text": "None"}])])
 
-    def _format_value(self, value: str) -> Dict:
+    @staticmethod
+    def _format_value(value: str) -> Dict:
+        if is_empty(value):
+            return {"rich_text": []}
         return {"rich_text": [{"text": {"content": value}}]}
 
-    def contains(self, value): return {
-        "property": self.name, self.dtype: {"contains": value}}
+    def contains(self, value): return Filter({
+        "property": self.name, self.dtype: {"contains": value}})
 
-    def does_not_contain(self, value): return {
-        "property": self.name, self.dtype: {"does_not_contain": value}}
+    def does_not_contain(self, value): return Filter({
+        "property": self.name, self.dtype: {"does_not_contain": value}})
 
-    def starts_with(self, value): return {
-        "property": self.name, self.dtype: {"starts_with": value}}
-    def ends_with(self, value): return {
-        "property": self.name, self.dtype: {"ends_with": value}}
+    def starts_with(self, value): return Filter({
+        "property": self.name, self.dtype: {"starts_with": value}})
+    def ends_with(self, value): return Filter({
+        "property": self.name, self.dtype: {"ends_with": value}})
 
 @dataclass
 class StatusProperty(NotionProperty):
     dtype: str = "status"
 
-    def _parse_value(self, data: Dict) -> Optional[str]:
+    @staticmethod
+    def _parse_value(data: Dict) -> Optional[str]:
         status = data.get("status")
         return status.get("name","") if status else "None"
 
-    def _format_value(self, value: str) -> Dict:
+    @staticmethod
+    def _format_value(value: str) -> Dict:
+        if is_empty(value):
+            return {"status": None}
         return {"status": {"name": value}}
 
-    def equals(self, value): return {
-        "property": self.name, self.dtype: {"equals": value}}
+    def equals(self, value): return Filter({
+        "property": self.name, self.dtype: {"equals": value}})
 
-    def does_not_equal(self, value): return {
-        "property": self.name, self.dtype: {"does_not_equal": value}}
+    def does_not_equal(self, value): return Filter({
+        "property": self.name, self.dtype: {"does_not_equal": value}})
 
-    def is_empty(self): return {
-        "property": self.name, self.dtype: {"is_empty": True}}
-    def is_not_empty(self): return {
-        "property": self.name, self.dtype: {"is_not_empty": True}}
+    def is_empty(self): return Filter({
+        "property": self.name, self.dtype: {"is_empty": True}})
+    def is_not_empty(self): return Filter({
+        "property": self.name, self.dtype: {"is_not_empty": True}})
 
 @dataclass
 class NumberProperty(NotionProperty):
     dtype: str = "number"
-    value: Optional[float] = 0
+    value: Optional[float] = LazyValue(0)
 
 
-    def _parse_value(self, data: Dict) -> Optional[float]:
+    @staticmethod
+    def _parse_value(data: Dict) -> Optional[float]:
         return data.get("number")
 
-    def _format_value(self, value: float) -> Dict:
+    @staticmethod
+    def _format_value(value: float) -> Dict:
+        if is_empty(value):
+            return {"number": None}
         return {"number": value}
 
-    def greater_than(self, value): return {
-        "property": self.name, self.dtype: {"greater_than": value}}
+    def greater_than(self, value): return Filter({
+        "property": self.name, self.dtype: {"greater_than": value}})
 
-    def less_than(self, value): return {
-        "property": self.name, self.dtype: {"less_than": value}}
+    def less_than(self, value): return Filter({
+        "property": self.name, self.dtype: {"less_than": value}})
 
-    def greater_than_or_equal_to(self, value): return {
-        "property": self.name, self.dtype: {"greater_than_or_equal_to": value}}
-    def less_than_or_equal_to(self, value): return {
-        "property": self.name, self.dtype: {"less_than_or_equal_to": value}}
+    def greater_than_or_equal_to(self, value): return Filter({
+        "property": self.name, self.dtype: {"greater_than_or_equal_to": value}})
+    def less_than_or_equal_to(self, value): return Filter({
+        "property": self.name, self.dtype: {"less_than_or_equal_to": value}})
 
 @dataclass
 class CheckboxProperty(NotionProperty):
     dtype: str = "checkbox" 
-    value: bool = False
+    value: bool = LazyValue(False)
 
 
-    def _parse_value(self, data: Dict) -> Optional[bool]:
+    @staticmethod
+    def _parse_value(data: Dict) -> Optional[bool]:
         return data.get("checkbox")
 
-    def _format_value(self, value: bool) -> Dict:
+    @staticmethod
+    def _format_value(value: bool) -> Dict:
+        # checkbox não aceita null: vazio é desmarcado
+        if is_empty(value):
+            return {"checkbox": False}
         return {"checkbox": value}
 
-    def equals(self, value: bool): return {
-        "property": self.name, self.dtype: {"equals": value}}
+    def equals(self, value: bool): return Filter({
+        "property": self.name, self.dtype: {"equals": value}})
 
 @dataclass
 class SelectProperty(NotionProperty):
     dtype: str = "select"
 
-    def _parse_value(self, data: Dict) -> Optional[str]:
+    @staticmethod
+    def _parse_value(data: Dict) -> Optional[str]:
         select = data.get("select")
         return select.get("name","None") if select else "None"
 
-    def _format_value(self, value: str) -> Dict:
+    @staticmethod
+    def _format_value(value: str) -> Dict:
+        if is_empty(value):
+            return {"select": None}
         return {"select": {"name": value}}
 
 @dataclass
 class MultiSelectProperty(NotionProperty):
     dtype: str = "multi_select"
 
-    def _parse_value(self, data: Dict) -> Optional[List[str]]:
+    @staticmethod
+    def _parse_value(data: Dict) -> Optional[List[str]]:
         # Extrai os nomes das opções selecionadas
         multi_select = data.get("multi_select")
         if multi_select and isinstance(multi_select, list):
             return [opt.get("name") for opt in multi_select]
         return ["None"]
     
-    def _format_value(self, value: List[str]) -> Dict:
+    @staticmethod
+    def _format_value(value: List[str]) -> Dict:
         # Formata para o padrão esperado pela API do Notion
+        if is_empty(value):
+            return {"multi_select": []}
         return {"multi_select": [{"name": v} for v in value]}
 
-    def contains(self, value): return {
-        "property": self.name, self.dtype: {"contains": value}}
-    def does_not_contain(self, value): return {
-        "property": self.name, self.dtype: {"does_not_contain": value}}
+    def contains(self, value): return Filter({
+        "property": self.name, self.dtype: {"contains": value}})
+    def does_not_contain(self, value): return Filter({
+        "property": self.name, self.dtype: {"does_not_contain": value}})
 
 @dataclass
 class DateProperty(NotionProperty):
     dtype: str = "date"
 
-    def _parse_value(self, data: Dict) -> Optional[datetime]:
+    @staticmethod
+    def _parse_value(data: Dict) -> Optional[datetime]:
         date_data = data.get("date")
         if not date_data:
             return "None"
         return datetime.fromisoformat(date_data["start"])
 
-    def _format_value(self, value: datetime) -> Dict:
-        return {"date": {"start": value.isoformat()}}
+    @staticmethod
+    def _format_value(value: Union[datetime, date, str]) -> Dict:
+        if value in EMPTY_VALUES:
+            # "None" é o valor de data vazia devolvido pelo _parse_value
+            return {"date": None}
+        if isinstance(value, (datetime, date)):
+            value = as_date(value).isoformat()
+        # strings já vêm em ISO 8601 ("2024-05-01")
+        return {"date": {"start": value}}
 
-    def before(self, value): return {
-        "property": self.name, self.dtype: {"before": value}}
+    def before(self, value): return Filter({
+        "property": self.name, self.dtype: {"before": value}})
 
-    def after(self, value): return {
-        "property": self.name, self.dtype: {"after": value}}
+    def after(self, value): return Filter({
+        "property": self.name, self.dtype: {"after": value}})
 
-    def on_or_before(self, value): return {
-        "property": self.name, self.dtype: {"on_or_before": value}}
+    def on_or_before(self, value): return Filter({
+        "property": self.name, self.dtype: {"on_or_before": value}})
 
-    def on_or_after(self, value): return {
-        "property": self.name, self.dtype: {"on_or_after": value}}
+    def on_or_after(self, value): return Filter({
+        "property": self.name, self.dtype: {"on_or_after": value}})
 
-    def past_week(self): return {
-        "property": self.name, self.dtype: {"past_week": {}}}
+    def past_week(self): return Filter({
+        "property": self.name, self.dtype: {"past_week": {}}})
 
-    def past_month(self): return {
-        "property": self.name, self.dtype: {"past_month": {}}}
+    def past_month(self): return Filter({
+        "property": self.name, self.dtype: {"past_month": {}}})
 
-    def past_year(self): return {
-        "property": self.name, self.dtype: {"past_year": {}}}
+    def past_year(self): return Filter({
+        "property": self.name, self.dtype: {"past_year": {}}})
 
-    def this_week(self): return {
-        "property": self.name, self.dtype: {"this_week": {}}}
+    def this_week(self): return Filter({
+        "property": self.name, self.dtype: {"this_week": {}}})
 
-    def next_week(self): return {
-        "property": self.name, self.dtype: {"next_week": {}}}
+    def next_week(self): return Filter({
+        "property": self.name, self.dtype: {"next_week": {}}})
 
-    def this_month(self): return {
-        "property": self.name, self.dtype: {"this_month": {}}}
+    def this_month(self): return Filter({
+        "property": self.name, self.dtype: {"this_month": {}}})
 
-    def next_month(self): return {
-        "property": self.name, self.dtype: {"next_month": {}}}
+    def next_month(self): return Filter({
+        "property": self.name, self.dtype: {"next_month": {}}})
 
-    def this_year(self): return {
-        "property": self.name, self.dtype: {"this_year": {}}}
-    def next_year(self): return {
-        "property": self.name, self.dtype: {"next_year": {}}}
+    def this_year(self): return Filter({
+        "property": self.name, self.dtype: {"this_year": {}}})
+    def next_year(self): return Filter({
+        "property": self.name, self.dtype: {"next_year": {}}})
 
 @dataclass
 class PeopleProperty(NotionProperty):
     dtype: str = "people"
 
-    def _parse_value(self, data: Dict) -> Optional[list]:
+    @staticmethod
+    def _parse_value(data: Dict) -> Optional[list]:
         # Extrai lista de nomes das pessoas
         people = data.get("people")
         if people and isinstance(people, list):
             return [p.get("name") for p in people]
         return ["none"]
 
-    def _format_value(self, value: list) -> Dict:
+    @staticmethod
+    def _format_value(value: list) -> Dict:
         # Espera uma lista de nomes (ou ids, dependendo do uso)
+        if is_empty(value):
+            return {"people": []}
         return {"people": value}
 
-    def contains(self, value): return {
-        "property": self.name, self.dtype: {"contains": value}}
-    def does_not_contain(self, value): return {
-        "property": self.name, self.dtype: {"does_not_contain": value}}
+    def contains(self, value): return Filter({
+        "property": self.name, self.dtype: {"contains": value}})
+    def does_not_contain(self, value): return Filter({
+        "property": self.name, self.dtype: {"does_not_contain": value}})
 
 @dataclass
 class FilesProperty(NotionProperty):
     dtype: str = "files"
 
-    def _parse_value(self, data: Dict) -> Optional[list]:
+    @staticmethod
+    def _parse_value(data: Dict) -> Optional[list]:
         files = data.get("files")
         if files and isinstance(files, list):
             return [f.get("name") for f in files]
         return ["None"]
 
-    def _format_value(self, value: list) -> Dict:
+    @staticmethod
+    def _format_value(value: list) -> Dict:
         # Espera uma lista de arquivos (nomes ou urls)
+        if is_empty(value):
+            return {"files": []}
         return {"files": value}
 
 @dataclass
 class RelationProperty(NotionProperty):
     dtype: str = "relation"
 
-    def _parse_value(self, data: Dict) -> Optional[list]:
+    @staticmethod
+    def _parse_value(data: Dict) -> Optional[list]:
         relation = data.get("relation",{})
         if relation and isinstance(relation, list):
             return [r.get("id","None") for r in relation]
         return ["None"]
 
-    def _format_value(self, value: list) -> Dict:
+    @staticmethod
+    def _format_value(value: list) -> Dict:
         # Espera uma lista de ids de páginas relacionadas
+        if is_empty(value):
+            return {"relation": []}
         return {"relation": [{"id": v} for v in value]}
 
-    def contains(self, value): return {
-        "property": self.name, self.dtype: {"contains": value}}
-    def does_not_contain(self, value): return {
-        "property": self.name, self.dtype: {"does_not_contain": value}}
+    def contains(self, value): return Filter({
+        "property": self.name, self.dtype: {"contains": value}})
+    def does_not_contain(self, value): return Filter({
+        "property": self.name, self.dtype: {"does_not_contain": value}})
 
 @dataclass
 class FormulaProperty(NotionProperty):
     dtype: str = "formula"
 
-    def _parse_value(self, data: Dict) -> Any:
+    @staticmethod
+    def _parse_value(data: Dict) -> Any:
         # Retorna o valor bruto da fórmula (pode ser string, number, boolean, date)
         return data.get("formula")
 
-    def _format_value(self, value: Any) -> Dict:
+    @staticmethod
+    def _format_value(value: Any) -> Dict:
         # Fórmulas são calculadas pelo Notion, geralmente não são enviadas
         return {"formula": value}
 
-    def string_contains(self, value): return {
-        "property": self.name, self.dtype: {"string": {"contains": value}}}
+    def string_contains(self, value): return Filter({
+        "property": self.name, self.dtype: {"string": {"contains": value}}})
 
-    def string_starts_with(self, value): return {
-        "property": self.name, self.dtype: {"string": {"starts_with": value}}}
+    def string_starts_with(self, value): return Filter({
+        "property": self.name, self.dtype: {"string": {"starts_with": value}}})
 
-    def string_ends_with(self, value): return {
-        "property": self.name, self.dtype: {"string": {"ends_with": value}}}
+    def string_ends_with(self, value): return Filter({
+        "property": self.name, self.dtype: {"string": {"ends_with": value}}})
 
-    def number_equals(self, value): return {
-        "property": self.name, self.dtype: {"number": {"equals": value}}}
+    def number_equals(self, value): return Filter({
+        "property": self.name, self.dtype: {"number": {"equals": value}}})
 
-    def number_greater_than(self, value): return {
-        "property": self.name, self.dtype: {"number": {"greater_than": value}}}
+    def number_greater_than(self, value): return Filter({
+        "property": self.name, self.dtype: {"number": {"greater_than": value}}})
 
-    def number_less_than(self, value): return {
-        "property": self.name, self.dtype: {"number": {"less_than": value}}}
+    def number_less_than(self, value): return Filter({
+        "property": self.name, self.dtype: {"number": {"less_than": value}}})
 
-    def checkbox_equals(self, value): return {
-        "property": self.name, self.dtype: {"checkbox": {"equals": value}}}
+    def checkbox_equals(self, value): return Filter({
+        "property": self.name, self.dtype: {"checkbox": {"equals": value}}})
 
-    def date_before(self, value): return {
-        "property": self.name, self.dtype: {"date": {"before": value}}}
+    def date_before(self, value): return Filter({
+        "property": self.name, self.dtype: {"date": {"before": value}}})
 
-    def date_after(self, value): return {
-        "property": self.name, self.dtype: {"date": {"after": value}}}
+    def date_after(self, value): return Filter({
+        "property": self.name, self.dtype: {"date": {"after": value}}})
 
 # Mapeamento do tipo do Notion para a classe Python correspondente
 PROPERTY_TYPE_MAP = {
@@ -333,6 +504,57 @@ PROPERTY_TYPE_MAP = {
     "status": StatusProperty
 }
 
+# Valores que os _parse_value devolvem quando a célula está vazia
+EMPTY_VALUES = ("None", "none", None)
+
+
+def normalize_id(resource_id: str) -> str:
+    """Id sem hífens, para usar como chave: o Notion aceita ids com e sem hífen"""
+    return resource_id.replace("-", "")
+
+
+def is_empty(value: Any) -> bool:
+    """Célula vazia: None, "None"/"none" ou lista vazia/só com esses (ex: ["None"] dos parsers de lista)"""
+    if isinstance(value, list):
+        return all(item in EMPTY_VALUES for item in value)
+    return isinstance(value, str) and value in EMPTY_VALUES or value is None
+
+# Tipos calculados pelo Notion, não podem ser enviados em create/update
+READ_ONLY_TYPES = {"formula"}
+
+# O _parse_value guarda só os nomes, que a API não aceita de volta
+NAME_ONLY_TYPES = {"people", "files"}
+
+
+def is_writable(property_type: str, value: Any) -> bool:
+    """Se o valor pode ir num create/update: fórmulas nunca; people/files só já no formato da API"""
+    if property_type in READ_ONLY_TYPES:
+        return False
+    if property_type in NAME_ONLY_TYPES and not is_empty(value):
+        # ex: [{"id": "..."}] ou [{"name": "a.pdf", "external": {"url": "..."}}]
+        return isinstance(value, list) and all(isinstance(item, dict) for item in value)
+    return True
+
+
+def as_date(value: Union[datetime, date]) -> Union[datetime, date]:
+    """Data sem hora (o _parse_value devolve meia-noite sem fuso) vira date"""
+    if isinstance(value, datetime) and value.tzinfo is None and value.time() == datetime.min.time():
+        return value.date()
+    return value
+
+# Tipos cujo valor é uma lista; vazios, os parsers devolvem ["None"]
+LIST_TYPES = {"multi_select", "people", "files", "relation"}
+
+
+def clean_column(values: List[Any], property_type: str) -> List[Any]:
+    """Troca os valores "vazios" dos parsers ("None", ["None"]) por None/[] e abre as fórmulas"""
+    if property_type in LIST_TYPES:
+        return [[] if not value or value[0] in EMPTY_VALUES else value for value in values]
+    if property_type == "formula":
+        # {"type": "number", "number": 3} -> 3
+        return [value.get(value.get("type")) if isinstance(value, dict) else None for value in values]
+    return [None if value in EMPTY_VALUES else value for value in values]
+
 def get_property_class(property_type: str) -> type:
     if property_type in PROPERTY_TYPE_MAP:
         return PROPERTY_TYPE_MAP[property_type]
@@ -340,4 +562,4 @@ def get_property_class(property_type: str) -> type:
     
 def create_property(name: str, property_type: str, raw_data: Optional[Dict] = None) -> NotionProperty:
     prop_class = get_property_class(property_type)
-    return prop_class(name=name, raw_data=raw_data)
\ No newline at end of file
+    return prop_class(property_id=(raw_data or {}).get("id", ""), name=name, raw_data=raw_data)
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""Decode paralelo de resultados grandes em vários núcleos.
+
+O parse das propriedades (os _parse_value do notion.py) e do JSON é Python
+preso ao GIL; ParallelDecoder manda lotes para um pool de processos (ou de
+threads, num Python free-threaded 3.13t) e devolve as colunas de cada lote na
+ordem de entrada, prontas para juntar no modelo.
+
+Os lotes podem ser responses já parseados (dicts) ou os corpos crus das
+respostas (bytes, ver NotionClient.iter_query_content). Com bytes o worker faz
+também o loads e só as colunas voltam: mandar dicts para outro processo custa
+mais do que decodificá-los aqui.
+"""
+import os
+import sys
+
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from notion_alchemy.decoder import ColumnDecoder
+from notion_alchemy.jsonlib import loads
+
+# decoder compilado por processo worker, reaproveitado entre lotes do mesmo schema
+_worker_decoders: Dict[Tuple, ColumnDecoder] = {}
+
+
+def gil_enabled() -> bool:
+    """False num Python free-threaded com o GIL desligado"""
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def _decode_chunk(schema: Tuple[Tuple[str, str], ...], selected: Tuple[str, ...], chunk: List[Union[Dict, bytes]]) -> Dict[str, list]:
+    """Worker: decodifica páginas (dicts) ou corpos crus de respostas (bytes) em colunas novas"""
+    key = (schema, selected)
+    decoder = _worker_decoders.get(key)
+    if decoder is None:
+        decoder = _worker_decoders[key] = ColumnDecoder(dict(schema), selected)
+    columns = decoder.new_columns()
+    if chunk and isinstance(chunk[0], (bytes, str)):
+        for body in chunk:
+            decoder.decode(loads(body).get("results", []), columns)
+    else:
+        decoder.decode(chunk, columns)
+    return columns
+
+
+def _chunks(responses: Iterable[Union[Dict, bytes]], chunk_size: int, page_size: int = 100) -> Iterator[Tuple[Optional[List[Dict]], list]]:
+    """Lotes de até chunk_size páginas: (páginas, lote) para dicts e (None, corpos) para bytes
+
+    Corpos crus não são abertos aqui: cada um conta como page_size páginas (o
+    page_size da query que os gerou).
+    """
+    pages: List[Dict] = []
+    bodies: List[bytes] = []
+    for data in responses:
+        if isinstance(data, (bytes, str)):
+            bodies.append(data)
+            if len(bodies) * page_size >= chunk_size:
+                yield None, bodies
+                bodies = []
+            continue
+        results = data.get("results", [])
+        while results:
+            room = chunk_size - len(pages)
+            pages.extend(results[:room])
+            results = results[room:]
+            if len(pages) >= chunk_size:
+                yield pages, pages
+                pages = []
+    if pages:
+        yield pages, pages
+    if bodies:
+        yield None, bodies
+
+
+class ParallelDecoder:
+    """Decodifica lotes de páginas num pool, mantendo a ordem e um número limitado de lotes em voo.
+
+    Sem executor, cria um ProcessPoolExecutor com `workers` processos (ou um
+    ThreadPoolExecutor quando o GIL está desligado) e o fecha no close/`with`.
+    Lotes pequenos gastam mais indo e voltando do que decodificando:
+    chunk_size na casa dos milhares compensa. page_size é o da query que gerou
+    os corpos crus, para montar os lotes sem abri-los.
+    """
+
+    def __init__(self, decoder: ColumnDecoder, workers: int = None, chunk_size: int = 2000, executor: Executor = None, page_size: int = 100):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if not 1 <= page_size <= 100:
+            raise ValueError("page_size must be between 1 and 100")
+        self.page_size = page_size
+        self.decoder = decoder
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._owns_executor = executor is None
+        if executor is None:
+            if gil_enabled():
+                # importado aqui: concurrent.futures.process puxa o multiprocessing inteiro
+                from concurrent.futures import ProcessPoolExecutor
+                executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                executor = ThreadPoolExecutor(max_workers=self.workers)
+        self.executor = executor
+        self._schema = tuple(decoder.schema.items())
+        self._selected = tuple(name for name, _ in decoder.columns)
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def map(self, responses: Iterable[Union[Dict, bytes]]) -> Iterator[Tuple[Optional[List[Dict]], Dict[str, list]]]:
+        """Yield (results, columns) per chunk in input order, results is None for raw bodies.
+
+        No máximo 2 * workers lotes ficam em voo, então um stream grande não é
+        lido inteiro para a memória.
+        """
+        chunks = _chunks(responses, self.chunk_size, self.page_size)
+        in_flight = deque()
+
+        def submit(results: Optional[List[Dict]], chunk: list) -> None:
+            in_flight.append((results, self.executor.submit(_decode_chunk, self._schema, self._selected, chunk)))
+
+        for results, chunk in islice(chunks, 2 * self.workers):
+            submit(results, chunk)
+        while in_flight:
+            results, future = in_flight.popleft()
+            columns = future.result()
+            for more in islice(chunks, 1):
+                submit(*more)
+            yield results, columns
+
+    def decode(self, responses: Iterable[Union[Dict, bytes]], columns: Dict[str, list]) -> int:
+        """Append every page of every response to columns; returns how many pages were decoded"""
+        total = 0
+        for _, chunk in self.map(responses):
+            total += merge_columns(columns, chunk)
+        return total
+
+
+def merge_columns(columns: Dict[str, list], chunk: Dict[str, list]) -> int:
+    """Extend columns with a decoded chunk; returns how many rows were added"""
+    for name, values in chunk.items():
+        columns.setdefault(name, []).extend(values)
+    return len(chunk.get("page_id", ()))
@@ -0,0 +1,86 @@
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List
+
+from notion_alchemy.notion import EMPTY_VALUES, normalize_id
+
+
+def relation_names(schema: Dict[str, str], names: Iterable[str] = None) -> List[str]:
+    """Colunas de relação do schema (nome -> tipo); names restringe a algumas delas"""
+    relations = [name for name, dtype in schema.items() if dtype == "relation"]
+    if names is None:
+        return relations
+    unknown = [name for name in names if name not in relations]
+    if unknown:
+        raise ValueError(f"Propriedades que não são relation: {unknown}")
+    return list(names)
+
+
+def collect_relation_ids(columns: Dict[str, list], names: Iterable[str]) -> List[str]:
+    """Distinct related page ids across the given relation columns, in first-seen order"""
+    seen = set()
+    page_ids = []
+    for name in names:
+        for value in columns.get(name, ()):
+            for page_id in value or ():
+                if page_id in EMPTY_VALUES:
+                    continue
+                key = normalize_id(page_id)
+                if key not in seen:
+                    seen.add(key)
+                    page_ids.append(page_id)
+    return page_ids
+
+
+def attach_related(columns: Dict[str, list], names: Iterable[str], pages: Dict[str, Dict]) -> Dict[str, List[List[Dict]]]:
+    """Para cada coluna de relação, a lista de páginas relacionadas de cada linha.
+
+    As páginas são as mesmas instâncias para todas as linhas que apontam para elas;
+    ids que não foram resolvidos (ex: página apagada ou sem acesso) ficam de fora.
+    """
+    by_key = {normalize_id(page_id): page for page_id, page in pages.items()}
+    related = {}
+    for name in names:
+        related[name] = [
+            [by_key[normalize_id(page_id)] for page_id in value or () if page_id not in EMPTY_VALUES and normalize_id(page_id) in by_key]
+            for value in columns.get(name, ())
+        ]
+    return related
+
+
+class RelationResolver:
+    """Busca páginas relacionadas uma vez por id, com até max_workers requisições ao mesmo tempo.
+
+    Guarda o que já buscou, então o mesmo resolver pode ser reaproveitado entre
+    consultas (ex: vários databases que apontam para o mesmo database de projetos).
+    Falhas ficam em `errors` e não interrompem as outras buscas.
+    """
+
+    def __init__(self, fetch_page: Callable[[str], Dict], max_workers: int = 8):
+        self.fetch_page = fetch_page
+        self.max_workers = max_workers
+        self.pages: Dict[str, Dict] = {}
+        self.errors: Dict[str, Exception] = {}
+        self._lock = threading.Lock()
+
+    def _fetch(self, page_id: str) -> None:
+        try:
+            page = self.fetch_page(page_id)
+        except Exception as error:
+            with self._lock:
+                self.errors[normalize_id(page_id)] = error
+            return
+        with self._lock:
+            self.pages[normalize_id(page_id)] = page
+
+    def resolve(self, page_ids: Iterable[str]) -> Dict[str, Dict]:
+        """Fetch the pages not seen yet and return {page_id: page} for every resolved id"""
+        page_ids = list(page_ids)
+        missing = list({normalize_id(page_id): page_id for page_id in page_ids if normalize_id(page_id) not in self.pages}.values())
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="notion-relations") as executor:
+                list(executor.map(self._fetch, missing))
+
+        return {page_id: self.pages[normalize_id(page_id)] for page_id in page_ids if normalize_id(page_id) in self.pages}
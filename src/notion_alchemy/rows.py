@@ -0,0 +1,145 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from notion_alchemy.notion import PROPERTY_TYPE_MAP, is_empty, is_writable
+
+
+def normalize_name(name: str) -> str:
+    """Nome da propriedade como atributo Python (mesma regra do NotionDatabaseModel.from_notion)"""
+    return name.strip().lower().replace(' ', '_')
+
+
+class ColumnSchema:
+    """Metadados de uma coluna, compartilhados por todas as linhas"""
+    __slots__ = ("name", "dtype", "property_id", "format")
+
+    def __init__(self, name: str, dtype: str, property_id: str = ""):
+        self.name = name
+        self.dtype = dtype
+        self.property_id = property_id
+        self.format: Callable[[Any], Dict] = PROPERTY_TYPE_MAP[dtype]._format_value
+
+
+class Table:
+    """Colunas decodificadas (ColumnDecoder) + schema; as linhas (Row) são só posições nela"""
+    __slots__ = ("columns", "schema", "attributes", "raw", "related", "versions")
+
+    def __init__(
+        self,
+        columns: Dict[str, list],
+        schema: Dict[str, ColumnSchema],
+        keep_raw: bool = False,
+        related: Dict[str, list] = None,
+        versions: Dict[str, int] = None,
+    ):
+        self.columns = columns
+        self.schema = schema
+        self.attributes = {normalize_name(name): name for name in schema}
+        # JSON original de cada página, só se pedido
+        self.raw: Optional[List[Dict]] = [] if keep_raw else None
+        # páginas das relations já resolvidas, coluna -> lista por linha (ver NotionDatabaseModel.attach_relations)
+        self.related: Dict[str, list] = related if related is not None else {}
+        # coluna -> quantas vezes foi editada; invalida os índices do LocalQuery
+        self.versions: Dict[str, int] = versions if versions is not None else {}
+
+    def rows(self, start: int = 0, end: int = None) -> Iterator["Row"]:
+        end = len(self.columns["page_id"]) if end is None else end
+        return (Row(self, position) for position in range(start, end))
+
+
+class Row:
+    """Linha compacta de um database: referência à Table, posição e nomes alterados.
+
+    Não copia valores nem guarda NotionProperty por célula; lê e escreve direto
+    nas colunas. Aceita row["Nome da Propriedade"] e row.nome_da_propriedade.
+    """
+    __slots__ = ("_table", "_position", "_dirty")
+
+    def __init__(self, table: Table, position: int):
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_position", position)
+        object.__setattr__(self, "_dirty", None)
+
+    @property
+    def id(self) -> str:
+        return self._table.columns["page_id"][self._position]
+
+    @property
+    def raw(self) -> Optional[Dict]:
+        raw = self._table.raw
+        return raw[self._position] if raw is not None else None
+
+    def __getitem__(self, name: str) -> Any:
+        return self._table.columns[name][self._position]
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        if name not in self._table.schema:
+            raise KeyError(name)
+        self._table.columns[name][self._position] = value
+        versions = self._table.versions
+        versions[name] = versions.get(name, 0) + 1
+        if self._dirty is None:
+            object.__setattr__(self, "_dirty", set())
+        self._dirty.add(name)
+
+    def __getattr__(self, attribute: str) -> Any:
+        if attribute.startswith("_"):
+            # slots ainda não preenchidos (ex: copy/pickle) não podem cair no lookup da Table
+            raise AttributeError(attribute)
+        name = self._table.attributes.get(attribute)
+        if name is None:
+            raise AttributeError(f"'Row' has no attribute '{attribute}'")
+        return self[name]
+
+    def __setattr__(self, attribute: str, value: Any) -> None:
+        if attribute.startswith("_"):
+            object.__setattr__(self, attribute, value)
+            return
+        name = self._table.attributes.get(attribute)
+        if name is None:
+            raise AttributeError(f"'Row' has no attribute '{attribute}'")
+        self[name] = value
+
+    def __repr__(self) -> str:
+        return f"Row(id={self.id!r})"
+
+    def get(self, name: str, default: Any = None) -> Any:
+        column = self._table.columns.get(name)
+        return column[self._position] if column is not None else default
+
+    def related(self, name: str) -> List[Dict]:
+        """Páginas relacionadas em name; só depois de expandir as relations"""
+        column = self._table.related.get(name)
+        if column is None:
+            raise KeyError(f"Relation {name!r} não foi expandida")
+        return column[self._position]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: values[self._position] for name, values in self._table.columns.items()}
+
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self._dirty)
+
+    def mark_clean(self, names: Iterable[str] = None) -> None:
+        """Esquece as alterações (só as de names, se passado)"""
+        if names is None or not self._dirty:
+            object.__setattr__(self, "_dirty", None)
+        else:
+            self._dirty.difference_update(names)
+
+    def to_notion(self, only_dirty: bool = False) -> Dict:
+        """Propriedades no formato da API; only_dirty=True manda só as alteradas com row[...] = valor"""
+        names = (self._dirty or ()) if only_dirty else self._table.schema
+        properties = {}
+        for name in names:
+            column = self._table.schema[name]
+            value = self[name]
+            # fórmulas e people/files só com os nomes não voltam para a API
+            if not is_writable(column.dtype, value):
+                continue
+            # células vazias dos parsers ("None", ["None"]) virariam uma opção "None" ou um 400;
+            # se foram esvaziadas com row[...] = None vão como null (o format trata o vazio)
+            if is_empty(value) and not only_dirty:
+                continue
+            properties[name] = column.format(value)
+        return properties
@@ -0,0 +1,95 @@
+import hashlib
+import re
+import threading
+
+from typing import Dict, Tuple, Type
+from notion_alchemy.decoder import ColumnDecoder
+from notion_alchemy.jsonlib import dumps
+from notion_alchemy.models import NotionDatabaseModel
+from notion_alchemy.notion import PROPERTY_TYPE_MAP, create_property, normalize_id
+from notion_alchemy.rows import ColumnSchema, normalize_name
+
+
+def schema_hash(database: Dict) -> str:
+    """Hash das propriedades (nome, tipo, id) de um database; muda quando o schema muda"""
+    properties = sorted(
+        (name, prop.get("type", ""), prop.get("id", ""))
+        for name, prop in database.get("properties", {}).items()
+    )
+    return hashlib.sha1(dumps(properties).encode()).hexdigest()
+
+
+def _class_name(database: Dict) -> str:
+    title = "".join(part.get("plain_text", "") for part in database.get("title") or [])
+    words = re.findall(r"[0-9A-Za-z]+", title)
+    name = "".join(word[:1].upper() + word[1:] for word in words)
+    if not name or name[0].isdigit():
+        name = "Database" + name
+    return f"{name}Model"
+
+
+def compile_model(database: Dict) -> Type[NotionDatabaseModel]:
+    """Gera uma subclasse de NotionDatabaseModel para o schema de um database (get_database).
+
+    Propriedades, decoder e schema das colunas ficam prontos na classe; cada
+    instância só ganha as próprias colunas vazias.
+    """
+    properties = {}
+    for name, prop in database.get("properties", {}).items():
+        # tipos sem classe em PROPERTY_TYPE_MAP (url, rollup, ...) ficam de fora, como no ColumnDecoder
+        if prop.get("type") not in PROPERTY_TYPE_MAP:
+            continue
+        properties[normalize_name(name)] = create_property(name=name, property_type=prop.get("type"), raw_data=prop)
+
+    decoder = ColumnDecoder({prop.name: prop.dtype for prop in properties.values()})
+    column_schema = {prop.name: ColumnSchema(prop.name, prop.dtype, prop.property_id) for prop in properties.values()}
+    return type(
+        _class_name(database),
+        (NotionDatabaseModel,),
+        {
+            "_database_id": database.get("id"),
+            "_schema_hash": schema_hash(database),
+            "_properties": properties,
+            "_schema_decoder": decoder,
+            "_column_schema": column_schema,
+        },
+    )
+
+
+class SchemaRegistry:
+    """Modelos compilados por database id, guardando só a versão mais recente do schema.
+
+    Se o schema mudar (outro hash), a classe é recompilada e substitui a antiga,
+    então o registro não cresce a cada consulta.
+    """
+
+    def __init__(self):
+        self._models: Dict[str, Tuple[str, Type[NotionDatabaseModel]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def model_for(self, database: Dict) -> Type[NotionDatabaseModel]:
+        """Model class for a raw database object, compiled on first use or when its schema changed"""
+        key = normalize_id(database["id"])
+        current = schema_hash(database)
+        with self._lock:
+            cached = self._models.get(key)
+            if cached is not None and cached[0] == current:
+                return cached[1]
+            model = compile_model(database)
+            self._models[key] = (current, model)
+            return model
+
+    def get(self, database_id: str) -> Type[NotionDatabaseModel]:
+        cached = self._models.get(normalize_id(database_id))
+        return cached[1] if cached else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+
+# registro usado pelo NotionClient quando nenhum outro é passado
+default_registry = SchemaRegistry()
@@ -0,0 +1,151 @@
+"""Várias integrações (tokens) do mesmo workspace atrás de um cliente só.
+
+O limite do Notion é por integração: com N tokens com acesso às mesmas páginas
+o ShardedNotionClient manda cada requisição pelo token que pode enviar mais
+cedo, cada um com o próprio TokenBucket, e a vazão cresce com o número de
+tokens. Um 429 segura só o token que o recebeu; um 401 (token revogado ou
+inválido) tira o token do rodízio e a requisição é refeita por outro; quando
+não sobra nenhum, NoTokenAvailable.
+
+    client = ShardedNotionClient([token_a, token_b, token_c])
+    client.sync_database(database_id, store)
+    client.usage()
+"""
+import threading
+import time
+
+import requests
+
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional, Sequence, Tuple
+from notion_alchemy.client import NotionClient
+from notion_alchemy.transport import NOTION_RATE_LIMIT, TokenBucket
+
+
+class NoTokenAvailable(RuntimeError):
+    """Todos os tokens do pool foram revogados"""
+
+
+@dataclass
+class TokenShard:
+    """Um token do pool: rate limiter próprio, estado e uso"""
+    token: str = field(repr=False)
+    rate_limiter: TokenBucket = field(repr=False)
+    label: str = ""
+    revoked: bool = False
+    in_flight: int = 0
+    requests: int = 0
+    throttled: int = 0
+    errors: int = 0
+    wait_seconds: float = 0.0
+
+    @property
+    def authorization(self) -> str:
+        return f"Bearer {self.token}"
+
+
+class TokenPool:
+    """Escolhe, a cada requisição, o token saudável que pode enviar mais cedo.
+
+    A carga de cada token é a espera no seu TokenBucket (que inclui a punição de
+    um 429) mais o que ele já tem em voo; empates vão para o menos usado.
+    """
+
+    def __init__(self, tokens: Sequence[str], rate_limit: float = NOTION_RATE_LIMIT, burst: float = None):
+        if not tokens:
+            raise ValueError("TokenPool needs at least one token")
+        if len(set(tokens)) != len(tokens):
+            raise ValueError("Tokens in a TokenPool must be distinct")
+        self.shards = [
+            TokenShard(token=token, rate_limiter=TokenBucket(rate_limit, burst), label=f"...{token[-4:]}")
+            for token in tokens
+        ]
+        self._lock = threading.Lock()
+
+    def _load(self, shard: TokenShard) -> Tuple[float, int]:
+        return shard.rate_limiter.peek() + shard.in_flight / shard.rate_limiter.rate, shard.requests
+
+    def acquire(self) -> Tuple[TokenShard, float]:
+        """Reserve a slot on the least loaded token; returns it and how long to wait before sending"""
+        with self._lock:
+            healthy = [shard for shard in self.shards if not shard.revoked]
+            if not healthy:
+                raise NoTokenAvailable("Every Notion token in the pool was rejected (401)")
+            shard = min(healthy, key=self._load)
+            wait = shard.rate_limiter.reserve()
+            shard.in_flight += 1
+            shard.requests += 1
+            shard.wait_seconds += wait
+            return shard, wait
+
+    def release(self, shard: TokenShard, error: bool = False) -> None:
+        with self._lock:
+            shard.in_flight -= 1
+            if error:
+                shard.errors += 1
+
+    def throttle(self, shard: TokenShard, seconds: float) -> None:
+        """429 num token: só o balde dele fica parado por `seconds`"""
+        shard.rate_limiter.penalize(seconds)
+        with self._lock:
+            shard.throttled += 1
+
+    def revoke(self, shard: TokenShard) -> None:
+        with self._lock:
+            shard.revoked = True
+
+    def usage(self) -> List[Dict]:
+        """Uso por token (sem o token em si)"""
+        with self._lock:
+            return [
+                {item.name: getattr(shard, item.name) for item in fields(shard) if item.name not in ("token", "rate_limiter")}
+                for shard in self.shards
+            ]
+
+
+class ShardedNotionClient(NotionClient):
+    """NotionClient que distribui as requisições entre vários tokens (ver TokenPool).
+
+    Todos os métodos do NotionClient (queries, bulk, walk_blocks, sync...) passam
+    pelo NotionClient._request, que aqui escolhe um token a cada tentativa
+    (_acquire/_release/_throttle). rate_limit e burst valem por token. Os tokens precisam
+    ter acesso às mesmas páginas: um 404 num token não é tentado em outro.
+    """
+
+    def __init__(self, tokens: Sequence[str], rate_limit: float = NOTION_RATE_LIMIT, burst: float = None, pool: TokenPool = None, **kwargs):
+        self.pool = pool or TokenPool(tokens, rate_limit, burst)
+        # uma conexão por token em voo, no mínimo o padrão do NotionClient
+        kwargs.setdefault("pool_size", max(10, 4 * len(self.pool.shards)))
+        # sem api_key: o Authorization vai em cada requisição, conforme o token escolhido
+        super().__init__(None, **kwargs)
+        # cada token tem o próprio TokenBucket (TokenPool); não há um balde do cliente
+        self.rate_limiter = None
+
+    def usage(self) -> List[Dict]:
+        return self.pool.usage()
+
+    def _acquire(self) -> Tuple[TokenShard, Dict[str, str]]:
+        shard, wait = self.pool.acquire()
+        if wait > 0:
+            if self.instrumentation is not None:
+                self.instrumentation.on_throttle(wait, "rate_limit")
+            time.sleep(wait)
+        return shard, {"Authorization": shard.authorization}
+
+    def _release(self, shard: TokenShard, response: Optional[requests.Response]) -> bool:
+        self.pool.release(shard, error=response is None or response.status_code >= 400)
+        if response is None or response.status_code != 401:
+            return False
+        # token revogado/inválido: o Notion não processou nada, então vale repetir em outro
+        self.pool.revoke(shard)
+        if any(not other.revoked for other in self.pool.shards):
+            return True
+        # era o último token: o 401 vai como causa
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as error:
+            raise NoTokenAvailable("Every Notion token in the pool was rejected (401)") from error
+
+    def _throttle(self, shard: TokenShard, delay: float) -> None:
+        # só este token fica parado; a próxima tentativa vai para outro se houver
+        self.pool.throttle(shard, delay)
@@ -0,0 +1,99 @@
+import sqlite3
+
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional
+from notion_alchemy.jsonlib import dumps, loads
+
+
+class PageStore:
+    """Cache local em SQLite das páginas de um ou mais databases.
+
+    Guarda o JSON bruto de cada página junto com o last_edited_time e um
+    checkpoint por database, usado pelo NotionClient.sync_database para buscar
+    só o que mudou desde a última sincronização.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                id TEXT PRIMARY KEY,
+                database_id TEXT,
+                last_edited_time TEXT,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS pages_database_id ON pages (database_id, last_edited_time);
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                database_id TEXT PRIMARY KEY,
+                last_edited_time TEXT,
+                synced_at TEXT
+            );
+            """
+        )
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def upsert_pages(self, pages: Iterable[Dict], database_id: str = None) -> int:
+        """Insert or replace raw pages; returns how many were written"""
+        rows = [
+            (
+                page["id"],
+                database_id or page.get("parent", {}).get("database_id"),
+                page.get("last_edited_time"),
+                dumps(page),
+            )
+            for page in pages
+        ]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO pages (id, database_id, last_edited_time, data) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def delete_pages(self, page_ids: Iterable[str]) -> None:
+        with self.connection:
+            self.connection.executemany("DELETE FROM pages WHERE id = ?", ((page_id,) for page_id in page_ids))
+
+    def get_page(self, page_id: str) -> Optional[Dict]:
+        row = self.connection.execute("SELECT data FROM pages WHERE id = ?", (page_id,)).fetchone()
+        return loads(row[0]) if row else None
+
+    def page_ids(self, database_id: str) -> List[str]:
+        return [row[0] for row in self.connection.execute("SELECT id FROM pages WHERE database_id = ?", (database_id,))]
+
+    def count(self, database_id: str) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM pages WHERE database_id = ?", (database_id,)).fetchone()[0]
+
+    def iter_pages(self, database_id: str, batch_size: int = 100) -> Iterator[Dict]:
+        """Yield cached pages in the same shape as a query response, ready for populate"""
+        cursor = self.connection.execute(
+            "SELECT data FROM pages WHERE database_id = ? ORDER BY last_edited_time, id", (database_id,)
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield {"results": [loads(row[0]) for row in rows]}
+
+    def get_checkpoint(self, database_id: str) -> Optional[str]:
+        row = self.connection.execute(
+            "SELECT last_edited_time FROM checkpoints WHERE database_id = ?", (database_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_checkpoint(self, database_id: str, last_edited_time: str) -> None:
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO checkpoints (database_id, last_edited_time, synced_at) VALUES (?, ?, ?)",
+                (database_id, last_edited_time, datetime.now(timezone.utc).isoformat()),
+            )
@@ -0,0 +1,400 @@
+"""Notion API local para testes e benchmarks, sem rede.
+
+MockNotion é um adapter do requests: montado na sessão de um NotionClient, ele
+responde databases, queries paginadas (com filtros, sorts e cursores), páginas,
+escritas e block children a partir de dados sintéticos, e pode simular latência
+e respostas 429.
+
+    mock = MockNotion(latency=0.01, rate_limit_every=20)
+    mock.add_database("database", rows=5000)
+    client = NotionClient("secret", rate_limit=1000)
+    mock.mount(client)
+"""
+import threading
+import time
+import uuid
+
+from datetime import datetime, timedelta, timezone
+from itertools import count
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from requests.adapters import BaseAdapter
+from notion_alchemy.decoder import ColumnDecoder
+from notion_alchemy.jsonlib import dumps, loads
+from notion_alchemy.local_query import LocalQuery
+from notion_alchemy.notion import PROPERTY_TYPE_MAP, is_empty, normalize_id
+
+# uma coluna de cada tipo suportado pelo decoder
+DEFAULT_COLUMNS = {
+    "Name": "title",
+    "Notes": "rich_text",
+    "Score": "number",
+    "Done": "checkbox",
+    "Stage": "select",
+    "Tags": "multi_select",
+    "Status": "status",
+    "When": "date",
+    "Owner": "people",
+    "Files": "files",
+    "Project": "relation",
+    "Total": "formula",
+}
+
+_START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _rich_text(content: str) -> List[Dict]:
+    return [
+        {
+            "type": "text",
+            "text": {"content": content, "link": None},
+            "annotations": {"bold": False, "italic": False, "strikethrough": False, "underline": False, "code": False, "color": "default"},
+            "plain_text": content,
+            "href": None,
+        }
+    ]
+
+
+def _value(dtype: str, i: int) -> Any:
+    """Valor sintético (formato de leitura da API) da linha i para um tipo de propriedade"""
+    if dtype == "title":
+        return _rich_text(f"Linha {i}")
+    if dtype == "rich_text":
+        return _rich_text(("texto " * (i % 5 + 1)).strip())
+    if dtype == "number":
+        return None if i % 10 == 9 else i * 1.5
+    if dtype == "checkbox":
+        return i % 2 == 0
+    if dtype == "select":
+        return None if i % 7 == 6 else {"id": f"opt{i % 5}", "name": f"Opção {i % 5}", "color": "default"}
+    if dtype == "multi_select":
+        return [{"id": f"tag{i % 7}", "name": f"tag{i % 7}", "color": "default"}, {"id": "all", "name": "comum", "color": "gray"}]
+    if dtype == "status":
+        return {"id": f"st{i % 3}", "name": ("Not started", "In progress", "Done")[i % 3], "color": "default"}
+    if dtype == "date":
+        return None if i % 9 == 8 else {"start": (_START + timedelta(days=i % 365)).date().isoformat(), "end": None, "time_zone": None}
+    if dtype == "people":
+        return [{"object": "user", "id": f"user-{i % 3}", "name": f"Pessoa {i % 3}"}]
+    if dtype == "files":
+        return [] if i % 4 else [{"name": f"arquivo{i}.pdf", "type": "external", "external": {"url": f"https://example.com/{i}.pdf"}}]
+    if dtype == "relation":
+        return [{"id": str(uuid.uuid5(uuid.NAMESPACE_URL, f"related/{i % 50}"))}]
+    if dtype == "formula":
+        return {"type": "number", "number": i % 10}
+    raise ValueError(f"Tipo de propriedade sem gerador sintético: {dtype}")
+
+
+def _property_ids(columns: Dict[str, str]) -> Dict[str, str]:
+    return {name: f"p{index}" for index, name in enumerate(columns)}
+
+
+def synthetic_database(database_id: str = "database", columns: Dict[str, str] = None, title: str = "Synthetic") -> Dict:
+    """Database object (GET databases/{id}) with one property per entry of columns (name -> type)"""
+    columns = columns or DEFAULT_COLUMNS
+    ids = _property_ids(columns)
+    return {
+        "object": "database",
+        "id": database_id,
+        "title": _rich_text(title),
+        "properties": {name: {"id": ids[name], "name": name, "type": dtype, dtype: {}} for name, dtype in columns.items()},
+    }
+
+
+def synthetic_page(i: int, database_id: str = "database", columns: Dict[str, str] = None) -> Dict:
+    """Page object of row i, deterministic for the same (i, database_id, columns)"""
+    columns = columns or DEFAULT_COLUMNS
+    ids = _property_ids(columns)
+    moment = _timestamp(_START + timedelta(minutes=i))
+    return {
+        "object": "page",
+        "id": str(uuid.uuid5(uuid.NAMESPACE_URL, f"{database_id}/{i}")),
+        "created_time": moment,
+        "last_edited_time": moment,
+        "archived": False,
+        "parent": {"type": "database_id", "database_id": database_id},
+        "properties": {
+            name: {"id": ids[name], "type": dtype, dtype: _value(dtype, i)} for name, dtype in columns.items()
+        },
+    }
+
+
+def synthetic_block(i: int, has_children: bool = False) -> Dict:
+    text = f"Parágrafo {i}"
+    return {
+        "object": "block",
+        "id": str(uuid.uuid5(uuid.NAMESPACE_URL, f"block/{i}")),
+        "type": "paragraph",
+        "has_children": has_children,
+        "paragraph": {"rich_text": _rich_text(text)},
+    }
+
+
+def _read_format(dtype: str, value: Any) -> Any:
+    # o que o cliente manda (text.content) vira o que a API devolve (plain_text)
+    if dtype in ("title", "rich_text"):
+        return _rich_text("".join(part.get("text", {}).get("content", "") for part in value or []))
+    return value
+
+
+def _empty_last_key(value: Any) -> Tuple[bool, Any]:
+    empty = is_empty(value)
+    if isinstance(value, list):
+        value = tuple(value)
+    return empty, value if not empty else 0
+
+
+class MockNotion(BaseAdapter):
+    """Transporte do requests que responde como a API do Notion.
+
+    latency: segundos de espera por requisição.
+    rate_limit_every: a cada N requisições uma responde 429 com Retry-After: retry_after.
+    Todas as requisições ficam em `calls` como (método, caminho) e a contagem por
+    token em `token_calls`; tokens em `revoked_tokens` recebem 401.
+    """
+
+    def __init__(self, latency: float = 0.0, rate_limit_every: int = 0, retry_after: float = 0.0):
+        super().__init__()
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.databases: Dict[str, Dict] = {}
+        self.pages: Dict[str, Dict] = {}
+        self.blocks: Dict[str, List[Dict]] = {}
+        self.calls: List[Tuple[str, str]] = []
+        self.token_calls: Dict[str, int] = {}
+        self.revoked_tokens = set()
+        self.rate_limited = 0
+        self._rows: Dict[str, List[str]] = {}
+        self._cursors: Dict[str, List[str]] = {}
+        self._tokens = count()
+        self._lock = threading.Lock()
+
+    def add_database(self, database_id: str = "database", rows: int = 0, columns: Dict[str, str] = None, title: str = "Synthetic") -> Dict:
+        database = synthetic_database(database_id, columns, title)
+        with self._lock:
+            self.databases[normalize_id(database_id)] = database
+            self._rows[normalize_id(database_id)] = []
+        self.add_pages(database_id, rows, columns)
+        return database
+
+    def add_pages(self, database_id: str, rows: int, columns: Dict[str, str] = None) -> List[Dict]:
+        with self._lock:
+            ids = self._rows[normalize_id(database_id)]
+            if columns is None:
+                schema = self.databases[normalize_id(database_id)]["properties"]
+                columns = {name: prop["type"] for name, prop in schema.items()}
+            start = len(ids)
+            pages = [synthetic_page(i, database_id, columns) for i in range(start, start + rows)]
+            for page in pages:
+                self.pages[normalize_id(page["id"])] = page
+                ids.append(normalize_id(page["id"]))
+        return pages
+
+    def add_blocks(self, parent_id: str, blocks: List[Dict]) -> None:
+        with self._lock:
+            self.blocks.setdefault(normalize_id(parent_id), []).extend(blocks)
+
+    def mount(self, client: Any) -> "MockNotion":
+        """Mount on a NotionClient (or any object with a requests session, or a session)"""
+        session = getattr(client, "session", client)
+        session.mount("https://", self)
+        session.mount("http://", self)
+        return self
+
+    def close(self) -> None:
+        pass
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if self.latency:
+            time.sleep(self.latency)
+
+        url = urlparse(request.url)
+        path = url.path.split("/v1/", 1)[-1].strip("/")
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        with self._lock:
+            self.calls.append((request.method, path))
+            self.token_calls[token] = self.token_calls.get(token, 0) + 1
+            if token in self.revoked_tokens:
+                return self._error(request, 401, "unauthorized", "API token is invalid.")
+            throttled = self.rate_limit_every and len(self.calls) % self.rate_limit_every == 0
+            if throttled:
+                self.rate_limited += 1
+        if throttled:
+            return self._error(request, 429, "rate_limited", "Rate limited", {"Retry-After": str(self.retry_after)})
+
+        body = loads(request.body) if request.body else {}
+        # filter_properties vem repetido na query string; o resto tem um valor só
+        params = {name: values if name == "filter_properties" else values[-1] for name, values in parse_qs(url.query).items()}
+        try:
+            status, data = self._route(request.method, path, body, params)
+        except ValueError as error:
+            return self._error(request, 400, "validation_error", str(error))
+        if status != 200:
+            return self._error(request, status, "object_not_found", data)
+        return self._response(request, 200, data)
+
+    def _route(self, method: str, path: str, body: Dict, params: Dict) -> Tuple[int, Any]:
+        parts = path.split("/")
+        if parts[0] == "databases" and len(parts) == 2 and method == "GET":
+            database = self.databases.get(normalize_id(parts[1]))
+            return (200, database) if database else (404, f"Could not find database with ID: {parts[1]}")
+        if parts[0] == "databases" and len(parts) == 3 and parts[2] == "query" and method == "POST":
+            if normalize_id(parts[1]) not in self.databases:
+                return 404, f"Could not find database with ID: {parts[1]}"
+            return 200, self._query(normalize_id(parts[1]), body, params)
+        if parts[0] == "pages" and len(parts) == 1 and method == "POST":
+            return 200, self._create(body)
+        if parts[0] == "pages" and len(parts) == 2:
+            page = self.pages.get(normalize_id(parts[1]))
+            if page is None:
+                return 404, f"Could not find page with ID: {parts[1]}"
+            if method == "PATCH":
+                return 200, self._update(page, body)
+            return 200, page
+        if parts[0] == "blocks" and len(parts) == 3 and parts[2] == "children" and method == "GET":
+            children = self.blocks.get(normalize_id(parts[1]), [])
+            return 200, self._paginate(children, params.get("start_cursor"), int(params.get("page_size", 100)))
+        return 404, f"Invalid request URL: {method} {path}"
+
+    @staticmethod
+    def _paginate(items: List[Any], cursor: str, page_size: int, token: str = "") -> Dict:
+        start = int(cursor.rsplit(":", 1)[-1]) if cursor else 0
+        end = start + page_size
+        more = end < len(items)
+        return {
+            "object": "list",
+            "results": items[start:end],
+            "has_more": more,
+            "next_cursor": f"{token}:{end}" if more else None,
+        }
+
+    def _query(self, database_id: str, body: Dict, params: Dict) -> Dict:
+        page_size = body.get("page_size", 100)
+        if not 1 <= page_size <= 100:
+            raise ValueError("page_size should be between 1 and 100")
+
+        cursor = body.get("start_cursor")
+        if cursor:
+            # o resultado da primeira página fica guardado: as seguintes só fatiam
+            token = cursor.rsplit(":", 1)[0]
+            with self._lock:
+                ids = self._cursors.get(token)
+            if ids is None:
+                raise ValueError(f"Invalid start_cursor: {cursor}")
+        else:
+            ids = self._select(database_id, body)
+            with self._lock:
+                token = str(next(self._tokens))
+                self._cursors[token] = ids
+
+        data = self._paginate(ids, cursor, page_size, token)
+        if not data["has_more"]:
+            with self._lock:
+                self._cursors.pop(token, None)
+
+        wanted = set(params.get("filter_properties", ()))
+        pages = [self.pages[page_id] for page_id in data["results"]]
+        if wanted:
+            pages = [
+                {**page, "properties": {name: prop for name, prop in page["properties"].items() if name in wanted or prop["id"] in wanted}}
+                for page in pages
+            ]
+        data["results"] = pages
+        return data
+
+    def _select(self, database_id: str, body: Dict) -> List[str]:
+        with self._lock:
+            ids = [page_id for page_id in self._rows[database_id] if not self.pages[page_id].get("archived")]
+        pages = [self.pages[page_id] for page_id in ids]
+        database = self.databases[database_id]
+
+        query = body.get("filter")
+        if query and "timestamp" in query:
+            name = query["timestamp"]
+            operator, argument = next(iter(query[name].items()))
+            moment = datetime.fromisoformat(argument.replace("Z", "+00:00"))
+            if moment.tzinfo is None:
+                moment = moment.replace(tzinfo=timezone.utc)
+            compare = {
+                "equals": lambda value: value == moment,
+                "before": lambda value: value < moment,
+                "after": lambda value: value > moment,
+                "on_or_before": lambda value: value <= moment,
+                "on_or_after": lambda value: value >= moment,
+            }[operator]
+            pages = [page for page in pages if compare(datetime.fromisoformat(page[name].replace("Z", "+00:00")))]
+        elif query:
+            # filtros de propriedade: avaliados pelo mesmo LocalQuery dos modelos
+            decoder = ColumnDecoder.from_database(database)
+            columns = decoder.new_columns()
+            decoder.decode(pages, columns)
+            pages = [pages[position] for position in LocalQuery(columns, decoder.schema).positions(query)]
+
+        for sort in reversed(body.get("sorts", [])):
+            reverse = sort.get("direction") == "descending"
+            if "timestamp" in sort:
+                pages.sort(key=lambda page: page[sort["timestamp"]], reverse=reverse)
+            else:
+                name = sort["property"]
+                parse = PROPERTY_TYPE_MAP[database["properties"][name]["type"]]._parse_value
+                pages.sort(key=lambda page: _empty_last_key(parse(page["properties"].get(name, {}))), reverse=reverse)
+
+        return [normalize_id(page["id"]) for page in pages]
+
+    def _write_properties(self, page: Dict, properties: Dict) -> None:
+        database = self.databases.get(normalize_id(page["parent"].get("database_id", "")), {})
+        schema = database.get("properties", {})
+        for name, value in properties.items():
+            if name not in schema:
+                raise ValueError(f"{name} is not a property that exists.")
+            dtype = schema[name]["type"]
+            page["properties"][name] = {"id": schema[name]["id"], "type": dtype, dtype: _read_format(dtype, value.get(dtype))}
+
+    def _create(self, body: Dict) -> Dict:
+        database_id = body.get("parent", {}).get("database_id", "")
+        if normalize_id(database_id) not in self.databases:
+            raise ValueError(f"Could not find database with ID: {database_id}")
+        moment = _timestamp(datetime.now(timezone.utc))
+        page = {
+            "object": "page",
+            "id": str(uuid.uuid4()),
+            "created_time": moment,
+            "last_edited_time": moment,
+            "archived": False,
+            "parent": {"type": "database_id", "database_id": database_id},
+            "properties": {},
+        }
+        with self._lock:
+            self._write_properties(page, body.get("properties", {}))
+            self.pages[normalize_id(page["id"])] = page
+            self._rows[normalize_id(database_id)].append(normalize_id(page["id"]))
+        return page
+
+    def _update(self, page: Dict, body: Dict) -> Dict:
+        with self._lock:
+            self._write_properties(page, body.get("properties", {}))
+            if "archived" in body:
+                page["archived"] = body["archived"]
+            page["last_edited_time"] = _timestamp(datetime.now(timezone.utc))
+        return page
+
+    @staticmethod
+    def _response(request: requests.PreparedRequest, status: int, data: Any, headers: Dict[str, str] = None) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status
+        response.request = request
+        response.url = request.url
+        response.encoding = "utf-8"
+        response.headers.update({"Content-Type": "application/json", **(headers or {})})
+        response._content = dumps(data).encode()
+        return response
+
+    def _error(self, request: requests.PreparedRequest, status: int, code: str, message: str, headers: Dict[str, str] = None) -> requests.Response:
+        return self._response(request, status, {"object": "error", "status": status, "code": code, "message": message}, headers)
@@ -0,0 +1,104 @@
+import random
+import threading
+import time
+
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+
+# Limite médio documentado pela API do Notion por integração
+NOTION_RATE_LIMIT = 3.0
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Cada requisição reserva um token; quando o balde está vazio a reserva
+    fica negativa e o chamador recebe quanto tempo precisa esperar, então
+    várias threads se enfileiram sem estourar o limite médio.
+    """
+
+    def __init__(self, rate: float = NOTION_RATE_LIMIT, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be greater than zero")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Reserve one token and return how many seconds to wait before using it"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def peek(self) -> float:
+        """Seconds a reserve() made now would have to wait, without reserving anything"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0.0, (1 - self._tokens) / self.rate)
+
+    def acquire(self) -> float:
+        """Block until a token is available; returns the time spent waiting"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, seconds: float) -> None:
+        """Drain the bucket so nobody sends anything for the next `seconds` (ex: após um 429)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RetryPolicy:
+    """Decide quando repetir uma requisição e quanto esperar antes"""
+
+    def __init__(self, max_retries: int = 5, backoff_base: float = 0.5, backoff_max: float = 30.0):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def should_retry(self, response: requests.Response, attempt: int, idempotent: bool = True) -> bool:
+        if attempt >= self.max_retries or response.status_code not in RETRY_STATUS:
+            return False
+        # 429 garante que o Notion não processou a requisição, 5xx não
+        return response.status_code == 429 or idempotent
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def delay(self, response: Optional[requests.Response], attempt: int) -> float:
+        """Honor Retry-After when the server sends it, otherwise back off exponentially"""
+        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+        if retry_after is None:
+            return self.backoff(attempt)
+        # jitter pequeno para as threads não voltarem todas no mesmo instante
+        return min(self.backoff_max, retry_after) + random.uniform(0, self.backoff_base)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,152 @@
+"""Sincronização de registros (DataFrame ou dicts) com um database, por chave.
+
+plan_sync compara os registros com as linhas já carregadas num
+NotionDatabaseModel: monta um índice chave -> linha e, para cada registro,
+compara o to_notion de cada propriedade com o da linha existente. Só o que
+mudou vira escrita; o resultado é um SyncPlan com inserts, updates e
+(opcionalmente) archives, executado por NotionClient.sync_records.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Tuple
+
+from notion_alchemy.bulk import BulkResult
+from notion_alchemy.jsonlib import dumps
+from notion_alchemy.notion import EMPTY_VALUES, LIST_TYPES, PROPERTY_TYPE_MAP, READ_ONLY_TYPES, as_date, is_writable
+
+
+@dataclass
+class SyncPlan:
+    """Escritas mínimas para deixar o database igual aos registros"""
+    inserts: List[Dict[str, Dict]] = field(default_factory=list)
+    updates: List[Tuple[str, Dict[str, Dict]]] = field(default_factory=list)
+    archives: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    # page_ids de linhas existentes com chave repetida (só a primeira é usada)
+    duplicates: List[str] = field(default_factory=list)
+    # com key="page_id", registros cujo id não está no database (não dá para criar com id)
+    unmatched: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def writes(self) -> int:
+        return len(self.inserts) + len(self.updates) + len(self.archives)
+
+
+@dataclass
+class SyncResult:
+    plan: SyncPlan
+    created: BulkResult = field(default_factory=BulkResult)
+    updated: BulkResult = field(default_factory=BulkResult)
+    archived: BulkResult = field(default_factory=BulkResult)
+
+    @property
+    def ok(self) -> bool:
+        return self.created.ok and self.updated.ok and self.archived.ok
+
+
+def _is_missing(value: Any) -> bool:
+    if value is None or (isinstance(value, str) and value in EMPTY_VALUES):
+        return True
+    # NaN / NaT de DataFrames
+    return isinstance(value, float) and value != value
+
+
+def normalize_value(value: Any, property_type: str) -> Any:
+    """Valor canônico para comparar: vazio vira None, números viram float, listas são ordenadas"""
+    if property_type in LIST_TYPES:
+        if value is None or isinstance(value, float) and value != value:
+            return None
+        values = [item for item in value if not _is_missing(item)]
+        # people/files no formato da API são dicts: ordenados pelo JSON
+        return sorted(values, key=lambda item: dumps(item) if isinstance(item, dict) else item) if values else None
+    if _is_missing(value):
+        return None
+    if property_type == "number":
+        return float(value)
+    if property_type == "date":
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        # pd.Timestamp é subclasse de datetime; NaT não é igual a si mesmo
+        if value != value:
+            return None
+        # data sem hora é comparada e enviada como date, como no DateProperty._format_value
+        return as_date(value)
+    return value
+
+
+def _index_key(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
+
+def records_from_frame(frame: Any, key: str) -> List[Dict[str, Any]]:
+    """Registros (dicts) de um DataFrame; o índice vira coluna quando é a chave (ex: page_id)"""
+    if key not in frame.columns and frame.index.name == key:
+        frame = frame.reset_index()
+    frame = frame.astype(object).where(frame.notna(), None)
+    return frame.to_dict("records")
+
+
+def plan_sync(model: Any, records: Iterable[Dict[str, Any]], key: str, archive_missing: bool = False) -> SyncPlan:
+    """Compare records with the rows loaded in model and return the writes needed.
+
+    key é o nome de uma propriedade (ex: "Name") ou "page_id". Só as propriedades
+    presentes em cada registro são comparadas; valores vazios (None/NaN) deixam
+    a propriedade como está. archive_missing=True arquiva as linhas cuja chave
+    não aparece nos registros. Chave repetida nos registros é erro.
+    """
+    columns = model._properties_data
+    schema = model._get_decoder().schema
+    if key != "page_id" and key not in schema:
+        raise KeyError(f"Key {key!r} is not a property of the database")
+    key_type = schema.get(key, "page_id")
+    writable = {name: PROPERTY_TYPE_MAP[dtype]._format_value for name, dtype in schema.items() if dtype not in READ_ONLY_TYPES}
+
+    plan = SyncPlan()
+    index: Dict[Any, int] = {}
+    for position, value in enumerate(columns[key]):
+        value = _index_key(normalize_value(value, key_type))
+        if value is None:
+            continue
+        if value in index:
+            plan.duplicates.append(columns["page_id"][position])
+        else:
+            index[value] = position
+
+    seen = set()
+    for record in records:
+        key_value = _index_key(normalize_value(record.get(key), key_type))
+        if key_value is None:
+            raise ValueError(f"Record without a value for key {key!r}: {record!r}")
+        if key_value in seen:
+            raise ValueError(f"Duplicated key {key_value!r} in records")
+        seen.add(key_value)
+
+        position = index.get(key_value)
+        properties = {}
+        for name, value in record.items():
+            format_value = writable.get(name)
+            if format_value is None or not is_writable(schema[name], value):
+                continue
+            value = normalize_value(value, schema[name])
+            if value is None:
+                continue
+            payload = format_value(value)
+            if position is not None:
+                current = normalize_value(columns[name][position], schema[name])
+                if current is not None and dumps(format_value(current)) == dumps(payload):
+                    continue
+            properties[name] = payload
+
+        if position is None:
+            if key == "page_id":
+                plan.unmatched.append(record)
+            else:
+                plan.inserts.append(properties)
+        elif properties:
+            plan.updates.append((columns["page_id"][position], properties))
+        else:
+            plan.unchanged += 1
+
+    if archive_missing:
+        plan.archives = [columns["page_id"][position] for value, position in index.items() if value not in seen]
+    return plan
@@ -0,0 +1,170 @@
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+from notion_alchemy.bulk import BulkResult, run_bulk
+from notion_alchemy.notion import normalize_id
+
+
+class WriteBuffer:
+    """Write-behind das alterações de páginas: um PATCH por página no flush.
+
+    Cada update() junta as propriedades alteradas no payload pendente da página
+    (a última escrita de cada propriedade vence), então várias edições da mesma
+    página viram uma requisição só. O flush acontece quando chamado, quando
+    max_pages páginas estão pendentes, quando a alteração mais antiga passou de
+    max_age segundos (verificado a cada update) ou na saída do `with` sem erro;
+    com exceção o que estava pendente é descartado, como num rollback. Models e
+    Rows só são marcados como limpos depois que o PATCH da página deu certo, e só
+    nas propriedades que foram com ele (e não mudaram de novo depois do update);
+    se falhar ou for descartado, continuam dirty para uma nova tentativa.
+
+    get_page() deduplica leituras simultâneas da mesma página: quem chega
+    enquanto outra thread já busca o id espera o mesmo resultado. As alterações
+    pendentes só aparecem nas leituras depois do flush.
+
+        with client.write_session() as session:
+            for model in models:
+                model.status = "Done"
+                session.update(model)
+                model.tags = ["casa"]
+                session.update(model)
+    """
+
+    def __init__(self, client: Any, max_pages: int = 100, max_age: float = None, max_workers: int = 4, batch_size: int = 100):
+        if max_pages < 1:
+            raise ValueError("max_pages must be at least 1")
+        self.client = client
+        self.max_pages = max_pages
+        self.max_age = max_age
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        # chave da página -> (page_id, payload do PATCH)
+        self._pending: "OrderedDict[str, Tuple[str, Dict]]" = OrderedDict()
+        # chave da página -> (model/Row, propriedades enviadas por ele) a marcar como limpas quando o PATCH der certo
+        self._targets: Dict[str, List[Tuple[Any, Dict]]] = {}
+        self._oldest: Optional[float] = None
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.edits = 0
+        self.result = BulkResult()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
+
+    def update(self, target: Any, properties: Dict[str, Dict] = None) -> None:
+        """Buffer the changed properties of a model/Row, or raw API properties for a page id"""
+        tracked = None
+        if isinstance(target, str):
+            page_id = target
+        else:
+            page_id = self.client._model_id(target)
+            if properties is None:
+                properties = self.client._model_properties(target, only_dirty=True)
+                tracked = target
+        if not page_id:
+            raise ValueError("Model must have an id to update")
+        if properties:
+            self._merge(page_id, {"properties": dict(properties)}, tracked)
+
+    def archive(self, page_id: str) -> None:
+        self._merge(page_id, {"archived": True})
+
+    def _merge(self, page_id: str, payload: Dict, target: Any = None) -> None:
+        with self._lock:
+            key = normalize_id(page_id)
+            if target is not None:
+                targets = self._targets.setdefault(key, [])
+                buffered = next((sent for item, sent in targets if item is target), None)
+                if buffered is None:
+                    targets.append((target, dict(payload["properties"])))
+                else:
+                    buffered.update(payload["properties"])
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = (page_id, payload)
+            else:
+                merged = pending[1]
+                merged.setdefault("properties", {}).update(payload.get("properties", {}))
+                if "archived" in payload:
+                    merged["archived"] = payload["archived"]
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            self.edits += 1
+            due = len(self._pending) >= self.max_pages or (
+                self.max_age is not None and time.monotonic() - self._oldest >= self.max_age
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> BulkResult:
+        """Send one PATCH per pending page; returns the result of this flush"""
+        with self._lock:
+            pending = list(self._pending.values())
+            targets = self._targets
+            self._pending.clear()
+            self._targets = {}
+            self._oldest = None
+        if not pending:
+            return BulkResult()
+
+        def patch(item: Tuple[str, Dict], result: BulkResult) -> str:
+            page_id, payload = item
+            if not payload.get("properties"):
+                payload.pop("properties", None)
+            self.client._request("PATCH", f"pages/{page_id}", on_retry=result.add_retry, json=payload)
+            return page_id
+
+        result = run_bulk(patch, pending, max_workers=self.max_workers, batch_size=self.batch_size)
+        for page_id in result.succeeded:
+            for target, sent in targets.get(normalize_id(page_id), ()):
+                # o que mudou de novo depois do update() não foi enviado e continua dirty
+                current = self.client._model_properties(target, only_dirty=True)
+                names = [name for name, value in sent.items() if current.get(name) == value]
+                if names:
+                    target.mark_clean(names)
+        # acumulado da sessão inteira, somando todos os flushes
+        self.result.succeeded.extend(result.succeeded)
+        self.result.failed.extend(result.failed)
+        self.result.retries += result.retries
+        return result
+
+    def discard(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._targets.clear()
+            self._oldest = None
+
+    def get_page(self, page_id: str) -> Dict:
+        """client.get_page, sharing one request between threads asking for the same id at once"""
+        key = normalize_id(page_id)
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            page = self.client.get_page(page_id)
+            future.set_result(page)
+            return page
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
@@ -0,0 +1,34 @@
+import pytest
+
+from notion_alchemy.client import NotionClient
+from notion_alchemy.schema import SchemaRegistry
+from notion_alchemy.testing import MockNotion
+
+
+@pytest.fixture
+def mock():
+    """MockNotion vazio; latency, rate_limit_every etc. podem ser ajustados no teste"""
+    return MockNotion()
+
+
+@pytest.fixture
+def make_client(mock):
+    """Cria clientes (NotionClient ou subclasse) montados no mock, com registro próprio"""
+    clients = []
+
+    def make(client_class=NotionClient, *args, **options):
+        options.setdefault("rate_limit", 1000)
+        options.setdefault("registry", SchemaRegistry())
+        client = client_class(*(args or ("secret",)), **options)
+        mock.mount(client)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def client(make_client):
+    return make_client()
@@ -0,0 +1,57 @@
+import asyncio
+import time
+
+from notion_alchemy.async_client import AsyncNotionClient
+from notion_alchemy.schema import SchemaRegistry
+
+
+def cliente(mock, concurrency=8):
+    client = AsyncNotionClient("secret", concurrency=concurrency, rate_limit=1000, registry=SchemaRegistry())
+    mock.mount(client._client)
+    return client
+
+
+def test_query_paginada(mock):
+    mock.add_database("database", rows=250)
+
+    async def consultar():
+        async with cliente(mock) as client:
+            model = (await client.database_model("database"))()
+            await client.query_database(model, page_size=100)
+            return model
+
+    model = asyncio.run(consultar())
+
+    assert len(model._properties_data["page_id"]) == 250
+    assert [call for call in mock.calls if call[0] == "POST"] == [("POST", "databases/database/query")] * 3
+
+
+def test_429_e_repetido(mock):
+    mock.rate_limit_every = 3
+    mock.add_database("database", rows=50)
+
+    async def consultar():
+        async with cliente(mock) as client:
+            return [data async for data in client.iter_query_pages("database", page_size=10)]
+
+    paginas = asyncio.run(consultar())
+
+    assert sum(len(data["results"]) for data in paginas) == 50
+    assert mock.rate_limited >= 2
+
+
+def test_get_pages_concorrente(mock):
+    mock.latency = 0.1
+    mock.add_database("database", rows=8)
+    ids = list(mock.pages)
+
+    async def buscar():
+        async with cliente(mock) as client:
+            return await client.get_pages(ids)
+
+    inicio = time.perf_counter()
+    paginas = asyncio.run(buscar())
+
+    # 8 requisições de 0.1s em paralelo, não em sequência (0.8s)
+    assert time.perf_counter() - inicio < 0.5
+    assert [pagina["id"].replace("-", "") for pagina in paginas] == ids
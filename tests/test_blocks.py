@@ -0,0 +1,62 @@
+import threading
+
+from notion_alchemy.blocks import BlockCheckpoint, walk_blocks
+
+
+def bloco(block_id, filhos=False, tipo="paragraph"):
+    return {"id": block_id, "type": tipo, "has_children": filhos}
+
+
+ARVORE = {
+    "page": [bloco("a", filhos=True), bloco("b"), bloco("sub", filhos=True, tipo="child_page")],
+    "a": [bloco("a1", filhos=True), bloco("a2")],
+    "a1": [bloco("a11")],
+    "sub": [bloco("s1")],
+}
+
+
+def buscar_filhos(chamadas):
+    lock = threading.Lock()
+
+    def fetch(block_id):
+        with lock:
+            chamadas.append(block_id)
+        return ARVORE.get(block_id, [])
+
+    return fetch
+
+
+def test_walk_blocks_percorre_em_largura():
+    chamadas = []
+    blocos = [block["id"] for block in walk_blocks(buscar_filhos(chamadas), ["page"], max_workers=3)]
+
+    assert blocos == ["a", "b", "sub", "a1", "a2", "a11"]
+    assert sorted(chamadas) == ["a", "a1", "page"]
+
+
+def test_walk_blocks_respeita_profundidade_e_subpaginas():
+    chamadas = []
+    blocos = [block["id"] for block in walk_blocks(buscar_filhos(chamadas), ["page"], max_depth=2, follow_child_pages=True)]
+
+    assert sorted(blocos) == ["a", "a1", "a2", "b", "s1", "sub"]
+    assert sorted(chamadas) == ["a", "page", "sub"]
+
+
+def test_walk_blocks_retoma_do_checkpoint():
+    checkpoint = BlockCheckpoint()
+    percurso = walk_blocks(buscar_filhos([]), ["page"], checkpoint=checkpoint, max_workers=1)
+    primeiros = [next(percurso)["id"] for _ in range(3)]
+    next(percurso)
+    percurso.close()
+
+    salvo = BlockCheckpoint.from_dict(checkpoint.to_dict())
+    assert salvo.done == {"page"}
+    assert not salvo.finished
+
+    chamadas = []
+    resto = [block["id"] for block in walk_blocks(buscar_filhos(chamadas), ["page"], checkpoint=salvo)]
+
+    assert primeiros == ["a", "b", "sub"]
+    assert resto == ["a1", "a2", "a11"]
+    assert "page" not in chamadas
+    assert salvo.finished
@@ -0,0 +1,62 @@
+from notion_alchemy.bulk import run_bulk
+
+
+def test_run_bulk_separa_sucesso_falha_e_skip():
+    def escrever(item, result):
+        if item == 3:
+            raise ValueError("falhou")
+        if item % 2 == 0:
+            return None
+        result.add_retry()
+        return f"page-{item}"
+
+    result = run_bulk(escrever, range(10), max_workers=3, batch_size=4)
+
+    assert sorted(result.succeeded) == ["page-1", "page-5", "page-7", "page-9"]
+    assert [falha.item for falha in result.failed] == [3]
+    assert sorted(result.skipped) == [0, 2, 4, 6, 8]
+    assert result.retries == 4
+    assert not result.ok
+
+
+def test_create_pages_copia_as_linhas(mock, client):
+    mock.add_database("database", rows=3)
+    model = client.database_model("database")()
+    client.query_database(model, keep_pages=True)
+
+    result = client.create_pages(model._properties_pages, database_id="database")
+
+    assert result.ok and len(result.succeeded) == 3
+    copia = client.database_model("database")()
+    client.query_database(copia)
+    assert len(copia._properties_data["page_id"]) == 6
+    # create_pages escreve em paralelo: a ordem das cópias não é garantida
+    def linhas(data, start=0):
+        return sorted(repr([data[name][i] for name in ("Name", "Score", "Tags", "When")]) for i in range(start, len(data["page_id"])))
+    assert linhas(copia._properties_data, 3) == linhas(model._properties_data)
+
+
+def test_update_pages_pula_linhas_limpas(mock, client):
+    mock.add_database("database", rows=3)
+    model = client.database_model("database")()
+    client.query_database(model, keep_pages=True)
+    linha = model._properties_pages[1]
+    linha.score = 7.0
+
+    result = client.update_pages(model._properties_pages)
+
+    assert result.succeeded == [linha.id] and len(result.skipped) == 2
+    assert not linha.is_dirty
+    assert [call for call in mock.calls if call[0] == "PATCH"] == [("PATCH", f"pages/{linha.id}")]
+    assert client.get_page(linha.id)["properties"]["Score"]["number"] == 7.0
+
+
+def test_archive_pages_manda_cada_id_uma_vez(mock, client):
+    mock.add_database("database", rows=2)
+    primeira, segunda = (page["id"] for page in mock.pages.values())
+
+    result = client.archive_pages([primeira, segunda, primeira])
+
+    assert sorted(result.succeeded) == sorted([primeira, segunda])
+    assert len([call for call in mock.calls if call[0] == "PATCH"]) == 2
+    assert all(page["archived"] for page in mock.pages.values())
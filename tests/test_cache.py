@@ -0,0 +1,34 @@
+import time
+
+from notion_alchemy.cache import TTLCache
+
+
+def test_hit_miss_e_invalidate():
+    cache = TTLCache()
+    assert cache.get("page", "abc") is None
+    cache.set("page", "a-b-c", b"{}")
+
+    assert cache.get("page", "abc") == b"{}"
+    cache.invalidate("page", "abc")
+    assert cache.get("page", "abc") is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_ttl_expira():
+    cache = TTLCache(ttls={"page": 0.01})
+    cache.set("page", "abc", b"{}")
+    time.sleep(0.02)
+    assert cache.get("page", "abc") is None
+
+
+def test_lru_respeita_orcamento_de_memoria():
+    cache = TTLCache(max_bytes=10)
+    cache.set("page", "a", b"12345")
+    cache.set("page", "b", b"12345")
+    cache.get("page", "a")
+    cache.set("page", "c", b"12345")
+
+    assert cache.get("page", "b") is None
+    assert cache.get("page", "a") is not None
+    assert cache.stats.evictions == 1
+    assert cache.stats.bytes <= 10
@@ -1,6 +1,8 @@
+import asyncio
 import os
 from decouple import config
 from src.notion_alchemy.client import NotionClient
+from src.notion_alchemy.async_client import AsyncNotionClient
 from src.notion_alchemy.models import NotionDatabaseModel
 
 API_KEY = config('NOTION_TOKEN')
@@ -20,4 +22,21 @@ def test_query_database():
 
     database = NotionDatabaseModel.from_notion(page=pagina)
     resultado = client.query_database(database,database.tags.contains('Casa'))
-    assert resultado is not None
\ No newline at end of file
+    assert resultado is not None
+
+
+def test_iter_query_pages():
+    client = NotionClient(API_KEY)
+    paginas = client.iter_query_pages(DATABASE_ID, page_size=1)
+    primeira = next(paginas)
+    assert len(primeira['results']) <= 1
+    assert 'has_more' in primeira
+
+
+def test_async_get_pages():
+    async def buscar():
+        async with AsyncNotionClient(API_KEY) as client:
+            return await client.get_pages([PAGE_ID, PAGE_ID])
+
+    resultado = asyncio.run(buscar())
+    assert resultado[0]['id'] == resultado[1]['id']
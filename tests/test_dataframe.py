@@ -0,0 +1,25 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from notion_alchemy.dataframe import columns_to_frame
+
+
+def test_columns_to_frame_usa_dtypes_do_notion():
+    colunas = {
+        "Pontos": [1.5, None],
+        "Feito": [True, False],
+        "Status": ["Done", "None"],
+        "Tags": [["a", "b"], ["None"]],
+        "page_id": ["p1", "p2"],
+    }
+    schema = {"Pontos": "number", "Feito": "checkbox", "Status": "status", "Tags": "multi_select"}
+
+    df = columns_to_frame(colunas, schema)
+
+    assert str(df["Pontos"].dtype) == "Float64"
+    assert str(df["Feito"].dtype) == "boolean"
+    assert str(df["Status"].dtype) == "category"
+    assert df.loc["p2", "Status"] is pd.NA or pd.isna(df.loc["p2", "Status"])
+    assert list(df.loc["p2", "Tags"]) == []
+    assert list(df.index) == ["p1", "p2"]
@@ -0,0 +1,43 @@
+from notion_alchemy.decoder import ColumnDecoder
+
+DATABASE = {
+    "id": "database-id",
+    "properties": {
+        "Name": {"type": "title"},
+        "Tags": {"type": "multi_select"},
+        "Link": {"type": "url"},
+    },
+}
+
+
+def pagina(page_id, nome, tags):
+    return {
+        "id": page_id,
+        "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": nome}]},
+            "Tags": {"type": "multi_select", "multi_select": [{"name": tag} for tag in tags]},
+        },
+    }
+
+
+def test_decode_preenche_colunas():
+    decoder = ColumnDecoder.from_database(DATABASE)
+    colunas = decoder.new_columns()
+
+    total = decoder.decode([pagina("a", "Casa", ["x"]), pagina("b", "Estudo", [])], colunas)
+
+    assert total == 2
+    assert colunas == {
+        "Name": ["Casa", "Estudo"],
+        "Tags": [["x"], ["None"]],
+        "page_id": ["a", "b"],
+    }
+
+
+def test_decode_so_colunas_pedidas():
+    decoder = ColumnDecoder(ColumnDecoder.from_database(DATABASE).schema, columns=["Name"])
+    colunas = decoder.new_columns()
+
+    decoder.decode([pagina("a", "Casa", ["x"])], colunas)
+
+    assert colunas == {"Name": ["Casa"], "Tags": [None], "page_id": ["a"]}
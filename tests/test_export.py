@@ -0,0 +1,49 @@
+import csv
+import json
+
+import pytest
+
+from notion_alchemy.export import NdjsonWriter, export_pages
+from notion_alchemy.testing import synthetic_page
+
+
+class ContaChunks(NdjsonWriter):
+    def _write(self, columns, count):
+        self.chunks = getattr(self, "chunks", []) + [count]
+        super()._write(columns, count)
+
+
+def test_export_pages_escreve_em_chunks(tmp_path):
+    respostas = ({"results": [synthetic_page(i + j) for j in range(10)]} for i in range(0, 50, 10))
+    with ContaChunks(str(tmp_path / "dump.ndjson"), {"Name": "title", "Tags": "multi_select", "When": "date"}) as writer:
+        assert export_pages(respostas, writer, chunk_rows=20) == 50
+
+    assert writer.chunks == [20, 20, 10]
+    linhas = [json.loads(linha) for linha in open(tmp_path / "dump.ndjson", encoding="utf-8")]
+    assert len(linhas) == 50
+    assert list(linhas[0]) == ["page_id", "Name", "Tags", "When"]
+
+
+def test_export_database_csv_com_colunas(tmp_path, mock, client):
+    mock.add_database("database", rows=120)
+    caminho = tmp_path / "dump.csv"
+
+    assert client.export_database("database", str(caminho), columns=["Name", "Score"], chunk_rows=50) == 120
+
+    with open(caminho, newline="", encoding="utf-8") as arquivo:
+        linhas = list(csv.reader(arquivo))
+    assert linhas[0] == ["page_id", "Name", "Score"]
+    assert len(linhas) == 121
+
+
+def test_export_database_parquet(tmp_path, mock, client):
+    pq = pytest.importorskip("pyarrow.parquet")
+    mock.add_database("database", rows=30)
+    caminho = tmp_path / "dump.parquet"
+
+    client.export_database("database", str(caminho), page_size=10, chunk_rows=10)
+
+    arquivo = pq.ParquetFile(caminho)
+    assert arquivo.metadata.num_rows == 30
+    assert arquivo.metadata.num_row_groups == 3
+    assert str(arquivo.schema_arrow.field("When").type) == "timestamp[us, tz=UTC]"
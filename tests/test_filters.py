@@ -0,0 +1,57 @@
+import pytest
+
+from notion_alchemy.client import NotionClient
+from notion_alchemy.notion import CheckboxProperty, Filter, MultiSelectProperty, NumberProperty
+
+tags = MultiSelectProperty(name="Tags")
+feito = CheckboxProperty(name="Feito")
+pontos = NumberProperty(property_id="abc", name="Pontos")
+
+
+def test_and_or_montam_a_arvore():
+    filtro = (tags.contains("Casa") & feito.equals(True)) | pontos.greater_than(3)
+
+    assert isinstance(filtro, Filter)
+    assert filtro == {
+        "or": [
+            {"and": [tags.contains("Casa"), feito.equals(True)]},
+            pontos.greater_than(3),
+        ]
+    }
+
+
+def test_operacoes_iguais_sao_achatadas():
+    filtro = tags.contains("a") & tags.contains("b") & tags.contains("c")
+    assert len(filtro["and"]) == 3
+    assert filtro.depth() == 1
+
+
+def test_operadores_de_atribuicao():
+    filtro = tags.contains("a")
+    filtro |= pontos.greater_than(3)
+    assert filtro == {"or": [tags.contains("a"), pontos.greater_than(3)]}
+
+    filtro = tags.contains("a")
+    filtro &= feito.equals(True)
+    assert filtro == {"and": [tags.contains("a"), feito.equals(True)]}
+
+
+def test_build_query_payload():
+    client = NotionClient("token")
+
+    assert client._build_query_payload(None) == {}
+    assert client._build_query_payload([]) == {}
+    assert client._build_query_payload([tags.contains("Casa")]) == {"filter": tags.contains("Casa")}
+    assert client._build_query_payload([tags.contains("Casa"), feito.equals(True)], [pontos.descending()]) == {
+        "filter": {"and": [tags.contains("Casa"), feito.equals(True)]},
+        "sorts": [{"property": "Pontos", "direction": "descending"}],
+    }
+    assert client._query_params([pontos, "title"]) == {"filter_properties": ["abc", "title"]}
+
+
+def test_build_query_payload_recusa_tres_niveis():
+    client = NotionClient("token")
+    filtro = tags.contains("a") & (tags.contains("b") | (feito.equals(True) & pontos.less_than(1)))
+
+    with pytest.raises(ValueError):
+        client._build_query_payload(filtro)
@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+
+# orçamento do import a frio de notion_alchemy.client, com folga para máquinas de CI lentas
+IMPORT_SECONDS = 0.5
+IMPORT_RSS_MB = 30
+
+SCRIPT = """
+import resource, sys, time
+antes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+inicio = time.perf_counter()
+import notion_alchemy.client
+duracao = time.perf_counter() - inicio
+depois = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+pesados = [name for name in ("pandas", "numpy", "pyarrow", "multiprocessing") if name in sys.modules]
+print(duracao, (depois - antes) / 1024, ",".join(pesados))
+"""
+
+
+def importar():
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")]))}
+    saida = subprocess.run([sys.executable, "-c", SCRIPT], env=env, capture_output=True, text=True, check=True).stdout.split(" ")
+    return float(saida[0]), float(saida[1]), saida[2].strip()
+
+
+def test_import_do_cliente_nao_carrega_pandas():
+    _, _, pesados = importar()
+    assert pesados == ""
+
+
+def test_import_do_cliente_dentro_do_orcamento():
+    # a melhor de três: a primeira rodada também paga o cache de disco dos .pyc
+    rodadas = [importar() for _ in range(3)]
+    assert min(duracao for duracao, _, _ in rodadas) < IMPORT_SECONDS
+    assert min(memoria for _, memoria, _ in rodadas) < IMPORT_RSS_MB
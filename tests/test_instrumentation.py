@@ -0,0 +1,35 @@
+from notion_alchemy.instrumentation import Histogram, MetricsCollector, endpoint
+
+
+def test_endpoint_sem_ids():
+    assert endpoint("databases/abc/query") == "databases/{id}/query"
+    assert endpoint("pages") == "pages"
+
+
+def test_histograma_acumulado():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value)
+    assert histogram.cumulative() == [("0.1", 1), ("1.0", 2), ("+Inf", 3)]
+    assert histogram.quantile(0.5) == 1.0
+
+
+def test_metricas_de_query_com_retry(mock, make_client):
+    mock.rate_limit_every = 3
+    mock.add_database("database", rows=50)
+    metrics = MetricsCollector()
+    client = make_client(instrumentation=metrics)
+
+    model = client.database_model("database")()
+    client.query_database(model, page_size=10)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["retries"] == mock.rate_limited
+    assert snapshot["requests"]["POST databases/{id}/query"]["count"] == 5 + snapshot["retries"]
+    assert snapshot["bytes_received"] > snapshot["bytes_sent"] > 0
+    assert snapshot["decode"]["populate"]["rows"] == 50
+    assert metrics.rows_per_second() > 0
+
+    text = metrics.to_prometheus()
+    assert 'notion_responses_total{method="POST",endpoint="databases/{id}/query",status="429"}' in text
+    assert 'notion_decoded_rows_total{stage="populate"} 50' in text
@@ -0,0 +1,56 @@
+from datetime import datetime
+
+from notion_alchemy.local_query import LocalQuery
+from notion_alchemy.notion import DateProperty, FormulaProperty, MultiSelectProperty, NumberProperty, StatusProperty
+from notion_alchemy.rows import ColumnSchema, Table
+
+COLUNAS = {
+    "Pontos": [1, 5, None, 8],
+    "Status": ["Done", "Todo", "Done", "None"],
+    "Tags": [["Casa"], ["Casa", "Work"], ["None"], ["Work"]],
+    "Data": [datetime(2024, 1, 1), datetime(2024, 1, 5), "None", datetime(2024, 2, 1)],
+    "page_id": ["a", "b", "c", "d"],
+}
+SCHEMA = {"Pontos": "number", "Status": "status", "Tags": "multi_select", "Data": "date"}
+
+pontos = NumberProperty(name="Pontos")
+status = StatusProperty(name="Status")
+tags = MultiSelectProperty(name="Tags")
+data = DateProperty(name="Data")
+
+
+def test_filtros_simples():
+    query = LocalQuery(COLUNAS, SCHEMA)
+    assert query.page_ids(pontos.greater_than(1)) == ["b", "d"]
+    assert query.page_ids(status.equals("Done")) == ["a", "c"]
+    assert query.page_ids(tags.contains("Casa")) == ["a", "b"]
+    assert query.page_ids(status.is_empty()) == ["d"]
+    assert query.page_ids(data.on_or_before("2024-01-05")) == ["a", "b"]
+
+
+def test_and_or():
+    query = LocalQuery(COLUNAS, SCHEMA)
+    assert query.page_ids([status.equals("Done"), tags.contains("Casa")]) == ["a"]
+    assert query.page_ids({"or": [pontos.less_than(2), tags.contains("Work")]}) == ["a", "b", "d"]
+
+
+def test_select_devolve_colunas_filtradas():
+    query = LocalQuery(COLUNAS, SCHEMA)
+    assert query.select(tags.contains("Work"))["Pontos"] == [5, 8]
+
+
+def test_edicao_pela_row_refaz_o_indice():
+    colunas = {"Status": ["Done", "Todo"], "page_id": ["a", "b"]}
+    tabela = Table(colunas, {"Status": ColumnSchema("Status", "status")})
+    query = LocalQuery(colunas, {"Status": "status"}, tabela.versions)
+    assert query.page_ids(status.equals("Done")) == ["a"]
+
+    next(tabela.rows(1))["Status"] = "Done"
+    assert query.page_ids(status.equals("Done")) == ["a", "b"]
+    assert query.page_ids(status.equals("Todo")) == []
+
+
+def test_formula_checkbox_le_resultado_boolean():
+    colunas = {"Pronta": [{"type": "boolean", "boolean": True}, {"type": "boolean", "boolean": False}], "page_id": ["a", "b"]}
+    query = LocalQuery(colunas, {"Pronta": "formula"})
+    assert query.page_ids(FormulaProperty(name="Pronta").checkbox_equals(True)) == ["a"]
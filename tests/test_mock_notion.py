@@ -0,0 +1,39 @@
+from notion_alchemy.storage import PageStore
+
+
+def test_query_paginada_com_filtro(mock, client):
+    mock.add_database("database", rows=250)
+
+    model = client.database_model("database")()
+    client.query_database(model, model.done.equals(True), page_size=100)
+
+    assert len(model._properties_data["page_id"]) == 125
+    assert all(model._properties_data["Done"])
+    assert [call for call in mock.calls if call[0] == "POST"] == [("POST", "databases/database/query")] * 2
+
+
+def test_429_e_repetido(mock, client):
+    mock.rate_limit_every = 3
+    mock.add_database("database", rows=50)
+
+    paginas = [data for data in client.iter_query_pages("database", page_size=10)]
+
+    assert sum(len(data["results"]) for data in paginas) == 50
+    assert mock.rate_limited >= 2
+
+
+def test_update_e_sync_incremental(mock, client):
+    mock.add_database("database", rows=5)
+    store = PageStore()
+    assert client.sync_database("database", store) == 5
+
+    model = client.database_model("database")()
+    client.query_database(model, keep_pages=True)
+    linha = model._properties_pages[0]
+    linha.name = "Nova"
+    client.update_pages([linha])
+
+    assert client.get_page(linha.id)["properties"]["Name"]["title"][0]["plain_text"] == "Nova"
+    # a última página do checkpoint (on_or_after) e a que foi editada
+    assert client.sync_database("database", store) == 2
+    assert store.get_page(linha.id)["properties"]["Name"]["title"][0]["plain_text"] == "Nova"
@@ -0,0 +1,67 @@
+from datetime import date, datetime
+
+from notion_alchemy.models import NotionModel
+from notion_alchemy.notion import DateProperty, NumberProperty, TitleProperty
+
+
+class Tarefa(NotionModel):
+    _database_id = "database-id"
+    Name: TitleProperty = TitleProperty(name="Name")
+    Pontos: NumberProperty = NumberProperty(name="Pontos")
+
+
+PAGINA = {
+    "id": "page-id",
+    "properties": {
+        "Name": {"type": "title", "title": [{"plain_text": "Estudar"}]},
+        "Pontos": {"type": "number", "number": 3},
+    },
+}
+
+
+def test_from_notion_comeca_limpo():
+    tarefa = Tarefa.from_notion(PAGINA)
+    assert not tarefa.is_dirty
+    assert tarefa.to_notion_properties(only_dirty=True) == {}
+
+
+def test_update_manda_so_o_que_mudou():
+    tarefa = Tarefa.from_notion(PAGINA)
+    tarefa.Pontos = 5
+
+    assert list(tarefa.dirty_properties()) == ["Pontos"]
+    assert tarefa.to_notion_properties(only_dirty=True) == {"Pontos": {"number": 5}}
+
+    tarefa.mark_clean()
+    assert not tarefa.is_dirty
+
+
+def test_instancias_nao_compartilham_propriedades():
+    primeira = Tarefa.from_notion(PAGINA)
+    segunda = Tarefa.from_notion(PAGINA)
+    primeira.Pontos = 10
+    assert not segunda.is_dirty
+
+
+def test_valor_so_e_lido_no_primeiro_acesso():
+    tarefa = Tarefa.from_notion(PAGINA)
+    pontos = tarefa._properties["Pontos"]
+
+    assert "_value" not in pontos.__dict__
+    assert not tarefa.is_dirty
+    assert pontos.value == 3
+    assert "_value" in pontos.__dict__
+
+
+def test_datas_sao_formatadas_em_iso():
+    formatar = DateProperty._format_value
+    assert formatar(date(2024, 5, 1)) == {"date": {"start": "2024-05-01"}}
+    assert formatar(datetime(2024, 5, 1, 10, 30)) == {"date": {"start": "2024-05-01T10:30:00"}}
+    assert formatar("2024-05-01") == {"date": {"start": "2024-05-01"}}
+    assert formatar("None") == formatar(None) == {"date": None}
+
+
+def test_propriedade_esvaziada_vai_como_null():
+    tarefa = Tarefa.from_notion(PAGINA)
+    tarefa.Pontos = None
+    assert tarefa.to_notion_properties(only_dirty=True) == {"Pontos": {"number": None}}
@@ -0,0 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from notion_alchemy.decoder import ColumnDecoder
+from notion_alchemy.parallel import ParallelDecoder, _chunks
+from notion_alchemy.schema import compile_model
+from notion_alchemy.testing import DEFAULT_COLUMNS, synthetic_database, synthetic_page
+
+PAGES = [synthetic_page(i) for i in range(250)]
+RESPONSES = [{"results": PAGES[i:i + 100]} for i in range(0, 250, 100)]
+
+
+def test_chunks_atravessam_responses():
+    assert [len(chunk) for _, chunk in _chunks(RESPONSES, 60)] == [60, 60, 60, 60, 10]
+
+
+def test_chunks_de_corpos_crus_usam_o_page_size():
+    corpos = [b'{"results": []}'] * 20
+    assert [len(chunk) for _, chunk in _chunks(corpos, 50, page_size=10)] == [5, 5, 5, 5]
+    assert [len(chunk) for _, chunk in _chunks(corpos, 50)] == [1] * 20
+
+
+def test_decode_paralelo_igual_ao_serial():
+    decoder = ColumnDecoder(DEFAULT_COLUMNS, ["Name", "Score", "When"])
+    serial = decoder.new_columns()
+    decoder.decode(PAGES, serial)
+
+    paralelo = decoder.new_columns()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        assert ParallelDecoder(decoder, workers=3, chunk_size=40, executor=executor).decode(RESPONSES, paralelo) == 250
+
+    assert paralelo == serial
+
+
+def test_populate_com_processos():
+    model_class = compile_model(synthetic_database())
+    serial = model_class()
+    serial.populate(RESPONSES)
+
+    paralelo = model_class()
+    paralelo.populate(iter(RESPONSES), keep_pages=True, workers=2)
+
+    assert paralelo._properties_data == serial._properties_data
+    assert [linha.id for linha in paralelo._properties_pages] == serial._properties_data["page_id"]
+
+
+def test_populate_de_corpos_crus_e_cursor():
+    from notion_alchemy.jsonlib import dumps, next_cursor
+
+    corpos = [dumps({"object": "list", "results": data["results"], "next_cursor": "c:1", "has_more": True}).encode() for data in RESPONSES]
+    assert next_cursor(corpos[0]) == "c:1"
+    assert next_cursor(b'{"results": [], "next_cursor": null}') is None
+
+    model_class = compile_model(synthetic_database())
+    serial = model_class()
+    serial.populate(RESPONSES)
+    paralelo = model_class()
+    paralelo.populate(corpos, workers=2)
+
+    assert paralelo._properties_data == serial._properties_data
+
+
+def test_query_database_com_decode_workers(mock, client):
+    mock.add_database("database", rows=250)
+
+    serial = client.database_model("database")()
+    client.query_database(serial)
+    paralelo = client.database_model("database")()
+    client.query_database(paralelo, decode_workers=2)
+
+    assert paralelo._properties_data == serial._properties_data
@@ -0,0 +1,35 @@
+import threading
+
+from notion_alchemy.relations import RelationResolver, attach_related, collect_relation_ids
+
+COLUNAS = {
+    "Projeto": [["p-1", "p-2"], ["p1"], ["None"], ["p-3"]],
+    "page_id": ["a", "b", "c", "d"],
+}
+
+
+def test_coleta_ids_sem_repetir():
+    assert collect_relation_ids(COLUNAS, ["Projeto"]) == ["p-1", "p-2", "p-3"]
+
+
+def test_resolver_busca_cada_pagina_uma_vez():
+    chamadas = []
+    lock = threading.Lock()
+
+    def get_page(page_id):
+        with lock:
+            chamadas.append(page_id)
+        if page_id == "p-3":
+            raise RuntimeError("404")
+        return {"id": page_id}
+
+    resolver = RelationResolver(get_page, max_workers=4)
+    paginas = resolver.resolve(collect_relation_ids(COLUNAS, ["Projeto"]))
+    resolver.resolve(["p-1", "p1"])
+
+    assert sorted(chamadas) == ["p-1", "p-2", "p-3"]
+    assert list(resolver.errors) == ["p3"]
+
+    relacionadas = attach_related(COLUNAS, ["Projeto"], paginas)["Projeto"]
+    assert relacionadas == [[{"id": "p-1"}, {"id": "p-2"}], [{"id": "p-1"}], [], []]
+    assert relacionadas[0][0] is relacionadas[1][0]
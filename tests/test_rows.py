@@ -0,0 +1,74 @@
+from datetime import datetime
+
+from notion_alchemy.rows import ColumnSchema, Table
+
+
+def criar_tabela():
+    colunas = {"Status": ["Done", "Todo"], "Pontos": [1, 2], "page_id": ["a", "b"]}
+    schema = {
+        "Status": ColumnSchema("Status", "status"),
+        "Pontos": ColumnSchema("Pontos", "number"),
+    }
+    return Table(colunas, schema)
+
+
+def test_row_le_direto_das_colunas():
+    primeira, segunda = criar_tabela().rows()
+    assert primeira.id == "a"
+    assert segunda["Pontos"] == 2
+    assert segunda.status == "Todo"
+    assert not hasattr(primeira, "__dict__")
+
+
+def test_row_manda_so_o_que_mudou():
+    tabela = criar_tabela()
+    linha = next(tabela.rows(1))
+    assert linha.to_notion(only_dirty=True) == {}
+
+    linha.status = "Done"
+    assert tabela.columns["Status"] == ["Done", "Done"]
+    assert linha.to_notion(only_dirty=True) == {"Status": {"status": {"name": "Done"}}}
+
+    linha.mark_clean()
+    assert not linha.is_dirty
+
+
+def test_celulas_vazias_nao_sao_enviadas():
+    colunas = {"Etapa": ["None"], "Projeto": [["None"]], "Dono": [["none"]], "Pontos": [None], "page_id": ["a"]}
+    schema = {
+        "Etapa": ColumnSchema("Etapa", "select"),
+        "Projeto": ColumnSchema("Projeto", "relation"),
+        "Dono": ColumnSchema("Dono", "people"),
+        "Pontos": ColumnSchema("Pontos", "number"),
+    }
+    linha = next(Table(colunas, schema).rows())
+    assert linha.to_notion() == {}
+
+
+def test_celula_esvaziada_vai_como_null():
+    tabela = criar_tabela()
+    linha = next(tabela.rows())
+    linha["Status"] = None
+    assert linha.to_notion(only_dirty=True) == {"Status": {"status": None}}
+    assert linha.to_notion() == {"Pontos": {"number": 1}}
+
+
+def test_to_notion_so_manda_o_que_a_api_aceita():
+    colunas = {
+        "Dono": [["Pessoa 0"], [{"id": "user-1"}]],
+        "Anexos": [["a.pdf"], ["None"]],
+        "Quando": [datetime(2024, 1, 1), datetime(2024, 1, 1, 9, 30)],
+        "page_id": ["a", "b"],
+    }
+    schema = {
+        "Dono": ColumnSchema("Dono", "people"),
+        "Anexos": ColumnSchema("Anexos", "files"),
+        "Quando": ColumnSchema("Quando", "date"),
+    }
+    primeira, segunda = Table(colunas, schema).rows()
+
+    assert primeira.to_notion() == {"Quando": {"date": {"start": "2024-01-01"}}}
+    assert segunda.to_notion() == {
+        "Dono": {"people": [{"id": "user-1"}]},
+        "Quando": {"date": {"start": "2024-01-01T09:30:00"}},
+    }
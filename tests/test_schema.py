@@ -0,0 +1,67 @@
+from notion_alchemy.models import NotionDatabaseModel
+from notion_alchemy.schema import SchemaRegistry, schema_hash
+
+DATABASE = {
+    "id": "data-base-id",
+    "title": [{"plain_text": "Minhas tarefas"}],
+    "properties": {
+        "Name": {"id": "title", "type": "title", "title": {}},
+        "Tags": {"id": "t", "type": "multi_select", "multi_select": {}},
+    },
+}
+
+PAGINA = {
+    "id": "a",
+    "properties": {
+        "Name": {"type": "title", "title": [{"plain_text": "Casa"}]},
+        "Tags": {"type": "multi_select", "multi_select": [{"name": "x"}]},
+    },
+}
+
+
+def test_registro_compila_uma_vez_por_schema():
+    registro = SchemaRegistry()
+    modelo = registro.model_for(DATABASE)
+
+    assert issubclass(modelo, NotionDatabaseModel)
+    assert modelo.__name__ == "MinhasTarefasModel"
+    assert registro.model_for({**DATABASE, "id": "databaseid"}) is modelo
+
+    novo_schema = {**DATABASE, "properties": {**DATABASE["properties"], "Pontos": {"id": "p", "type": "number"}}}
+    assert schema_hash(novo_schema) != schema_hash(DATABASE)
+    assert registro.model_for(novo_schema) is not modelo
+    assert len(registro) == 1
+
+
+def test_instancias_tem_colunas_proprias():
+    modelo = SchemaRegistry().model_for(DATABASE)
+    primeira, segunda = modelo(), modelo()
+
+    primeira.populate({"results": [PAGINA]}, keep_pages=True)
+
+    assert primeira._properties_data["Name"] == ["Casa"]
+    assert segunda._properties_data == {"Name": [], "Tags": [], "page_id": []}
+    assert segunda._properties_pages == []
+    assert primeira.tags.contains("x") == {"property": "Tags", "multi_select": {"contains": "x"}}
+    assert primeira._properties_pages[0].tags == ["x"]
+
+
+def test_tipos_nao_suportados_ficam_de_fora():
+    database = {**DATABASE, "properties": {**DATABASE["properties"], "Link": {"id": "u", "type": "url", "url": {}}}}
+    modelo = SchemaRegistry().model_for(database)
+    pagina = {**PAGINA, "properties": {**PAGINA["properties"], "Link": {"type": "url", "url": "https://notion.so"}}}
+
+    instancia = modelo()
+    instancia.populate({"results": [pagina]})
+
+    assert "Link" not in modelo._column_schema
+    assert instancia._properties_data == {"Name": ["Casa"], "Tags": [["x"]], "page_id": ["a"]}
+
+
+def test_keep_raw_depois_de_linhas_carregadas_fica_alinhado():
+    instancia = SchemaRegistry().model_for(DATABASE)()
+    instancia.populate({"results": [PAGINA]})
+    instancia.populate({"results": [{**PAGINA, "id": "b"}]}, keep_pages=True, keep_raw=True)
+
+    assert instancia._table.raw == [None, {**PAGINA, "id": "b"}]
+    assert instancia._properties_pages[0].raw["id"] == "b"
@@ -0,0 +1,64 @@
+import time
+
+import pytest
+import requests
+
+from notion_alchemy.sharding import NoTokenAvailable, ShardedNotionClient
+
+TOKENS = ["token-aaaa", "token-bbbb", "token-cccc"]
+
+
+def test_requisicoes_divididas_entre_os_tokens(mock, make_client):
+    mock.add_database("database", rows=30)
+    client = make_client(ShardedNotionClient, TOKENS, rate_limit=20, burst=1)
+    page_id = next(iter(mock.pages))
+
+    inicio = time.monotonic()
+    for _ in range(30):
+        client.get_page(page_id)
+    duracao = time.monotonic() - inicio
+
+    assert sorted(mock.token_calls.values()) == [10, 10, 10]
+    # um token só, a 20 req/s, levaria pelo menos 29 / 20 segundos
+    assert duracao < 29 / 20 * 0.6
+    assert [uso["requests"] for uso in client.usage()] == [10, 10, 10]
+    assert all("token" not in uso for uso in client.usage())
+
+
+def test_429_segura_so_um_token(mock, make_client):
+    mock.rate_limit_every, mock.retry_after = 4, 5
+    mock.add_database("database", rows=60)
+    client = make_client(ShardedNotionClient, TOKENS, burst=1)
+
+    paginas = list(client.iter_query_pages("database", page_size=10))
+
+    assert sum(len(data["results"]) for data in paginas) == 60
+    assert mock.rate_limited >= 1
+    assert sum(uso["throttled"] for uso in client.usage()) == mock.rate_limited
+
+
+def test_token_revogado_sai_do_rodizio(mock, make_client):
+    mock.add_database("database", rows=1)
+    mock.revoked_tokens.add("token-bbbb")
+    client = make_client(ShardedNotionClient, TOKENS, burst=1)
+    page_id = next(iter(mock.pages))
+
+    for _ in range(6):
+        client.get_page(page_id)
+
+    assert mock.token_calls["token-bbbb"] == 1
+    assert [uso["revoked"] for uso in client.usage()] == [False, True, False]
+
+    # o 401 do último token já vira NoTokenAvailable, com o 401 como causa
+    mock.revoked_tokens.update(TOKENS)
+    with pytest.raises(NoTokenAvailable) as erro:
+        client.get_page(page_id)
+    assert isinstance(erro.value.__cause__, requests.HTTPError)
+    with pytest.raises(NoTokenAvailable):
+        client.get_page(page_id)
+
+
+def test_cliente_nao_expoe_nenhum_token(make_client):
+    client = make_client(ShardedNotionClient, TOKENS, burst=1)
+    assert client.api_key is None and client.rate_limiter is None
+    assert "Authorization" not in client.session.headers
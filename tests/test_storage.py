@@ -0,0 +1,22 @@
+from notion_alchemy.storage import PageStore
+
+
+def pagina(page_id, editada):
+    return {"id": page_id, "last_edited_time": editada, "parent": {"database_id": "db"}, "properties": {}}
+
+
+def test_upsert_e_leitura():
+    with PageStore() as store:
+        store.upsert_pages([pagina("a", "2024-01-01T00:00:00.000Z"), pagina("b", "2024-01-02T00:00:00.000Z")])
+        store.upsert_pages([pagina("a", "2024-01-03T00:00:00.000Z")])
+
+        assert store.count("db") == 2
+        assert store.get_page("a")["last_edited_time"] == "2024-01-03T00:00:00.000Z"
+        assert [page["id"] for lote in store.iter_pages("db", batch_size=1) for page in lote["results"]] == ["b", "a"]
+
+
+def test_checkpoint():
+    with PageStore() as store:
+        assert store.get_checkpoint("db") is None
+        store.set_checkpoint("db", "2024-01-03T00:00:00.000Z")
+        assert store.get_checkpoint("db") == "2024-01-03T00:00:00.000Z"
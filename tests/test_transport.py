@@ -0,0 +1,35 @@
+import time
+
+from notion_alchemy.transport import RetryPolicy, TokenBucket, parse_retry_after
+
+
+def test_token_bucket_respeita_rate():
+    bucket = TokenBucket(rate=20, capacity=1)
+    inicio = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    assert time.monotonic() - inicio >= 4 / 20 * 0.9
+
+
+def test_penalize_segura_o_balde():
+    bucket = TokenBucket(rate=10)
+    bucket.penalize(0.5)
+    assert bucket.reserve() >= 0.5
+
+
+def test_peek_nao_consome_token():
+    bucket = TokenBucket(rate=10, capacity=1)
+    assert bucket.peek() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.peek() > 0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("lixo") is None
+
+
+def test_backoff_limitado():
+    policy = RetryPolicy(backoff_base=1, backoff_max=3)
+    assert all(0 <= policy.backoff(tentativa) <= 3 for tentativa in range(10))
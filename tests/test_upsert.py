@@ -0,0 +1,76 @@
+from datetime import date
+
+import pytest
+
+COLUNAS = {"Name": "title", "Score": "number", "Tags": "multi_select", "Done": "checkbox"}
+
+
+def test_plano_so_com_o_que_mudou(mock, client):
+    mock.add_database("database", rows=5, columns=COLUNAS)
+    registros = [
+        {"Name": "Linha 0", "Score": 0, "Tags": ["comum", "tag0"], "Done": True},
+        {"Name": "Linha 1", "Score": 99},
+        {"Name": "Linha 2", "Score": None},
+        {"Name": "Nova", "Score": 1, "Done": False},
+    ]
+
+    plan = client.sync_records("database", registros, key="Name", archive_missing=True, dry_run=True).plan
+
+    assert plan.inserts == [{"Name": {"title": [{"text": {"content": "Nova"}}]}, "Score": {"number": 1.0}, "Done": {"checkbox": False}}]
+    assert [properties for _, properties in plan.updates] == [{"Score": {"number": 99.0}}]
+    assert plan.unchanged == 2
+    assert len(plan.archives) == 2
+    assert not [call for call in mock.calls if call[0] != "GET" and "query" not in call[1]]
+
+
+def test_sync_de_dataframe(mock, client):
+    pd = pytest.importorskip("pandas")
+    mock.add_database("database", rows=20, columns=COLUNAS)
+    model = client.database_model("database")()
+    client.query_database(model)
+
+    frame = model.to_pandas()[["Name", "Score"]].reset_index(drop=True)
+    frame.loc[3, "Score"] = 1000.0
+    frame = pd.concat([frame, pd.DataFrame([{"Name": "Nova", "Score": 2.0}])], ignore_index=True)
+    antes = len(mock.calls)
+
+    result = client.sync_records(model, frame, key="Name")
+
+    assert result.ok
+    assert (len(result.created.succeeded), len(result.updated.succeeded), result.plan.unchanged) == (1, 1, 19)
+    assert len(mock.calls) - antes == 2
+
+    novo = client.database_model("database")()
+    client.query_database(novo)
+    assert len(novo._properties_data["page_id"]) == 21
+    assert 1000.0 in novo._properties_data["Score"]
+
+
+def test_chave_repetida_nos_registros(mock, client):
+    mock.add_database("database", rows=1, columns=COLUNAS)
+    with pytest.raises(ValueError):
+        client.sync_records("database", [{"Name": "a"}, {"Name": "a"}], key="Name", dry_run=True)
+
+
+def test_datas_iguais_nao_viram_update(mock, client):
+    mock.add_database("database", rows=2, columns={"Name": "title", "When": "date"})
+    for i, page in enumerate(mock.pages.values()):
+        page["properties"]["When"]["date"] = {"start": f"2024-05-0{i + 1}"}
+
+    registros = [{"Name": "Linha 0", "When": date(2024, 5, 1)}, {"Name": "Linha 1", "When": "2024-06-01"}]
+    plan = client.sync_records("database", registros, key="Name", dry_run=True).plan
+
+    assert plan.unchanged == 1
+    assert [properties for _, properties in plan.updates] == [{"When": {"date": {"start": "2024-06-01"}}}]
+
+
+def test_people_so_com_nomes_nao_sao_enviados(mock, client):
+    mock.add_database("database", rows=1, columns={"Name": "title", "Owner": "people"})
+    registros = [{"Name": "Nova", "Owner": ["Pessoa 0"]}, {"Name": "Outra", "Owner": [{"id": "user-1"}]}]
+
+    plan = client.sync_records("database", registros, key="Name", dry_run=True).plan
+
+    assert plan.inserts == [
+        {"Name": {"title": [{"text": {"content": "Nova"}}]}},
+        {"Name": {"title": [{"text": {"content": "Outra"}}]}, "Owner": {"people": [{"id": "user-1"}]}},
+    ]
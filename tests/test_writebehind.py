@@ -0,0 +1,108 @@
+import threading
+import time
+
+from notion_alchemy.notion import normalize_id
+from notion_alchemy.writebehind import WriteBuffer
+
+
+def test_edicoes_da_mesma_pagina_viram_um_patch(mock, client):
+    mock.add_database("database", rows=3)
+    model = client.database_model("database")()
+    client.query_database(model, keep_pages=True)
+
+    with client.write_session() as session:
+        for linha in model._properties_pages:
+            linha.score = 1.0
+            session.update(linha)
+            linha.done = True
+            session.update(linha)
+        session.archive(model._properties_pages[0].id)
+        assert len(session) == 3 and session.edits == 7
+
+    patches = [call for call in mock.calls if call[0] == "PATCH"]
+    assert len(patches) == 3
+    assert session.result.ok and len(session.result.succeeded) == 3
+    pagina = client.get_page(model._properties_pages[1].id)
+    assert pagina["properties"]["Score"]["number"] == 1.0
+    assert pagina["properties"]["Done"]["checkbox"] is True
+    assert client.get_page(model._properties_pages[0].id)["archived"] is True
+
+
+def test_flush_por_tamanho_e_rollback_com_erro(mock, client):
+    mock.add_database("database", rows=3)
+    model = client.database_model("database")()
+    client.query_database(model, keep_pages=True)
+    ids = [linha.id for linha in model._properties_pages]
+
+    session = WriteBuffer(client, max_pages=2)
+    for page_id in ids:
+        session.update(page_id, {"Done": {"checkbox": True}})
+    assert len(session) == 1
+    assert len([call for call in mock.calls if call[0] == "PATCH"]) == 2
+
+    try:
+        with session:
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert len(session) == 0
+    assert len([call for call in mock.calls if call[0] == "PATCH"]) == 2
+
+
+def test_get_page_concorrente_faz_uma_requisicao(mock, client):
+    mock.latency = 0.05
+    mock.add_database("database", rows=1)
+    page_id = next(iter(mock.pages))
+    session = client.write_session()
+    paginas = []
+
+    threads = [threading.Thread(target=lambda: paginas.append(session.get_page(page_id))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.001)
+    for thread in threads:
+        thread.join()
+
+    assert len(paginas) == 5
+    assert len([call for call in mock.calls if call == ("GET", f"pages/{page_id}")]) == 1
+
+
+def test_so_marca_limpo_depois_do_patch(mock, client):
+    mock.add_database("database", rows=2)
+    model = client.database_model("database")()
+    client.query_database(model, keep_pages=True)
+    primeira, segunda = model._properties_pages
+
+    session = client.write_session()
+    primeira.done = True
+    session.update(primeira)
+    session.discard()
+    assert primeira.is_dirty
+
+    segunda.done = True
+    session.update(primeira)
+    session.update(segunda)
+    mock.pages.pop(normalize_id(segunda.id))
+    result = session.flush()
+
+    assert len(result.succeeded) == 1 and len(result.failed) == 1
+    assert not primeira.is_dirty
+    assert segunda.is_dirty
+
+
+def test_edicao_depois_do_update_continua_dirty(mock, client):
+    mock.add_database("database", rows=1)
+    model = client.database_model("database")()
+    client.query_database(model, keep_pages=True)
+    linha = model._properties_pages[0]
+
+    session = client.write_session()
+    linha.done = False
+    session.update(linha)
+    linha.score = 42.0
+    session.flush()
+
+    assert linha.is_dirty
+    assert linha.to_notion(only_dirty=True) == {"Score": {"number": 42.0}}
+    client.update_pages([linha])
+    assert client.get_page(linha.id)["properties"]["Score"]["number"] == 42.0